@@ -1,5 +1,6 @@
 from pathlib import Path
 import importlib
+import json
 import sys
 
 ROOT = Path(__file__).resolve().parents[4]
@@ -7,6 +8,7 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from src.core.config import get_env
+from src.core.token_cache import token_file
 
 
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
@@ -21,7 +23,7 @@ def main() -> None:
 
     flow = installed_app_flow.from_client_secrets_file(creds_path, SCOPES)
     creds = flow.run_local_server(port=0)
-    Path(token_path).write_text(creds.to_json())
+    token_file(token_path).save(json.loads(creds.to_json()))
     print(f"Saved Calendar token to {token_path}")
 
 
@@ -5,28 +5,36 @@ from pathlib import Path
 from zoneinfo import ZoneInfo
 import sys
 
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-
 ROOT = Path(__file__).resolve().parents[4]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from src.core.base_watcher import BaseWatcher
 from src.core.config import get_env
+from src.core.lazy import lazy_import
+from src.core.token_cache import google_credentials
+
+discovery = lazy_import("googleapiclient.discovery")
 
 
 class CalendarWatcher(BaseWatcher):
     def __init__(self):
-        super().__init__(watcher_name="calendar-watcher", check_interval=300)
-        token_path = get_env("GOOGLE_CALENDAR_TOKEN_PATH")
+        # Events are only looked at 24h ahead, so IDs can expire after 30 days.
+        super().__init__(
+            watcher_name="calendar-watcher",
+            check_interval=300,
+            processed_ttl_seconds=30 * 24 * 3600,
+        )
+        self.token_path = get_env("GOOGLE_CALENDAR_TOKEN_PATH")
         self.calendar_id = get_env("CALENDAR_ID", required=False, default="primary")
-        self.creds = Credentials.from_authorized_user_file(token_path)
-        self.service = build("calendar", "v3", credentials=self.creds)
+        self.creds = google_credentials(self.token_path)
+        if self.creds is None:
+            raise RuntimeError(f"Calendar token not found at {self.token_path}; run calendar_oauth_setup.py")
+        self.service = discovery.build("calendar", "v3", credentials=self.creds)
 
     def check_for_updates(self) -> list:
-        state = self.load_state()
-        processed_ids = set(state.get("processed_ids", []))
+        # Same credentials object as self.creds, refreshed via the shared token file.
+        google_credentials(self.token_path)
         now = datetime.now(ZoneInfo("Asia/Karachi"))
         end = now + timedelta(hours=24)
         events_result = (
@@ -41,7 +49,7 @@ class CalendarWatcher(BaseWatcher):
             .execute()
         )
         events = events_result.get("items", [])
-        return [e for e in events if e.get("id") not in processed_ids]
+        return [e for e in events if e.get("id") not in self.processed]
 
     def create_action_file(self, event) -> Path:
         start = event.get("start", {}).get("dateTime", event.get("start", {}).get("date", ""))
@@ -61,11 +69,8 @@ status: pending
         filepath = self.needs_action / f"CALENDAR_{event.get('id', 'unknown')}.md"
         filepath.write_text(content)
 
-        state = self.load_state()
-        processed_ids = set(state.get("processed_ids", []))
         if event.get("id"):
-            processed_ids.add(event["id"])
-        self.save_state({"processed_ids": sorted(processed_ids)})
+            self.processed.add(event["id"])
         return filepath
 
 
@@ -12,9 +12,11 @@ ROOT = Path(__file__).resolve().parents[4]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.core.audit_logic import SUBSCRIPTION_PATTERNS
+from src.core.audit_logic import get_matcher
 from src.core.audit_logger import log_action
+from src.core.audit_rollup import last_days_since, rollup_totals
 from src.core.config import get_vault_path
+from src.core.recurring_charges import briefing_lines, detect, load_vault
 
 PID_FILE = Path("/tmp/ceo-briefing.pid")
 STATE_FILE = ".ceo-briefing-state.json"
@@ -53,14 +55,33 @@ def _find_subscription_signals(vault: Path) -> list[str]:
     accounting = vault / "Accounting"
     if not accounting.exists():
         return signals
+    matcher = get_matcher()
     for csv_file in accounting.rglob("*.csv"):
-        text = csv_file.read_text(encoding="utf-8", errors="ignore").lower()
-        for pattern, name in SUBSCRIPTION_PATTERNS.items():
-            if pattern in text:
-                signals.append(name)
+        signals.extend(matcher.names_in(csv_file.read_text(encoding="utf-8", errors="ignore")))
     return sorted(set(signals))
 
 
+def _audit_activity_lines(vault: Path) -> list[str]:
+    """Summarise the last 7 days of audit activity from the per-day rollups."""
+    logs_dir = vault / "Logs"
+    if not logs_dir.exists():
+        return []
+    totals = rollup_totals(logs_dir, since=last_days_since(7))
+    if not totals["entries"]:
+        return []
+    counts = totals["counts"]
+    errors = sum(n for result, n in counts["result"].items() if result.startswith("error"))
+    top_actions = sorted(counts["action_type"].items(), key=lambda kv: kv[1], reverse=True)[:3]
+    lines = [
+        f"- Actions logged: {totals['entries']}",
+        f"- Approved: {counts['approval_status'].get('approved', 0)} · "
+        f"Rejected: {counts['approval_status'].get('rejected', 0)} · Errors: {errors}",
+    ]
+    if top_actions:
+        lines.append("- Top actions: " + ", ".join(f"{name} ({n})" for name, n in top_actions))
+    return lines
+
+
 def generate_weekly_briefing(vault: Path) -> Path:
     briefings = vault / "Briefings"
     briefings.mkdir(parents=True, exist_ok=True)
@@ -68,9 +89,16 @@ def generate_weekly_briefing(vault: Path) -> Path:
     now = datetime.now(ZoneInfo("Asia/Karachi"))
     done_items = _done_items_last_week(vault)
     subscriptions = _find_subscription_signals(vault)
+    recurring = detect(load_vault(vault))
+    activity = _audit_activity_lines(vault)
 
     completed_lines = "\n".join([f"- [x] {f.name}" for f in done_items[:12]]) or "- [ ] No completed tasks detected"
-    subscription_lines = "\n".join([f"- {s}: detected in accounting inputs" for s in subscriptions]) or "- No subscription signal detected this week"
+    activity_lines = "\n".join(activity) or "- No audit activity recorded this week"
+    charged = {c["merchant"] for c in recurring if c["active"]}
+    cost_lines = briefing_lines(recurring) + [
+        f"- {s}: detected in accounting inputs" for s in subscriptions if s not in charged
+    ]
+    subscription_lines = "\n".join(cost_lines) or "- No subscription signal detected this week"
 
     out = briefings / f"{now.strftime('%Y-%m-%d')}_Monday_Briefing.md"
     out.write_text(
@@ -83,6 +111,7 @@ period: last 7 days
 
 ## Executive Summary
 Operational flow is active. Weekly snapshot generated automatically.
+{activity_lines}
 
 ## Revenue
 - This Week: Review required from accounting system
@@ -112,7 +141,11 @@ Operational flow is active. Weekly snapshot generated automatically.
     log_action(
         action_type="ceo_briefing_generated",
         target=out.name,
-        parameters={"done_count": len(done_items), "subscription_signals": subscriptions},
+        parameters={
+            "done_count": len(done_items),
+            "subscription_signals": subscriptions,
+            "recurring_charges": len(recurring),
+        },
         result="success",
     )
     return out
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import os
 import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -12,44 +11,32 @@ from pathlib import Path
 import sys
 from zoneinfo import ZoneInfo
 
-from mcp.server.fastmcp import FastMCP
-
 ROOT = Path(__file__).resolve().parents[4]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.core.config import get_env, DRY_RUN, require_local_execution, ZoneViolationError
-from src.core.audit_logger import log_action
+from src.core.config import get_env, require_local_execution, settings, ZoneViolationError
+from src.core.settings import SmtpSettings
+from src.core.audit_logger import enable_background_writer, log_action
+from src.core import frontmatter
 
 logger = logging.getLogger("gmail-send-mcp")
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
 
-mcp = FastMCP("gmail-send")
-
 
-def _get_smtp_config() -> dict:
-    return {
-        'smtp_server': os.getenv("SMTP_SERVER", "smtp.gmail.com"),
-        'smtp_port': int(os.getenv("SMTP_PORT", "587")),
-        'sender_email': (
-            os.getenv("SENDER_EMAIL", "")
-            or os.getenv("GMAIL_SENDER", "")
-            or os.getenv("GMAIL_DELEGATE_EMAIL", "")
-        ),
-        'sender_password': os.getenv("SENDER_PASSWORD", ""),
-    }
+def _get_smtp_config() -> SmtpSettings:
+    return settings().smtp
 
 
-def _smtp_send(cfg: dict, msg: MIMEMultipart) -> None:
-    password = (cfg['sender_password'] or "").replace(" ", "").replace("-", "")
-    server = smtplib.SMTP(cfg['smtp_server'], cfg['smtp_port'])
+def _smtp_send(cfg: SmtpSettings, msg: MIMEMultipart) -> None:
+    password = (cfg.sender_password or "").replace(" ", "").replace("-", "")
+    server = smtplib.SMTP(cfg.server, cfg.port)
     server.starttls()
-    server.login(cfg['sender_email'], password)
+    server.login(cfg.sender_email, password)
     server.send_message(msg)
     server.quit()
 
 
-@mcp.tool()
 def send_email(to: str, subject: str, body: str) -> str:
     """Send an email via SMTP.
 
@@ -72,7 +59,7 @@ def send_email(to: str, subject: str, body: str) -> str:
         )
         return f"Blocked by zone policy: {exc}"
 
-    if DRY_RUN:
+    if settings().dry_run:
         msg = f"[DRY RUN] Would send email to {to}, subject: {subject}"
         logger.info(msg)
         log_action(
@@ -84,12 +71,12 @@ def send_email(to: str, subject: str, body: str) -> str:
         return msg
 
     cfg = _get_smtp_config()
-    if not cfg['sender_email'] or not cfg['sender_password']:
+    if not cfg.sender_email or not cfg.sender_password:
         return "Error: SMTP credentials not configured (SENDER_EMAIL / SENDER_PASSWORD)"
 
     try:
         mime_msg = MIMEMultipart()
-        mime_msg['From'] = cfg['sender_email']
+        mime_msg['From'] = cfg.sender_email
         mime_msg['To'] = to
         mime_msg['Subject'] = subject
         mime_msg['Date'] = formatdate(localtime=True)
@@ -115,7 +102,6 @@ def send_email(to: str, subject: str, body: str) -> str:
         return f"Failed to send email: {exc}"
 
 
-@mcp.tool()
 def draft_email(to: str, subject: str, body: str) -> str:
     """Save a draft email to Vault/Inbox as a markdown file (no SMTP needed).
 
@@ -127,7 +113,7 @@ def draft_email(to: str, subject: str, body: str) -> str:
     Returns:
         Confirmation message with draft file path
     """
-    if DRY_RUN:
+    if settings().dry_run:
         msg = f"[DRY RUN] Would create draft to {to}, subject: {subject}"
         logger.info(msg)
         log_action(
@@ -183,7 +169,6 @@ status: draft
         return f"Failed to create draft: {exc}"
 
 
-@mcp.tool()
 def list_drafts(max_results: int = 5) -> str:
     """List recent email drafts saved in Vault/Inbox/Drafts.
 
@@ -193,7 +178,7 @@ def list_drafts(max_results: int = 5) -> str:
     Returns:
         List of recent draft files with subject and recipient
     """
-    if DRY_RUN:
+    if settings().dry_run:
         return "[DRY RUN] Would list drafts"
 
     try:
@@ -208,14 +193,7 @@ def list_drafts(max_results: int = 5) -> str:
         draft_files = sorted(drafts_path.glob("DRAFT_*.md"), reverse=True)[:max_results]
         summaries = []
         for f in draft_files:
-            lines = f.read_text().splitlines()
-            meta = {}
-            for line in lines[1:]:
-                if line.strip() == '---':
-                    break
-                if ':' in line:
-                    k, _, v = line.partition(':')
-                    meta[k.strip()] = v.strip()
+            meta = frontmatter.read(f) or {}
             summaries.append({
                 "file": f.name,
                 "to": meta.get("to", ""),
@@ -228,7 +206,15 @@ def list_drafts(max_results: int = 5) -> str:
 
 def main():
     """Run the MCP server over STDIO."""
-    logger.info("Starting Gmail Send MCP Server (DRY_RUN=%s)", DRY_RUN)
+    logger.info("Starting Gmail Send MCP Server (DRY_RUN=%s)", settings().dry_run)
+    enable_background_writer()
+    # FastMCP is only needed to serve; the orchestrator imports this module
+    # for send_email() and should not pay for the mcp SDK.
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("gmail-send")
+    for tool in (send_email, draft_email, list_drafts):
+        mcp.tool()(tool)
     mcp.run(transport="stdio")
 
 
@@ -20,6 +20,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from src.core.config import get_env
+from src.core.token_cache import token_file
 
 SCOPES = [
     "https://www.googleapis.com/auth/gmail.readonly",
@@ -71,9 +72,8 @@ def main() -> None:
     # Fixed port so redirect_uri is predictable — register http://localhost:8080 in Google Cloud Console
     creds = flow.run_local_server(port=8080)
 
-    token_file = Path(token_path)
-    token_file.write_text(creds.to_json())
-    print(f"\n✅ Token saved to: {token_file.resolve()}")
+    token_file(token_path).save(json.loads(creds.to_json()))
+    print(f"\n✅ Token saved to: {Path(token_path).resolve()}")
     print(f"\nOptionally paste this into .env as GMAIL_TOKEN_JSON (single line):")
     print(creds.to_json())
 
@@ -89,7 +89,11 @@ def _extract_email_content(message) -> str:
 
 class GmailWatcher(BaseWatcher):
     def __init__(self):
-        super().__init__(watcher_name="gmail-watcher", check_interval=120)
+        super().__init__(
+            watcher_name="gmail-watcher",
+            check_interval=120,
+            processed_max_items=200_000,
+        )
         self.cfg = _get_imap_config()
         self._password = (self.cfg['sender_password'] or "").replace(" ", "").replace("-", "")
         # Vault/Inbox — where MD files land
@@ -107,9 +111,6 @@ class GmailWatcher(BaseWatcher):
             logger.warning("IMAP credentials not configured — skipping check")
             return []
 
-        state = self.load_state()
-        processed_ids: set = set(state.get("processed_ids", []))
-
         mail = None
         try:
             mail = self._connect()
@@ -127,7 +128,7 @@ class GmailWatcher(BaseWatcher):
                 raw_email = message_data[0][1]
                 msg = email.message_from_bytes(raw_email)
                 msg_id = msg.get('Message-ID', imap_id.decode())
-                if msg_id not in processed_ids:
+                if msg_id not in self.processed:
                     new_items.append({'imap_id': imap_id, 'msg': msg, 'msg_id': msg_id})
             return new_items
         except imaplib.IMAP4.error as exc:
@@ -192,11 +193,8 @@ status: unread
         except Exception as exc:
             logger.warning("Could not mark email as read: %s", exc)
 
-        # Track processed ID in state
-        state = self.load_state()
-        processed_ids = set(state.get("processed_ids", []))
-        processed_ids.add(msg_id)
-        self.save_state({"processed_ids": sorted(processed_ids)})
+        # Track processed ID (appends one record, no full rewrite)
+        self.processed.add(msg_id)
 
         return filepath
 
@@ -1,11 +1,11 @@
-import subprocess
+import os
 
 pid_file = "/tmp/gmail-watcher.pid"
 
 try:
     with open(pid_file, "r", encoding="utf-8") as f:
-        pid = f.read().strip()
-    subprocess.check_call(["kill", "-0", pid])
+        pid = int(f.read().strip())
+    os.kill(pid, 0)
     print("✓ gmail-watcher running")
 except Exception:
     print("✗ gmail-watcher not running")
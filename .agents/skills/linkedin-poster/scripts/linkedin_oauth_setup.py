@@ -5,6 +5,7 @@ from __future__ import annotations
 import http.server
 import json
 import threading
+import time
 import urllib.parse
 import webbrowser
 from pathlib import Path
@@ -15,6 +16,7 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from src.core.config import get_env
+from src.core.token_cache import token_file
 
 REDIRECT_PORT = 8585
 REDIRECT_URI = f"http://localhost:{REDIRECT_PORT}/callback"
@@ -133,8 +135,10 @@ def main() -> None:
     print("Fetching your LinkedIn profile URN...")
     person_urn = _get_profile_urn(access_token)
     token_data["person_urn"] = person_urn
+    if "expires_in" in token_data:
+        token_data["expires_at"] = int(time.time()) + int(token_data["expires_in"])
 
-    Path(token_path).write_text(json.dumps(token_data, indent=2))
+    token_file(token_path).save(token_data)
     print(f"\nSaved LinkedIn token to {token_path}")
     print(f"Person URN: {person_urn}")
     print(f"Token expires in: {token_data.get('expires_in', 'unknown')} seconds")
@@ -15,8 +15,11 @@ ROOT = Path(__file__).resolve().parents[4]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.core.config import get_env, get_vault_path, DRY_RUN, require_local_execution
-from src.core.audit_logger import log_action
+from src.core.config import get_env, get_vault_path, require_local_execution, settings
+from src.core.audit_logger import enable_background_writer, log_action
+from src.core.http_pool import shared_session
+from src.core.retry_handler import TransientError, parse_retry_after, time_left, with_retry
+from src.core.token_cache import expires_within, token_file
 
 logger = logging.getLogger("linkedin-poster")
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
@@ -29,8 +32,41 @@ CHECK_INTERVAL = 60  # seconds between checks
 # ─── Token / API helpers ────────────────────────────────────────────────
 
 def _load_token() -> dict:
-    token_path = get_env("LINKEDIN_TOKEN_PATH")
-    return json.loads(Path(token_path).read_text())
+    """Token from LINKEDIN_TOKEN_PATH, refreshed (once across processes) near expiry."""
+    tokens = token_file(get_env("LINKEDIN_TOKEN_PATH"))
+    token_data = tokens.read()
+    if token_data is None:
+        raise FileNotFoundError(f"LinkedIn token not found at {tokens.path}; run linkedin_oauth_setup.py")
+    if token_data.get("refresh_token") and expires_within(token_data.get("expires_at")):
+        try:
+            token_data = tokens.refresh(
+                lambda current: current is None or expires_within(current.get("expires_at")),
+                _refresh_token,
+            )
+        except Exception as exc:
+            # The current access token may still have a few minutes left.
+            logger.warning("LinkedIn token refresh failed: %s", exc)
+    return token_data
+
+
+def _refresh_token(current: dict) -> dict:
+    """Exchange the refresh token (LinkedIn only issues these to some apps)."""
+    resp = shared_session().post(
+        "https://www.linkedin.com/oauth/v2/accessToken",
+        data={
+            "grant_type": "refresh_token",
+            "refresh_token": current["refresh_token"],
+            "client_id": get_env("LINKEDIN_CLIENT_ID"),
+            "client_secret": get_env("LINKEDIN_CLIENT_SECRET"),
+        },
+        timeout=30,
+    )
+    resp.raise_for_status()
+    fresh = resp.json()
+    token_data = {**current, **fresh}
+    token_data["expires_at"] = int(time.time()) + int(fresh.get("expires_in", 0))
+    logger.info("Refreshed LinkedIn access token")
+    return token_data
 
 
 def _get_person_urn() -> str:
@@ -42,8 +78,27 @@ def _get_person_urn() -> str:
     return token_data.get("person_urn", "")
 
 
+def _never_sent(exc: Exception) -> bool:
+    """True if ``exc`` happened before any of the request reached LinkedIn."""
+    import requests
+    from urllib3.exceptions import NewConnectionError
+
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    # Refused connections and DNS failures: MaxRetryError(reason=NewConnectionError)
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+@with_retry(max_attempts=3, base_delay=2, max_delay=30, breaker="linkedin", deadline=120)
 def _post_to_linkedin(text: str) -> dict:
-    """Publish a text post to LinkedIn via the Posts API."""
+    """Publish a text post to LinkedIn via the Posts API.
+
+    Only 429/503 and failures to connect at all are retried: in those cases
+    LinkedIn has not accepted the post, so a retry cannot publish it twice.
+    A connection dropped or reset after the request was sent may already have
+    published it, so that error is raised without a retry.
+    """
     import requests
 
     require_local_execution("linkedin_post")
@@ -75,12 +130,22 @@ def _post_to_linkedin(text: str) -> dict:
         "isReshareDisabledByAuthor": False,
     }
 
-    resp = requests.post(
-        "https://api.linkedin.com/rest/posts",
-        headers=headers,
-        json=payload,
-        timeout=30,
-    )
+    try:
+        resp = shared_session().post(
+            "https://api.linkedin.com/rest/posts",
+            headers=headers,
+            json=payload,
+            timeout=time_left(30),
+        )
+    except requests.ConnectionError as exc:
+        if _never_sent(exc):
+            raise TransientError(str(exc)) from exc
+        raise
+    if resp.status_code in (429, 503):
+        raise TransientError(
+            f"LinkedIn returned {resp.status_code}",
+            retry_after=parse_retry_after(resp.headers.get("Retry-After")),
+        )
     resp.raise_for_status()
 
     # LinkedIn returns 201 with x-restli-id header
@@ -194,7 +259,7 @@ def process_approved_posts(vault: Path) -> None:
 
         post_text = _extract_post_text(content)
 
-        if DRY_RUN:
+        if settings().dry_run:
             logger.info("[DRY RUN] Would post to LinkedIn: %s...", post_text[:80])
             log_action(
                 action_type="linkedin_post",
@@ -252,7 +317,8 @@ def _save_state(vault: Path, state: dict) -> None:
 def main() -> None:
     vault = get_vault_path()
     PID_FILE.write_text(str(os.getpid()))
-    logger.info("LinkedIn Poster started (DRY_RUN=%s)", DRY_RUN)
+    logger.info("LinkedIn Poster started (DRY_RUN=%s)", settings().dry_run)
+    enable_background_writer()
 
     while True:
         try:
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 from itertools import count
 from dataclasses import dataclass
 from pathlib import Path
@@ -12,7 +11,9 @@ ROOT = Path(__file__).resolve().parents[4]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.core.retry_handler import TransientError, with_retry
+from src.core.config import settings
+from src.core.http_pool import shared_session
+from src.core.retry_handler import TransientError, get_breaker, parse_retry_after, time_left, with_retry
 
 
 @dataclass
@@ -27,11 +28,16 @@ class OdooClient:
     def __init__(self, config: OdooConfig):
         self.config = config
         self._request_counter = count(1)
-        self._session = requests.Session()
+        self._session = shared_session()
         self._jsonrpc_url = f"{config.url.rstrip('/')}/jsonrpc"
+        # Shared per URL: once Odoo is down, every client fails fast until it recovers.
+        self._breaker = get_breaker(f"odoo:{config.url}", failure_threshold=3, reset_timeout=30)
         self.uid = self._login()
 
     def _jsonrpc(self, service: str, method: str, *args):
+        return self._breaker.call(self._jsonrpc_call, service, method, *args)
+
+    def _jsonrpc_call(self, service: str, method: str, *args):
         payload = {
             "jsonrpc": "2.0",
             "method": "call",
@@ -43,7 +49,12 @@ class OdooClient:
             "id": next(self._request_counter),
         }
         try:
-            response = self._session.post(self._jsonrpc_url, json=payload, timeout=20)
+            response = self._session.post(self._jsonrpc_url, json=payload, timeout=time_left(20))
+            if response.status_code in (429, 503):
+                raise TransientError(
+                    f"Odoo returned {response.status_code}",
+                    retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                )
             response.raise_for_status()
             body = response.json()
         except (requests.RequestException, ValueError) as exc:
@@ -69,7 +80,7 @@ class OdooClient:
             raise RuntimeError("Failed to authenticate to Odoo; check ODOO_* credentials")
         return int(uid)
 
-    @with_retry(max_attempts=3, base_delay=1, max_delay=8)
+    @with_retry(max_attempts=3, base_delay=1, max_delay=8, deadline=60)
     def _execute(self, model: str, method: str, args: list, kwargs: dict | None = None):
         return self._jsonrpc(
             "object",
@@ -281,10 +292,6 @@ class OdooClient:
 
 
 def from_env() -> OdooClient:
-    cfg = OdooConfig(
-        url=os.getenv("ODOO_URL", "http://localhost:8069"),
-        db=os.getenv("ODOO_DB", "odoo_db"),
-        user=os.getenv("ODOO_USER", "admin"),
-        password=os.getenv("ODOO_PASSWORD", "admin"),
-    )
+    odoo = settings().odoo
+    cfg = OdooConfig(url=odoo.url, db=odoo.db, user=odoo.user, password=odoo.password)
     return OdooClient(cfg)
@@ -1,9 +1,9 @@
 import json
-import os
 import sys
 import traceback
 
 from odoo_client import from_env
+from src.core.config import settings
 
 
 def main() -> None:
@@ -15,13 +15,12 @@ def main() -> None:
             client = from_env()
         return client
 
-    dry_run = os.getenv("DRY_RUN", "true").strip().lower() in {"1", "true", "yes", "on"}
-
     for raw in sys.stdin:
         request = {}
         try:
             request = json.loads(raw)
             method = request.get("method")
+            dry_run = settings().dry_run
             params = request.get("params") or {}
 
             if method == "odoo_list_partners":
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from zoneinfo import ZoneInfo
-import importlib.util
 import json
 import logging
 import os
@@ -10,35 +10,36 @@ from pathlib import Path
 import re
 import shutil
 import sys
+import threading
 import time
 
-import schedule as schedule_lib
-
 ROOT = Path(__file__).resolve().parents[4]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.core.audit_logger import log_action
-from src.core.config import get_vault_path
+from src.core.audit_logger import compact_closed_days, enable_background_writer, log_action
+from src.core.backend_limits import backend_slot
+from src.core import frontmatter
+from src.core.config import get_vault_path, settings
+from src.core.dashboard_model import DashboardModel
+from src.core.lazy import lazy_import
+from src.core.skill_modules import load_skill_module
+from src.core.vault_events import VaultEvents
+from src.core.work_queue import DEAD, WorkItem, work_queue
 
 logger = logging.getLogger("orchestrator")
+schedule_lib = lazy_import("schedule")
 
 
 # ─── Email / Invoice parsing helpers ─────────────────────────────────────
 
 def parse_email_frontmatter(content: str) -> dict:
     """Extract YAML-like frontmatter from an EMAIL markdown file."""
-    if not content.startswith("---"):
-        return {}
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    parsed = frontmatter.parse(content)
+    if parsed is None:
         return {}
-    meta: dict[str, str] = {}
-    for line in parts[1].strip().split("\n"):
-        if ":" in line:
-            key, val = line.split(":", 1)
-            meta[key.strip()] = val.strip().strip('"').strip("'")
-    meta["body"] = parts[2].strip()
+    meta, body = parsed
+    meta["body"] = body
     return meta
 
 
@@ -160,30 +161,64 @@ def extract_meeting_hints(text: str, meta: dict | None = None) -> dict:
 
 # ─── Odoo client helper ──────────────────────────────────────────────────
 
+_odoo_client = None
+_odoo_settings = None
+_odoo_lock = threading.Lock()
+
+
 def _get_odoo_client():
-    """Try to instantiate OdooClient; return None on failure."""
-    try:
-        module_file = ROOT / ".agents/skills/odoo-integration/scripts/odoo_client.py"
-        spec = importlib.util.spec_from_file_location("odoo_client_dynamic", module_file)
-        if spec is None or spec.loader is None:
+    """Return an OdooClient for the current ODOO_* settings; None on failure.
+
+    The logged-in client is reused until the settings change.
+    """
+    global _odoo_client, _odoo_settings
+    odoo = settings().odoo
+    if _odoo_client is not None and odoo == _odoo_settings:
+        return _odoo_client
+    with _odoo_lock:  # approved files run concurrently; log in once
+        if _odoo_client is not None and odoo == _odoo_settings:
+            return _odoo_client
+        try:
+            module = load_skill_module(".agents/skills/odoo-integration/scripts/odoo_client.py")
+            config = module.OdooConfig(url=odoo.url, db=odoo.db, user=odoo.user, password=odoo.password)
+            _odoo_client, _odoo_settings = module.OdooClient(config), odoo
+            return _odoo_client
+        except Exception as exc:
+            logger.warning("Odoo client unavailable: %s", exc)
             return None
-        module = importlib.util.module_from_spec(spec)
-        sys.modules["odoo_client_dynamic"] = module
-        spec.loader.exec_module(module)
-        config = module.OdooConfig(
-            url=os.getenv("ODOO_URL", "http://localhost:8069"),
-            db=os.getenv("ODOO_DB", "odoo_db"),
-            user=os.getenv("ODOO_USER", "admin"),
-            password=os.getenv("ODOO_PASSWORD", "admin"),
-        )
-        return module.OdooClient(config)
-    except Exception as exc:
-        logger.warning("Odoo client unavailable: %s", exc)
-        return None
 
 
 # ─── Execution helpers (Odoo + Email) ────────────────────────────────────
 
+_claim_lock = threading.Lock()
+
+
+def _claim_path(path: Path) -> Path:
+    """Reserve a new file at ``path``, or ``<stem>_<n><suffix>`` if it is taken.
+
+    Approved files are executed concurrently, so two of them can pick the same
+    timestamped name; the empty placeholder keeps the name until it is written.
+    """
+    with _claim_lock:
+        candidate, n = path, 1
+        while candidate.exists():
+            n += 1
+            candidate = path.with_name(f"{path.stem}_{n}{path.suffix}")
+        candidate.touch()
+        return candidate
+
+
+def _move_unique(src: Path, dest: Path) -> Path:
+    """Move ``src`` to ``dest``, or to ``<stem>_<n><suffix>`` if that is taken."""
+    with _claim_lock:
+        candidate, n = dest, 1
+        while candidate.exists():
+            n += 1
+            candidate = dest.with_name(f"{dest.stem}_{n}{dest.suffix}")
+        shutil.move(str(src), str(candidate))
+        return candidate
+
+
 def _save_invoice_to_vault(vault: Path, meta: dict, invoice_id: int | str) -> Path:
     """Save a markdown invoice file to Vault/Invoices/ for Obsidian visibility."""
     invoices_dir = vault / "Invoices"
@@ -191,7 +226,7 @@ def _save_invoice_to_vault(vault: Path, meta: dict, invoice_id: int | str) -> Pa
     stamp = datetime.now(ZoneInfo("Asia/Karachi")).strftime("%Y%m%d_%H%M%S")
     partner_name = meta.get("partner_name", "Unknown")
     safe_name = re.sub(r'[^\w\-]', '_', partner_name)[:30]
-    filepath = invoices_dir / f"INVOICE_{safe_name}_{stamp}.md"
+    filepath = _claim_path(invoices_dir / f"INVOICE_{safe_name}_{stamp}.md")
     product = meta.get("product_description", "Product/Service")
     quantity = meta.get("quantity", 1)
     unit_price = meta.get("unit_price", 0.0)
@@ -229,7 +264,7 @@ _Draft invoice created in Odoo (ID: {invoice_id}). Approve in Odoo to finalize._
 
 def execute_invoice_action(meta: dict) -> dict:
     """Create draft invoice in Odoo from approval metadata. Returns result dict."""
-    dry_run = os.getenv("DRY_RUN", "true").lower() == "true"
+    dry_run = settings().dry_run
     partner_name = meta.get("partner_name", "Unknown Customer")
     partner_email = meta.get("partner_email", "")
     product = meta.get("product_description", "Product/Service")
@@ -243,18 +278,18 @@ def execute_invoice_action(meta: dict) -> dict:
         logger.info(msg)
         return {"status": "dry_run", "message": msg}
 
-    client = _get_odoo_client()
-    if client is None:
-        return {"status": "error", "message": "Odoo not reachable"}
-
     try:
-        partner_result = client.ensure_partner(partner_name, partner_email)
-        partner_id = partner_result["partner"]["id"]
-
-        invoice_id = client.create_draft_invoice(
-            partner_id=partner_id,
-            lines=[{"name": product, "quantity": quantity, "price_unit": unit_price}],
-        )
+        with backend_slot("odoo"):
+            client = _get_odoo_client()
+            if client is None:
+                return {"status": "error", "message": "Odoo not reachable"}
+            partner_result = client.ensure_partner(partner_name, partner_email)
+            partner_id = partner_result["partner"]["id"]
+
+            invoice_id = client.create_draft_invoice(
+                partner_id=partner_id,
+                lines=[{"name": product, "quantity": quantity, "price_unit": unit_price}],
+            )
         # Save invoice markdown to Vault/Invoices for Obsidian
         invoice_file = _save_invoice_to_vault(vault, meta, invoice_id)
         return {
@@ -271,7 +306,7 @@ def execute_invoice_action(meta: dict) -> dict:
 
 def execute_email_reply(meta: dict, invoice_result: dict) -> dict:
     """Send confirmation email to customer after invoice creation."""
-    dry_run = os.getenv("DRY_RUN", "true").lower() == "true"
+    dry_run = settings().dry_run
     to_email = meta.get("partner_email", "")
     original_subject = meta.get("subject", "Your Order")
     invoice_id = invoice_result.get("invoice_id", "N/A")
@@ -310,13 +345,9 @@ def execute_email_reply(meta: dict, invoice_result: dict) -> dict:
         return {"status": "dry_run", "message": msg}
 
     try:
-        module_file = ROOT / ".agents/skills/gmail-send-mcp/scripts/gmail_send_mcp.py"
-        spec = importlib.util.spec_from_file_location("gmail_send_dynamic", module_file)
-        if spec is None or spec.loader is None:
-            return {"status": "error", "message": "Gmail send module not found"}
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        result_msg = module.send_email(to_email, subject, body)
+        module = load_skill_module(".agents/skills/gmail-send-mcp/scripts/gmail_send_mcp.py")
+        with backend_slot("smtp"):
+            result_msg = module.send_email(to_email, subject, body)
         return {"status": "success", "message": result_msg}
     except Exception as exc:
         logger.error("Email reply failed: %s", exc)
@@ -327,7 +358,7 @@ def execute_calendar_action(meta: dict) -> dict:
     """Create a Google Calendar event from approval metadata."""
     from dateutil import parser as dateutil_parser
 
-    dry_run = os.getenv("DRY_RUN", "true").lower() == "true"
+    dry_run = settings().dry_run
     title = meta.get("meeting_title", meta.get("subject", "Meeting"))
     meeting_date = meta.get("meeting_date", "")
     start_time = meta.get("meeting_start", "10:00 AM")
@@ -392,11 +423,12 @@ def execute_calendar_action(meta: dict) -> dict:
             return {"status": "error", "message": "No service account credentials configured"}
 
         from googleapiclient.discovery import build as gcal_build
-        service = gcal_build("calendar", "v3", credentials=creds)
-        created = service.events().insert(
-            calendarId=calendar_id,
-            body=event_body,
-        ).execute()
+        with backend_slot("calendar"):
+            service = gcal_build("calendar", "v3", credentials=creds)
+            created = service.events().insert(
+                calendarId=calendar_id,
+                body=event_body,
+            ).execute()
 
         event_id = created.get("id", "unknown")
         link = created.get("htmlLink", "")
@@ -415,7 +447,7 @@ def execute_calendar_action(meta: dict) -> dict:
 
 def execute_meeting_email_reply(meta: dict, cal_result: dict) -> dict:
     """Send confirmation email to client after meeting is booked in calendar."""
-    dry_run = os.getenv("DRY_RUN", "true").lower() == "true"
+    dry_run = settings().dry_run
     to_email = meta.get("partner_email", "")
     partner_name = meta.get("partner_name", "Customer")
     original_subject = meta.get("subject", "Meeting")
@@ -455,13 +487,9 @@ def execute_meeting_email_reply(meta: dict, cal_result: dict) -> dict:
         return {"status": "dry_run", "message": msg}
 
     try:
-        module_file = ROOT / ".agents/skills/gmail-send-mcp/scripts/gmail_send_mcp.py"
-        spec = importlib.util.spec_from_file_location("gmail_send_dynamic", module_file)
-        if spec is None or spec.loader is None:
-            return {"status": "error", "message": "Gmail send module not found"}
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        result_msg = module.send_email(to_email, subject, body)
+        module = load_skill_module(".agents/skills/gmail-send-mcp/scripts/gmail_send_mcp.py")
+        with backend_slot("smtp"):
+            result_msg = module.send_email(to_email, subject, body)
         return {"status": "success", "message": result_msg}
     except Exception as exc:
         logger.error("Meeting confirmation email failed: %s", exc)
@@ -476,7 +504,7 @@ def _save_meeting_to_vault(vault: Path, meta: dict, event_id: str, link: str,
     stamp = datetime.now(ZoneInfo("Asia/Karachi")).strftime("%Y%m%d_%H%M%S")
     title = meta.get("meeting_title", meta.get("subject", "Meeting"))
     safe_title = re.sub(r'[^\w\-]', '_', title)[:40]
-    filepath = done_dir / f"MEETING_{safe_title}_{stamp}.md"
+    filepath = _claim_path(done_dir / f"MEETING_{safe_title}_{stamp}.md")
     filepath.write_text(
         f"""---
 type: calendar_event
@@ -502,238 +530,29 @@ _Event created automatically from email approval._
     return filepath
 
 
-def _count_files(folder: Path, pattern: str = "*.md") -> int:
-    if not folder.exists():
-        return 0
-    return sum(1 for _ in folder.rglob(pattern))
-
-
-def _count_files_flat(folder: Path, pattern: str = "*.md") -> int:
-    if not folder.exists():
-        return 0
-    return sum(1 for _ in folder.glob(pattern))
+_dashboards: dict[Path, DashboardModel] = {}
 
 
-def _recent_activity_lines(vault: Path, n: int = 20) -> list[str]:
-    """Read last n activity lines from existing dashboard."""
-    dashboard = vault / "Dashboard.md"
-    if not dashboard.exists():
-        return []
-    content = dashboard.read_text(encoding="utf-8", errors="ignore")
-    lines = []
-    in_activity = False
-    for line in content.splitlines():
-        if line.strip().startswith("## Recent Activity"):
-            in_activity = True
-            continue
-        if in_activity:
-            if line.startswith("## ") or line.startswith("# "):
-                break
-            if line.strip():
-                lines.append(line)
-    return lines[-n:]  # keep only last n
-
-
-def _collect_invoice_stats(vault: Path) -> dict:
-    invoices_dir = vault / "Invoices"
-    if not invoices_dir.exists():
-        return {"count": 0, "latest": "—"}
-    files = sorted(invoices_dir.glob("INVOICE_*.md"), reverse=True)
-    if not files:
-        return {"count": 0, "latest": "—"}
-    # parse latest invoice_id from frontmatter
-    latest = files[0]
-    inv_id = "—"
-    for line in latest.read_text(encoding="utf-8", errors="ignore").splitlines():
-        if line.startswith("invoice_id:"):
-            inv_id = line.split(":", 1)[1].strip()
-            break
-    return {"count": len(files), "latest": f"#{inv_id} ({latest.stem})"}
-
-
-def _count_rejected_from_logs(vault: Path) -> int:
-    """Count total rejected items across all JSON log files."""
-    import json as _json
-    logs_dir = vault / "Logs"
-    if not logs_dir.exists():
-        return 0
-    total = 0
-    for log_file in logs_dir.glob("*.json"):
-        if log_file.name.startswith("."):
-            continue
-        try:
-            entries = _json.loads(log_file.read_text(encoding="utf-8", errors="ignore"))
-            if isinstance(entries, list):
-                total += sum(1 for e in entries if e.get("approval_status") == "rejected")
-        except Exception:
-            pass
-    return total
+def _dashboard(vault: Path) -> DashboardModel:
+    model = _dashboards.get(vault)
+    if model is None:
+        model = _dashboards[vault] = DashboardModel(vault)
+    return model
 
 
 def refresh_dashboard(vault: Path, activity_line: str | None = None) -> None:
-    """Rebuild Dashboard.md with live stats + recent activity log."""
-    dashboard = vault / "Dashboard.md"
-
-    # ── Collect existing activity lines before overwriting ──
-    existing_lines = _recent_activity_lines(vault, n=50)
+    """Bring the dashboard model up to date and rewrite Dashboard.md if it changed."""
+    model = _dashboard(vault)
     if activity_line:
-        stamp = datetime.now(ZoneInfo("Asia/Karachi")).strftime("%Y-%m-%d %H:%M")
-        existing_lines.append(f"- [{stamp}] {activity_line}")
-    # Keep last 50
-    existing_lines = existing_lines[-50:]
-
-    # ── Live counts ──
-    inbox_count     = _count_files_flat(vault / "Inbox")
-    needs_count     = _count_files(vault / "Needs_Action")
-    pending_count   = _count_files(vault / "Pending_Approval")
-    approved_count  = _count_files_flat(vault / "Approved")
-    rejected_count  = _count_rejected_from_logs(vault)   # from logs (items moved to Done after rejection)
-    done_count      = _count_files_flat(vault / "Done")
-    plans_count     = _count_files(vault / "Plans")
-    inv_stats       = _collect_invoice_stats(vault)
-    meetings_count  = sum(1 for f in (vault / "Done").glob("MEETING_*.md")) if (vault / "Done").exists() else 0
-    logs_dir        = vault / "Logs"
-    log_days        = len(list(logs_dir.glob("*.json"))) if logs_dir.exists() else 0
-
-    # ── Pending Approval details (names) ──
-    pend_dir = vault / "Pending_Approval"
-    pend_names = []
-    if pend_dir.exists():
-        for f in sorted(pend_dir.rglob("*.md"))[:10]:
-            pend_names.append(f"  - {f.name}")
-
-    # ── Recent invoices list ──
-    inv_dir = vault / "Invoices"
-    inv_lines = []
-    if inv_dir.exists():
-        for f in sorted(inv_dir.glob("INVOICE_*.md"), reverse=True)[:5]:
-            inv_lines.append(f"  - {f.name}")
-
-    # ── Recent Done items ──
-    done_dir = vault / "Done"
-    done_lines = []
-    if done_dir.exists():
-        for f in sorted(done_dir.glob("*.md"), key=lambda x: x.stat().st_mtime, reverse=True)[:5]:
-            done_lines.append(f"  - {f.name}")
-
-    now = datetime.now(ZoneInfo("Asia/Karachi")).strftime("%Y-%m-%d %H:%M:%S")
-
-    pend_block  = "\n".join(pend_names) if pend_names else "  _None_"
-    inv_block   = "\n".join(inv_lines)  if inv_lines  else "  _None_"
-    done_block  = "\n".join(done_lines) if done_lines  else "  _None_"
-    activity_block = "\n".join(existing_lines) if existing_lines else "_No activity yet._"
-
-    # ── Build pending approval wiki-links ──
-    pend_dir2 = vault / "Pending_Approval"
-    pend_wiki = []
-    if pend_dir2.exists():
-        for f in sorted(pend_dir2.rglob("*.md"))[:10]:
-            stem = f.stem
-            pend_wiki.append(f"  - [[Pending_Approval/{f.parent.name}/{stem}|{stem}]]")
-    pend_wiki_block = "\n".join(pend_wiki) if pend_wiki else "  _None pending_"
-
-    # ── Build invoice wiki-links ──
-    inv_dir2 = vault / "Invoices"
-    inv_wiki = []
-    if inv_dir2.exists():
-        for f in sorted(inv_dir2.glob("INVOICE_*.md"), reverse=True)[:5]:
-            inv_wiki.append(f"  - [[Invoices/{f.stem}|{f.stem}]]")
-    inv_wiki_block = "\n".join(inv_wiki) if inv_wiki else "  _None_"
-
-    # ── Build done wiki-links with clean display ──
-    done_dir2 = vault / "Done"
-    done_wiki = []
-    if done_dir2.exists():
-        for f in sorted(done_dir2.glob("*.md"), key=lambda x: x.stat().st_mtime, reverse=True)[:5]:
-            done_wiki.append(f"  - [[Done/{f.stem}|{f.stem}]]")
-    done_wiki_block = "\n".join(done_wiki) if done_wiki else "  _None_"
-
-    # ── Callout type based on pending count ──
-    if pending_count > 5:
-        alert_type = "warning"
-        alert_icon = "🔴"
-    elif pending_count > 0:
-        alert_type = "info"
-        alert_icon = "🟡"
-    else:
-        alert_type = "success"
-        alert_icon = "🟢"
+        model.add_activity(activity_line)
+    model.flush()
 
-    content = f"""---
-tags: [dashboard, home, status]
-updated: {now}
----
-
-# 🤖 AI Employee — Command Center
-
-> [!{alert_type}] System Status — Last synced: `{now}`
-> Auto-refreshed by orchestrator every 5 seconds.
-
----
 
-## 📊 Live Counts
-
-| 📁 Category | # |
-|:---|---:|
-| 📥 Inbox (new files) | {inbox_count} |
-| ⚡ Needs Action | {needs_count} |
-| ⏳ Pending Approval | {pending_count} |
-| ✅ Approved | {approved_count} |
-| ❌ Rejected | {rejected_count} |
-| 🏁 Done | {done_count} |
-| 📋 Plans Generated | {plans_count} |
-| 🧾 Invoices Created | {inv_stats["count"]} |
-| 📅 Meetings Scheduled | {meetings_count} |
-| 📅 Log Days | {log_days} |
-
----
-
-## ⏳ Pending Approval ({pending_count}) {alert_icon}
-
-{pend_wiki_block}
-
-> [!tip] To approve, move file to `Vault/Approved/`
-
----
-
-## 🧾 Recent Invoices ({inv_stats["count"]} total)
-
-**Latest:** `{inv_stats["latest"]}`
-
-{inv_wiki_block}
-
----
-
-## 🏁 Recently Completed ({done_count} total)
-
-{done_wiki_block}
-
----
-
-## 🗂️ Quick Navigation
-
-| Section | Link |
-|:--------|:-----|
-| Business Goals | [[Business_Goals]] |
-| Company Handbook | [[Company_Handbook]] |
-| Inbox | [[Inbox/]] |
-| Plans | [[Plans/]] |
-| Pending Approval | [[Pending_Approval/]] |
-| Invoices | [[Invoices/]] |
-| Schedules | [[Schedules/linkedin_post]] · [[Schedules/facebook_post]] · [[Schedules/twitter_post]] |
-
----
-
-## 🕐 Recent Activity (last 50 events)
-
-{activity_block}
-"""
-    dashboard.write_text(content, encoding="utf-8")
-
-
-# Keep append_dashboard as thin wrapper so all existing call-sites work unchanged
 def append_dashboard(vault: Path, message: str) -> None:
-    refresh_dashboard(vault, activity_line=message)
+    """Record an activity line; it is written with the tick's single render."""
+    model = _dashboard(vault)
+    model.add_activity(message)
+    model.request_render()
 
 
 def requires_approval(text: str) -> bool:
@@ -857,125 +676,230 @@ Move this file to `/Approved` to proceed or `/Rejected` to cancel.
     return approval_path
 
 
-def process_needs_action(vault: Path) -> None:
-    needs_action = vault / "Needs_Action"
-    done = vault / "Done"
-    done.mkdir(parents=True, exist_ok=True)
+NEEDS_ACTION_BATCH = 100
+APPROVED_LEASE_SECONDS = 600  # Odoo + SMTP with retries; a step extends it
+MAX_APPROVED_WORKERS = 32  # pool size; APPROVED_WORKERS is capped to it
 
-    for source_file in needs_action.rglob("*.md"):
-        content = source_file.read_text(encoding="utf-8", errors="ignore")
-
-        # For FILE_ wrappers, resolve original email content from Inbox
-        effective_content = content
-        if source_file.name.startswith("FILE_"):
-            original_name = source_file.name[len("FILE_"):]
-            original_path = vault / "Inbox" / original_name
-            if original_path.exists():
-                try:
-                    effective_content = original_path.read_text(encoding="utf-8", errors="ignore")
-                except Exception:
-                    pass
-
-        create_plan(vault, source_file)
-
-        if requires_approval(effective_content):
-            approval = create_approval(vault, source_file, "Sensitive action detected", content=effective_content)
-            append_dashboard(vault, f"Approval requested for {source_file.name}")
-            log_action(
-                action_type="approval_requested",
-                target=source_file.name,
-                parameters={"approval_file": approval.name},
-                result="queued",
-                approval_status="pending",
-            )
-        else:
-            append_dashboard(vault, f"Auto-processed {source_file.name}")
-            log_action(
-                action_type="auto_process",
-                target=source_file.name,
-                parameters={},
-                result="success",
-                approval_status="not_required",
-            )
 
-        shutil.move(str(source_file), str(done / source_file.name))
+def _step(vault: Path, item: WorkItem, name: str, run):
+    """Run one step of ``item`` unless a previous attempt already finished it."""
+    if name in item.steps:
+        return item.steps[name]
+    result = run()
+    work_queue(vault).record_step(item, name, result, APPROVED_LEASE_SECONDS)
+    return result
 
 
-def process_approved(vault: Path) -> None:
-    approved = vault / "Approved"
+def _fail(vault: Path, item: WorkItem, exc: Exception) -> None:
+    logger.exception("Processing %s failed (attempt %d)", item.name, item.attempts)
+    try:
+        stage = work_queue(vault).fail(item, exc)
+    except Exception:
+        # The lease runs out on its own and the item is retried then.
+        logger.exception("Could not record the failure of %s", item.name)
+        return
+    if stage == DEAD:
+        append_dashboard(vault, f"Gave up on {item.name} after {item.attempts} attempts: {exc}")
+
+
+def process_needs_action(vault: Path) -> None:
     done = vault / "Done"
     done.mkdir(parents=True, exist_ok=True)
-    for file in list(approved.rglob("*.md")):
-        if not file.exists():
-            continue
+    queue = work_queue(vault)
+
+    for item in queue.claim("needs_action", limit=NEEDS_ACTION_BATCH, suffixes=(".md",)):
         try:
-            content = file.read_text(encoding="utf-8", errors="ignore")
-        except FileNotFoundError:
-            continue
-        meta = parse_email_frontmatter(content)
-        action = meta.get("action", "review_and_execute")
+            handle_needs_action(vault, item)
+        except Exception as exc:
+            _fail(vault, item, exc)
+
+
+def handle_needs_action(vault: Path, item: WorkItem) -> None:
+    source_file = item.path
+    done = vault / "Done"
+    if not source_file.exists():
+        work_queue(vault).ack(item)
+        return
+    content = source_file.read_text(encoding="utf-8", errors="ignore")
+
+    # For FILE_ wrappers, resolve original email content from Inbox
+    effective_content = content
+    if source_file.name.startswith("FILE_"):
+        original_name = source_file.name[len("FILE_"):]
+        original_path = vault / "Inbox" / original_name
+        if original_path.exists():
+            try:
+                effective_content = original_path.read_text(encoding="utf-8", errors="ignore")
+            except Exception:
+                pass
+
+    _step(vault, item, "plan", lambda: create_plan(vault, source_file).name)
 
-        extra_params: dict = {}
+    if requires_approval(effective_content):
+        approval_name = _step(
+            vault, item, "approval",
+            lambda: create_approval(vault, source_file, "Sensitive action detected", content=effective_content).name,
+        )
+        append_dashboard(vault, f"Approval requested for {source_file.name}")
+        log_action(
+            action_type="approval_requested",
+            target=source_file.name,
+            parameters={"approval_file": approval_name},
+            result="queued",
+            approval_status="pending",
+        )
+    else:
+        append_dashboard(vault, f"Auto-processed {source_file.name}")
+        log_action(
+            action_type="auto_process",
+            target=source_file.name,
+            parameters={},
+            result="success",
+            approval_status="not_required",
+        )
+
+    dest = done / source_file.name
+    shutil.move(str(source_file), str(dest))
+    work_queue(vault).ack(item, path=dest)
+
+
+# Approved files run on a worker pool so a slow Odoo or SMTP round-trip for
+# one file does not hold up the rest. Each worker claims one item at a time
+# from the work queue until none is due; steps within an item stay in order
+# because the worker runs them sequentially, and backend_slot() caps
+# concurrent calls per backend. There is one pool for the life of the process
+# (threads start lazily); APPROVED_WORKERS only limits how many workers run, so
+# a new value applies from the next tick and never overlaps a second pool.
+_executor: ThreadPoolExecutor | None = None
+_active_workers = 0
+_workers_lock = threading.Lock()
+
+
+def _approved_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=MAX_APPROVED_WORKERS, thread_name_prefix="approved")
+    return _executor
+
+
+def _worker_limit() -> int:
+    return min(MAX_APPROVED_WORKERS, max(1, settings().executor.workers))
+
+
+def _approved_worker(vault: Path) -> None:
+    global _active_workers
+    queue = work_queue(vault)
+    released = False
+    try:
+        while True:
+            # Claiming under the lock means process_approved never counts a
+            # worker that is about to exit with work still due.
+            with _workers_lock:
+                items = queue.claim("approved", lease_seconds=APPROVED_LEASE_SECONDS, suffixes=(".md",))
+                if not items:
+                    _active_workers -= 1
+                    released = True
+                    return
+            try:
+                execute_approved(vault, items[0])
+            except Exception as exc:
+                _fail(vault, items[0], exc)
+    except Exception:
+        # e.g. "database is locked"; the next tick starts a fresh worker.
+        logger.exception("Approved worker stopped")
+    finally:
+        if not released:
+            with _workers_lock:
+                _active_workers -= 1
+
+
+def process_approved(vault: Path) -> list[Future]:
+    """Start workers for due approved items, up to the pool size; returns them."""
+    global _active_workers
+    (vault / "Done").mkdir(parents=True, exist_ok=True)
+    executor = _approved_executor()
+    with _workers_lock:
+        # Below zero after APPROVED_WORKERS was lowered: start none until enough finish.
+        start = max(0, min(work_queue(vault).due("approved", suffixes=(".md",)), _worker_limit() - _active_workers))
+        _active_workers += start
+    return [executor.submit(_approved_worker, vault) for _ in range(start)]
+
+
+def execute_approved(vault: Path, item: WorkItem) -> None:
+    """Run one approved item's actions in order, then archive it to Done."""
+    file = item.path
+    done = vault / "Done"
+    try:
+        meta = frontmatter.read(file) or {}
+    except FileNotFoundError:
+        work_queue(vault).ack(item)
+        return
+    action = meta.get("action", "review_and_execute")
+
+    extra_params: dict = {}
+
+    if action == "create_invoice_and_reply":
+        # Phase 3: Odoo invoice + email reply
+        invoice_result = _step(vault, item, "invoice", lambda: execute_invoice_action(meta))
+        extra_params["invoice"] = invoice_result
+        append_dashboard(
+            vault,
+            f"Invoice action for {file.name}: {invoice_result.get('message', '')}",
+        )
 
-        if action == "create_invoice_and_reply":
-            # Phase 3: Odoo invoice + email reply
-            invoice_result = execute_invoice_action(meta)
-            extra_params["invoice"] = invoice_result
+        # Send email reply regardless of invoice status (success or dry_run)
+        # Only skip on hard errors where partner_email is also missing
+        if invoice_result.get("status") != "error" or meta.get("partner_email"):
+            email_result = _step(vault, item, "email_reply", lambda: execute_email_reply(meta, invoice_result))
+            extra_params["email_reply"] = email_result
             append_dashboard(
                 vault,
-                f"Invoice action for {file.name}: {invoice_result.get('message', '')}",
+                f"Email reply for {file.name}: {email_result.get('message', '')}",
             )
-
-            # Send email reply regardless of invoice status (success or dry_run)
-            # Only skip on hard errors where partner_email is also missing
-            if invoice_result.get("status") != "error" or meta.get("partner_email"):
-                email_result = execute_email_reply(meta, invoice_result)
-                extra_params["email_reply"] = email_result
-                append_dashboard(
-                    vault,
-                    f"Email reply for {file.name}: {email_result.get('message', '')}",
-                )
-        elif action == "create_calendar_event":
-            # Calendar meeting creation from email
-            cal_result = execute_calendar_action(meta)
-            extra_params["calendar"] = cal_result
+    elif action == "create_calendar_event":
+        # Calendar meeting creation from email
+        cal_result = _step(vault, item, "calendar", lambda: execute_calendar_action(meta))
+        extra_params["calendar"] = cal_result
+        append_dashboard(
+            vault,
+            f"Calendar event for {file.name}: {cal_result.get('message', '')}",
+        )
+        # Send confirmation email to client about the meeting
+        if cal_result.get("status") != "error" and meta.get("partner_email"):
+            email_result = _step(vault, item, "email_reply", lambda: execute_meeting_email_reply(meta, cal_result))
+            extra_params["email_reply"] = email_result
             append_dashboard(
                 vault,
-                f"Calendar event for {file.name}: {cal_result.get('message', '')}",
+                f"Meeting confirmation email for {file.name}: {email_result.get('message', '')}",
             )
-            # Send confirmation email to client about the meeting
-            if cal_result.get("status") != "error" and meta.get("partner_email"):
-                email_result = execute_meeting_email_reply(meta, cal_result)
-                extra_params["email_reply"] = email_result
-                append_dashboard(
-                    vault,
-                    f"Meeting confirmation email for {file.name}: {email_result.get('message', '')}",
-                )
-        else:
-            append_dashboard(vault, f"Approved action executed: {file.name}")
-
-        log_action(
-            action_type="approved_execution",
-            target=file.name,
-            parameters=extra_params,
-            result="success",
-            approval_status="approved",
-            approved_by="human",
-        )
-        dest = done / file.name
-        if dest.exists():
-            dest = done / f"{file.stem}_{datetime.now(ZoneInfo('Asia/Karachi')).strftime('%H%M%S')}{file.suffix}"
-        try:
-            shutil.move(str(file), str(dest))
-        except FileNotFoundError:
-            pass
+    else:
+        append_dashboard(vault, f"Approved action executed: {file.name}")
+
+    log_action(
+        action_type="approved_execution",
+        target=file.name,
+        parameters=extra_params,
+        result="success",
+        approval_status="approved",
+        approved_by="human",
+    )
+    try:
+        dest = _move_unique(file, done / file.name)
+    except FileNotFoundError:
+        dest = None
+    work_queue(vault).ack(item, path=dest)
 
 
 def process_rejected(vault: Path) -> None:
-    rejected = vault / "Rejected"
     done = vault / "Done"
     done.mkdir(parents=True, exist_ok=True)
-    for file in rejected.rglob("*.md"):
+    queue = work_queue(vault)
+    for item in queue.claim("rejected", limit=NEEDS_ACTION_BATCH, suffixes=(".md",)):
+        file = item.path
+        if not file.exists():
+            queue.ack(item)
+            continue
+        _dashboard(vault).note_rejected()
         append_dashboard(vault, f"Rejected action archived: {file.name}")
         log_action(
             action_type="approved_execution",
@@ -985,26 +909,21 @@ def process_rejected(vault: Path) -> None:
             approval_status="rejected",
             approved_by="human",
         )
-        shutil.move(str(file), str(done / file.name))
+        try:
+            shutil.move(str(file), str(done / file.name))
+        except OSError as exc:
+            _fail(vault, item, exc)
+            continue
+        queue.ack(item, path=done / file.name)
 
 
 # ─── Scheduling support ─────────────────────────────────────────────────
 
 def _parse_schedule_file(path: Path) -> dict | None:
     """Parse a schedule file frontmatter to extract scheduling params."""
-    content = path.read_text(encoding="utf-8", errors="ignore")
-    if not content.startswith("---"):
-        return None
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    meta = frontmatter.read(path, body=True)
+    if meta is None:
         return None
-    meta = {}
-    for line in parts[1].strip().split("\n"):
-        if ":" in line:
-            key, val = line.split(":", 1)
-            clean_val = val.strip().strip('"').strip("'")
-            meta[key.strip()] = clean_val
-    meta["body"] = parts[2].strip()
     meta["filename"] = path.name
     return meta
 
@@ -1012,12 +931,7 @@ def _parse_schedule_file(path: Path) -> dict | None:
 def _trigger_linkedin_draft(vault: Path) -> None:
     """Generate a LinkedIn post draft for approval."""
     try:
-        module_file = ROOT / ".agents/skills/linkedin-poster/scripts/linkedin_poster.py"
-        spec = importlib.util.spec_from_file_location("linkedin_poster_dynamic", module_file)
-        if spec is None or spec.loader is None:
-            raise RuntimeError("Unable to load linkedin_poster module")
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        module = load_skill_module(".agents/skills/linkedin-poster/scripts/linkedin_poster.py")
         module.generate_draft(vault)
         append_dashboard(vault, "Scheduled LinkedIn draft created for approval")
     except Exception as exc:
@@ -1032,12 +946,7 @@ def _trigger_linkedin_draft(vault: Path) -> None:
 
 def _trigger_social_draft(vault: Path, platform: str) -> None:
     try:
-        module_file = ROOT / ".agents/skills/social-poster/scripts/social_poster.py"
-        spec = importlib.util.spec_from_file_location("social_poster_dynamic", module_file)
-        if spec is None or spec.loader is None:
-            raise RuntimeError("Unable to load social_poster module")
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        module = load_skill_module(".agents/skills/social-poster/scripts/social_poster.py")
 
         module.generate_draft(vault, platform=platform)
         append_dashboard(vault, f"Scheduled {platform} draft created for approval")
@@ -1053,12 +962,7 @@ def _trigger_social_draft(vault: Path, platform: str) -> None:
 
 def _trigger_ceo_briefing(vault: Path) -> None:
     try:
-        module_file = ROOT / ".agents/skills/ceo-briefing/scripts/ceo_briefing.py"
-        spec = importlib.util.spec_from_file_location("ceo_briefing_dynamic", module_file)
-        if spec is None or spec.loader is None:
-            raise RuntimeError("Unable to load ceo_briefing module")
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        module = load_skill_module(".agents/skills/ceo-briefing/scripts/ceo_briefing.py")
 
         output = module.generate_weekly_briefing(vault)
         append_dashboard(vault, f"Weekly CEO briefing generated: {output.name}")
@@ -1150,26 +1054,65 @@ status: pending
     append_dashboard(vault, f"Scheduled task triggered: {meta.get('task', 'custom')}")
 
 
+PROCESSORS = {
+    "Needs_Action": process_needs_action,
+    "Approved": process_approved,
+    "Rejected": process_rejected,
+}
+
+
+def run_tick(vault: Path, folders=PROCESSORS) -> None:
+    """Run due jobs and the processors for ``folders``, then render once."""
+    schedule_lib.run_pending()
+    work_queue(vault).sync()
+
+    for folder in PROCESSORS:
+        if folder in folders:
+            PROCESSORS[folder](vault)
+
+    # One render per tick for everything appended above (and changes made
+    # outside the loop); Dashboard.md is rewritten only if it changed
+    refresh_dashboard(vault)
+
+
+def _next_wake(reconcile_at: float) -> float:
+    """Seconds to block: until the next scheduled job or reconciliation scan."""
+    timeout = reconcile_at - time.monotonic()
+    idle = schedule_lib.idle_seconds()
+    if idle is not None:
+        timeout = min(timeout, idle)
+    return max(0.0, timeout)
+
+
 def main() -> None:
     vault = get_vault_path()
     pid_file = Path("/tmp/orchestrator.pid")
     pid_file.write_text(str(os.getpid()))
+    enable_background_writer()
 
     # Load scheduled tasks
     load_schedules(vault)
+    # Compress closed audit log days once a night
+    schedule_lib.every().day.at("00:30").do(compact_closed_days, vault / "Logs")
+    schedule_lib.every().day.at("00:40").do(work_queue(vault).prune)
+
+    events = VaultEvents(vault, PROCESSORS, sink=_dashboard(vault).apply_event)
+    if settings().orchestrator_events and events.start():
+        # Block until a file lands in a watched folder; a periodic full pass
+        # still catches anything the watcher missed (e.g. overflowed queue)
+        logger.info("Orchestrator waiting on vault events")
+        run_tick(vault)
+        reconcile_at = time.monotonic() + settings().orchestrator_reconcile
+        while True:
+            folders = events.wait(_next_wake(reconcile_at))
+            if time.monotonic() >= reconcile_at:
+                folders = PROCESSORS
+                reconcile_at = time.monotonic() + settings().orchestrator_reconcile
+            run_tick(vault, folders)
 
     while True:
-        # Run due scheduled jobs
-        schedule_lib.run_pending()
-
-        process_needs_action(vault)
-        process_approved(vault)
-        process_rejected(vault)
-
-        # Refresh dashboard with latest counts on every loop
-        refresh_dashboard(vault)
-
-        time.sleep(5)
+        run_tick(vault)
+        time.sleep(settings().orchestrator_interval)
 
 
 if __name__ == "__main__":
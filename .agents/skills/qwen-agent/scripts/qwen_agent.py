@@ -30,8 +30,10 @@ ROOT = Path(__file__).resolve().parents[4]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.core.config import get_vault_path, DRY_RUN
+from src.core.config import get_vault_path, settings
 from src.core.audit_logger import log_action
+from src.core import frontmatter
+from src.core.work_queue import work_queue
 
 logging.basicConfig(
     level=logging.INFO,
@@ -55,6 +57,7 @@ GOALS = VAULT / "Business_Goals.md"
 DASHBOARD = VAULT / "Dashboard.md"
 
 PROCESSED_KEY = "processed_files"
+NEEDS_ACTION_SUFFIXES = {".md", ".txt", ".json", ".csv"}
 
 
 # ── State management ──────────────────────────────────────────────────────────
@@ -285,21 +288,6 @@ Move to Vault/Approved/ to execute or Vault/Rejected/ to cancel.
 
 # ── Approval handler / MCP dispatcher ────────────────────────────────────────
 
-def _load_frontmatter(text: str) -> dict:
-    """Parse simple YAML frontmatter from a markdown file."""
-    meta: dict = {}
-    if not text.startswith("---"):
-        return meta
-    parts = text.split("---", 2)
-    if len(parts) < 3:
-        return meta
-    for line in parts[1].splitlines():
-        if ":" in line:
-            k, _, v = line.partition(":")
-            meta[k.strip()] = v.strip()
-    return meta
-
-
 def _import_module_from_file(name: str, file_path: Path):
     spec = importlib.util.spec_from_file_location(name, str(file_path))
     mod = importlib.util.module_from_spec(spec)
@@ -310,13 +298,13 @@ def _import_module_from_file(name: str, file_path: Path):
 def _execute_approved(approved_file: Path) -> str:
     """Read an approved file and call the appropriate MCP."""
     content = approved_file.read_text(encoding="utf-8", errors="replace")
-    meta = _load_frontmatter(content)
+    meta, body = frontmatter.parse(content) or ({}, content)
     action = meta.get("action", "").lower()
     item_type = meta.get("type", "general").lower()
 
     logger.info("Executing approved action: %s (type=%s)", action, item_type)
 
-    if DRY_RUN:
+    if settings().dry_run:
         result = f"[DRY RUN] Would execute: {action} for {approved_file.name}"
         logger.info(result)
         return result
@@ -327,9 +315,6 @@ def _execute_approved(approved_file: Path) -> str:
             mod = _import_module_from_file("gmail_send_mcp", mcp_path)
             to = meta.get("to", os.getenv("RECIPIENT_EMAIL", ""))
             subject = meta.get("subject", "Reply")
-            # Extract body from content (strip frontmatter)
-            body_parts = content.split("---", 2)
-            body = body_parts[2] if len(body_parts) >= 3 else content
             return str(mod.send_email(to=to, subject=subject, body=body.strip()))
 
         elif action in ("post_linkedin",):
@@ -402,18 +387,17 @@ Ralph loop complete. All Needs_Action items processed.
 
 # ── Main loop ─────────────────────────────────────────────────────────────────
 
+def _unprocessed_items(state: dict) -> list[Path]:
+    """Needs_Action items this agent has not drafted yet (from the work queue index)."""
+    return [
+        p for p in work_queue(VAULT).items("needs_action")
+        if p.suffix in NEEDS_ACTION_SUFFIXES and not _is_processed(state, p)
+    ]
+
+
 def process_needs_action(state: dict, max_items: int) -> int:
     """Process up to max_items from Needs_Action. Returns count processed."""
-    if not NEEDS_ACTION.exists():
-        return 0
-
-    items = [
-        p for p in NEEDS_ACTION.rglob("*")
-        if p.is_file()
-        and not p.name.startswith(".")
-        and p.suffix in {".md", ".txt", ".json", ".csv"}
-        and not _is_processed(state, p)
-    ]
+    items = _unprocessed_items(state)
 
     if not items:
         logger.info("Needs_Action queue is empty.")
@@ -452,37 +436,42 @@ def process_needs_action(state: dict, max_items: int) -> int:
 
 
 def process_approved(state: dict) -> int:
-    """Execute all approved items. Returns count executed."""
-    if not APPROVED.exists():
-        return 0
-
-    approved_items = [
-        p for p in APPROVED.rglob("*")
-        if p.is_file() and p.suffix == ".md" and not p.name.startswith(".")
-    ]
-
-    if not approved_items:
-        return 0
+    """Execute approved items claimed from the work queue. Returns count executed.
 
-    logger.info("Found %d approved item(s) to execute.", len(approved_items))
+    The orchestrator claims from the same queue, so each item runs once.
+    """
+    queue = work_queue(VAULT)
     executed = 0
 
-    for item in approved_items:
-        logger.info("Executing approved: %s", item.name)
-        result = _execute_approved(item)
-        logger.info("Result: %s", result)
+    while True:
+        claimed = queue.claim("approved", suffixes=(".md",))
+        if not claimed:
+            return executed
+        item = claimed[0]
+        if not item.path.exists():
+            queue.ack(item)
+            continue
 
-        # Move to Done
-        DONE.mkdir(parents=True, exist_ok=True)
-        dest = DONE / item.name
-        shutil.move(str(item), str(dest))
+        logger.info("Executing approved: %s", item.name)
+        try:
+            result = item.steps.get("execute") or _execute_approved(item.path)
+            queue.record_step(item, "execute", result)
+            logger.info("Result: %s", result)
+
+            # Move to Done
+            DONE.mkdir(parents=True, exist_ok=True)
+            dest = DONE / item.name
+            shutil.move(str(item.path), str(dest))
+        except Exception as exc:
+            logger.error("Approved item %s failed: %s", item.name, exc)
+            queue.fail(item, exc)
+            continue
+        queue.ack(item, path=dest)
 
         _write_audit("mcp_execute", item.name, result[:200])
         _append_dashboard(f"Executed {item.name} → {result[:80]}")
         executed += 1
 
-    return executed
-
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Qwen Code Agent loop")
@@ -496,9 +485,11 @@ def main() -> None:
     args = parse_args()
     state = _load_state()
 
-    logger.info("Qwen Code Agent started. DRY_RUN=%s", DRY_RUN)
+    logger.info("Qwen Code Agent started. DRY_RUN=%s", settings().dry_run)
 
     while True:
+        work_queue(VAULT).sync()
+
         # 1. Process approved items first (highest priority)
         approved_count = process_approved(state)
 
@@ -506,13 +497,7 @@ def main() -> None:
         processed_count = process_needs_action(state, args.max_items)
 
         # 3. If queue is now empty, write Ralph completion marker
-        remaining = [
-            p for p in NEEDS_ACTION.rglob("*")
-            if p.is_file()
-            and not p.name.startswith(".")
-            and p.suffix in {".md", ".txt", ".json", ".csv"}
-            and not _is_processed(state, p)
-        ] if NEEDS_ACTION.exists() else []
+        remaining = _unprocessed_items(state)
 
         if not remaining and processed_count == 0 and approved_count == 0:
             logger.info("All queues empty. Writing Ralph completion marker.")
@@ -12,8 +12,8 @@ ROOT = Path(__file__).resolve().parents[4]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.core.audit_logger import log_action
-from src.core.config import DRY_RUN, get_env, get_vault_path, require_local_execution
+from src.core.audit_logger import enable_background_writer, log_action
+from src.core.config import get_env, get_vault_path, require_local_execution, settings
 
 PID_FILE = Path("/tmp/social-poster.pid")
 CHECK_INTERVAL = 30
@@ -90,7 +90,7 @@ def _append_daily_summary(vault: Path, platform: str, preview: str, status: str)
 def _publish(platform: str, text: str) -> dict:
     require_local_execution("social_publish")
     token = _token_for_platform(platform)
-    if DRY_RUN:
+    if settings().dry_run:
         return {"status": "dry_run", "message": f"Would publish to {platform}", "preview": text[:120]}
     if not token:
         raise RuntimeError(f"Missing token for {platform}")
@@ -135,6 +135,7 @@ def process_approved(vault: Path) -> None:
 def main() -> None:
     vault = get_vault_path()
     PID_FILE.write_text(str(os.getpid()))
+    enable_background_writer()
     while True:
         process_approved(vault)
         time.sleep(CHECK_INTERVAL)
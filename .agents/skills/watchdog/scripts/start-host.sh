@@ -0,0 +1,20 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT_DIR="$(cd "$(dirname "$0")/../../../.." && pwd)"
+PID_FILE="/tmp/skill-host.pid"
+PYTHON_BIN="$ROOT_DIR/.venv/bin/python"
+
+if [[ ! -x "$PYTHON_BIN" ]]; then
+  PYTHON_BIN="python3"
+fi
+
+if [[ -f "$PID_FILE" ]] && kill -0 "$(cat "$PID_FILE")" 2>/dev/null; then
+  echo "skill host already running"
+  exit 0
+fi
+
+cd "$ROOT_DIR"
+nohup "$PYTHON_BIN" -m src.core.skill_host >/tmp/skill-host.log 2>&1 &
+echo $! > "$PID_FILE"
+echo "skill host started (pid $(cat "$PID_FILE"))"
@@ -1,7 +1,7 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
-for service in watchdog orchestrator filesystem-watcher finance-watcher gmail-watcher calendar-watcher; do
+for service in watchdog skill-host orchestrator filesystem-watcher finance-watcher gmail-watcher calendar-watcher; do
   pid_file="/tmp/${service}.pid"
   if [[ -f "$pid_file" ]]; then
     pid="$(cat "$pid_file")"
@@ -0,0 +1,95 @@
+"""Thin client for the resident hook daemon (src.core.hook_daemon).
+
+Usage (from .qwen/settings.json, ``-S`` skips site-packages for a faster start):
+
+    python3 -S .qwen/hooks/hook_client.py stop
+    python3 -S .qwen/hooks/hook_client.py vault_sync
+
+Only ``json``, ``os``, ``socket`` and ``sys`` are imported on the fast path. If
+the daemon is not reachable it is started in the background for next time and
+the original hook script runs in-process, so behaviour never depends on the
+daemon being up. Set ``QWEN_HOOK_DAEMON=0`` to always run the scripts directly.
+"""
+import json
+import os
+import socket
+import sys
+
+HOOKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.environ.get("QWEN_PROJECT_ROOT") or os.path.dirname(os.path.dirname(HOOKS_DIR))
+VAULT = os.environ.get("VAULT_PATH") or os.path.join(ROOT, "Vault")
+SOCKET_PATH = os.environ.get("QWEN_HOOK_SOCKET", "/tmp/qwen-hook-daemon.sock")
+SCRIPTS = {"stop": "ralph_stop_hook.py", "vault_sync": "vault_sync_hook.py"}
+
+
+def _ask(request: dict) -> dict | None:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(2)
+            sock.connect(SOCKET_PATH)
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            buf = b""
+            while not buf.endswith(b"\n"):
+                chunk = sock.recv(65536)
+                if not chunk:
+                    return None
+                buf += chunk
+        response = json.loads(buf)
+    except (OSError, ValueError):
+        return None
+    return None if "error" in response else response
+
+
+def _start_daemon() -> None:
+    import subprocess
+
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "src.core.hook_daemon"],
+            cwd=ROOT,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def _run_script(hook: str, raw: str) -> None:
+    import io
+    import runpy
+    import site
+
+    site.main()  # started with -S; the hook scripts need site-packages
+    sys.stdin = io.StringIO(raw)
+    script = os.path.join(HOOKS_DIR, SCRIPTS[hook])
+    sys.argv = [script]
+    runpy.run_path(script, run_name="__main__")
+
+
+def main() -> None:
+    hook = sys.argv[1] if len(sys.argv) > 1 else ""
+    if hook not in SCRIPTS:
+        sys.exit(f"usage: hook_client.py {{{'|'.join(SCRIPTS)}}}")
+    raw = sys.stdin.read() if hook == "vault_sync" else ""
+
+    if os.environ.get("QWEN_HOOK_DAEMON", "1") != "0":
+        data = {}
+        if raw.strip():
+            try:
+                data = json.loads(raw)
+            except ValueError:
+                pass
+        response = _ask({"hook": hook, "vault": VAULT, "data": data})
+        if response is not None:
+            if response.get("stdout"):
+                print(response["stdout"])
+            sys.exit(int(response.get("exit", 0)))
+        _start_daemon()
+
+    _run_script(hook, raw)
+
+
+if __name__ == "__main__":
+    main()
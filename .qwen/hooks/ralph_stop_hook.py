@@ -12,7 +12,6 @@ Exit codes (Qwen Code hook spec):
 """
 from __future__ import annotations
 
-import json
 import os
 import sys
 from datetime import datetime
@@ -49,58 +48,62 @@ def _ralph_complete_markers() -> list[Path]:
     return [p for p in DONE_DIR.glob(f"{RALPH_MARKER_PREFIX}*.md")]
 
 
+def hook_record(status: str, pending: int) -> dict:
+    return {
+        "timestamp": datetime.now(ZoneInfo("Asia/Karachi")).isoformat(),
+        "actor": "ralph_stop_hook",
+        "action": "hook_check",
+        "status": status,
+        "pending_items": pending,
+    }
+
+
 def _log_hook_state(status: str, pending: int) -> None:
     """Append hook invocation to today's audit log."""
     try:
-        LOGS_DIR.mkdir(parents=True, exist_ok=True)
-        log_file = LOGS_DIR / f"{datetime.now(ZoneInfo('Asia/Karachi')).strftime('%Y-%m-%d')}.json"
-        record = {
-            "timestamp": datetime.now(ZoneInfo("Asia/Karachi")).isoformat(),
-            "actor": "ralph_stop_hook",
-            "action": "hook_check",
-            "status": status,
-            "pending_items": pending,
-        }
-        entries = []
-        if log_file.exists():
-            try:
-                entries = json.loads(log_file.read_text())
-                if not isinstance(entries, list):
-                    entries = [entries]
-            except Exception:
-                entries = []
-        entries.append(record)
-        log_file.write_text(json.dumps(entries, indent=2))
+        if str(ROOT) not in sys.path:
+            sys.path.insert(0, str(ROOT))
+        from src.core.audit_logger import append_entry
+
+        append_entry(hook_record(status, pending), logs_dir=LOGS_DIR)
     except Exception:
         pass  # Never crash Qwen Code because of logging
 
 
-def main() -> None:
-    pending = _pending_items()
-    markers = _ralph_complete_markers()
+def evaluate(pending_names: list[str], has_marker: bool) -> tuple[int, str, str, int]:
+    """Decide the hook outcome: ``(exit_code, message, status, pending_logged)``.
 
+    Shared with the resident hook daemon (``src.core.hook_daemon``), which
+    keeps the pending list in memory instead of walking the vault.
+    """
     # If there's a completion marker in Done/ → the agent declared it's done
-    if markers:
-        _log_hook_state("complete_via_marker", 0)
-        sys.exit(0)
+    if has_marker:
+        return 0, "", "complete_via_marker", 0
 
     # If there are still pending items → tell Qwen Code to continue
-    if pending:
-        pending_names = [p.name for p in pending[:5]]
-        more = f" (and {len(pending) - 5} more)" if len(pending) > 5 else ""
+    if pending_names:
+        shown = pending_names[:5]
+        more = f" (and {len(pending_names) - 5} more)" if len(pending_names) > 5 else ""
         continue_message = (
-            f"RALPH LOOP: {len(pending)} item(s) still pending in Vault/Needs_Action/. "
-            f"Items: {', '.join(pending_names)}{more}. "
+            f"RALPH LOOP: {len(pending_names)} item(s) still pending in Vault/Needs_Action/. "
+            f"Items: {', '.join(shown)}{more}. "
             f"Continue processing each item: read → reason → write draft to Pending_Approval/. "
             f"When ALL items are processed, write Vault/Done/RALPH_COMPLETE_<timestamp>.md."
         )
-        _log_hook_state("continue", len(pending))
-        print(continue_message)
-        sys.exit(2)  # exit code 2 = inject message and continue
+        return 2, continue_message, "continue", len(pending_names)  # 2 = inject message and continue
 
     # Nothing pending and no marker → all done
-    _log_hook_state("complete_empty_queue", 0)
-    sys.exit(0)
+    return 0, "", "complete_empty_queue", 0
+
+
+def main() -> None:
+    pending = _pending_items()
+    markers = _ralph_complete_markers()
+    code, message, status, logged = evaluate([p.name for p in pending], bool(markers))
+    _log_hook_state(status, logged)
+    if message:
+        print(message)
+    sys.exit(code)
 
 
 if __name__ == "__main__":
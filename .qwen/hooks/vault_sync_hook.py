@@ -16,14 +16,22 @@ ROOT = Path(os.environ.get("QWEN_PROJECT_ROOT", str(Path(__file__).resolve().par
 VAULT = Path(os.environ.get("VAULT_PATH", str(ROOT / "Vault")))
 
 
-def _append_dashboard(message: str) -> None:
+def dashboard_line(data: dict, vault: Path = VAULT) -> str | None:
+    """Dashboard entry for a tool call, or None if it did not touch the vault."""
+    tool = data.get("tool_name", "file_op")
+    path = data.get("path", "")
+    if not (path and vault.name in path):
+        return None
+    stamp = datetime.now(ZoneInfo("Asia/Karachi")).strftime("%Y-%m-%d %H:%M")
+    return f"- [{stamp}] Qwen Code [{tool}] → {Path(path).name}\n"
+
+
+def _append_dashboard(line: str) -> None:
     dashboard = VAULT / "Dashboard.md"
     if not dashboard.exists():
         return
-    stamp = datetime.now(ZoneInfo("Asia/Karachi")).strftime("%Y-%m-%d %H:%M")
-    line = f"- [{stamp}] {message}\n"
-    content = dashboard.read_text()
-    dashboard.write_text(content + line)
+    with dashboard.open("a") as f:
+        f.write(line)
 
 
 def main() -> None:
@@ -31,10 +39,9 @@ def main() -> None:
     try:
         raw = sys.stdin.read()
         data = json.loads(raw) if raw.strip() else {}
-        tool = data.get("tool_name", "file_op")
-        path = data.get("path", "")
-        if path and VAULT.name in path:
-            _append_dashboard(f"Qwen Code [{tool}] → {Path(path).name}")
+        line = dashboard_line(data)
+        if line:
+            _append_dashboard(line)
     except Exception:
         pass  # Never crash Qwen Code
     sys.exit(0)
@@ -0,0 +1,284 @@
+"""SQLite index over the audit log for fast filtered queries.
+
+The index lives at ``Logs/.audit_index.sqlite3`` and is derived entirely from the
+day files: a per-day cursor records how far each ``.jsonl`` has been ingested,
+so ``sync()`` only reads newly appended lines. Once the index exists, the
+background audit writer keeps it current batch by batch; inline writes leave
+it to ``query()``, which catches up before running.
+
+    python -m src.core.audit_index query --action-type email_send --result-prefix error --last 7
+    python -m src.core.audit_index query --target INVOICE_Acme_20260309_191303.md
+"""
+from __future__ import annotations
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from collections.abc import Iterator
+
+from src.core.audit_logger import (
+    COMPACT_SUFFIX,
+    LEGACY_SUFFIX,
+    LOG_SUFFIX,
+    LOG_TZ,
+    _iter_compressed,
+    _iter_legacy,
+    log_days,
+    read_appended,
+)
+from src.core.config import get_vault_path
+from src.core.lazy import lazy_import
+
+
+# Writers import this module on every append but only need sqlite3 once an
+# index exists.
+argparse = lazy_import("argparse")
+sqlite3 = lazy_import("sqlite3")
+
+INDEX_NAME = ".audit_index.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    day TEXT NOT NULL,
+    ts TEXT,
+    action_type TEXT,
+    target TEXT,
+    actor TEXT,
+    approval_status TEXT,
+    result TEXT,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_entries_ts ON entries (ts);
+CREATE INDEX IF NOT EXISTS ix_entries_day ON entries (day);
+CREATE INDEX IF NOT EXISTS ix_entries_action_ts ON entries (action_type, ts);
+CREATE INDEX IF NOT EXISTS ix_entries_target_ts ON entries (target, ts);
+CREATE INDEX IF NOT EXISTS ix_entries_actor_ts ON entries (actor, ts);
+CREATE TABLE IF NOT EXISTS cursors (
+    day TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    legacy TEXT
+);
+"""
+
+
+def index_path(logs_dir: Path | None = None) -> Path:
+    return (logs_dir or get_vault_path() / "Logs") / INDEX_NAME
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _row(day: str, entry: dict) -> tuple:
+    return (
+        day,
+        entry.get("timestamp"),
+        entry.get("action_type") or entry.get("action"),
+        None if entry.get("target") is None else str(entry.get("target")),
+        entry.get("actor"),
+        entry.get("approval_status"),
+        None if entry.get("result") is None else str(entry.get("result")),
+        json.dumps(entry, ensure_ascii=False),
+    )
+
+
+def _insert(conn: sqlite3.Connection, rows: list[tuple]) -> None:
+    conn.executemany(
+        "INSERT INTO entries (day, ts, action_type, target, actor, approval_status, result, raw)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+
+
+def _legacy_signature(path: Path) -> str | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def _sync_day(conn: sqlite3.Connection, logs_dir: Path, day: str) -> int:
+    cur = conn.execute("SELECT offset, legacy FROM cursors WHERE day = ?", (day,)).fetchone()
+    offset, legacy = cur if cur else (0, None)
+    # The part of the day before its .jsonl is the archive once the day is
+    # compacted, else the legacy array; its signature sits in the legacy column.
+    archive = logs_dir / f"{day}{COMPACT_SUFFIX}"
+    archive_sig = _legacy_signature(archive)
+    if archive_sig is not None:
+        base_sig, base = f"gz:{archive_sig}", lambda: _iter_compressed(archive)
+    else:
+        legacy_file = logs_dir / f"{day}{LEGACY_SUFFIX}"
+        base_sig, base = _legacy_signature(legacy_file), lambda: _iter_legacy(legacy_file)
+    log_file = logs_dir / f"{day}{LOG_SUFFIX}"
+    try:
+        size = log_file.stat().st_size
+    except FileNotFoundError:
+        size = None
+
+    if cur and base_sig == legacy and (size is None or size == offset):
+        return 0
+
+    added = 0
+    if base_sig != legacy or (size is not None and size < offset):
+        # Legacy file rewritten, day compacted or .jsonl replaced (migrate):
+        # re-ingest the day.
+        conn.execute("DELETE FROM entries WHERE day = ?", (day,))
+        offset = 0
+        rows = [_row(day, e) for e in base()] if base_sig else []
+        _insert(conn, rows)
+        added += len(rows)
+
+    if size is not None:
+        entries, offset = read_appended(log_file, offset)
+        _insert(conn, [_row(day, e) for e in entries])
+        added += len(entries)
+
+    conn.execute(
+        "INSERT OR REPLACE INTO cursors (day, offset, legacy) VALUES (?, ?, ?)",
+        (day, offset, base_sig),
+    )
+    return added
+
+
+def sync(logs_dir: Path | None = None, days: list[str] | None = None) -> int:
+    """Ingest new log lines into the index. Returns the number of rows added."""
+    logs_dir = logs_dir or get_vault_path() / "Logs"
+    conn = _connect(index_path(logs_dir))
+    try:
+        # IMMEDIATE takes the write lock before reading cursors, so two
+        # processes syncing at once cannot ingest the same lines twice.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            added = sum(_sync_day(conn, logs_dir, day) for day in (days or log_days(logs_dir)))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return added
+    finally:
+        conn.close()
+
+
+def query(
+    logs_dir: Path | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    action_type: str | None = None,
+    target: str | None = None,
+    actor: str | None = None,
+    approval_status: str | None = None,
+    result_prefix: str | None = None,
+    contains: str | None = None,
+    limit: int | None = None,
+    newest_first: bool = False,
+    refresh: bool = True,
+) -> Iterator[dict]:
+    """Stream matching entries ordered by timestamp.
+
+    ``since``/``until`` are ISO timestamps or dates compared against the entry
+    timestamp (``until`` as a bare date includes that whole day).
+    """
+    logs_dir = logs_dir or get_vault_path() / "Logs"
+    if refresh:
+        sync(logs_dir)
+    clauses: list[str] = []
+    params: list = []
+    if since:
+        clauses.append("ts >= ?")
+        params.append(since)
+    if until:
+        clauses.append("ts < ?")
+        params.append(until + "\uffff" if len(until) == 10 else until)
+    for column, value in (
+        ("action_type", action_type),
+        ("target", target),
+        ("actor", actor),
+        ("approval_status", approval_status),
+    ):
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    if result_prefix:
+        clauses.append("result >= ? AND result < ?")
+        params.extend([result_prefix, result_prefix + "\uffff"])
+    if contains:
+        clauses.append("instr(raw, ?) > 0")
+        params.append(contains)
+
+    sql = "SELECT raw FROM entries"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY ts DESC, id DESC" if newest_first else " ORDER BY ts, id"
+    if limit:
+        sql += " LIMIT ?"
+        params.append(int(limit))
+
+    conn = _connect(index_path(logs_dir))
+    try:
+        cursor = conn.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(500)
+            if not rows:
+                break
+            for (raw,) in rows:
+                yield json.loads(raw)
+    finally:
+        conn.close()
+
+
+def sync_if_enabled(logs_dir: Path, day: str) -> None:
+    """Keep an existing index current after a write; never creates one."""
+    if index_path(logs_dir).exists():
+        sync(logs_dir, days=[day])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query the Vault audit log index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("sync", help="Build or update the index")
+    q = sub.add_parser("query", help="Stream matching entries as JSON lines")
+    q.add_argument("--since", help="ISO timestamp or YYYY-MM-DD (inclusive)")
+    q.add_argument("--until", help="ISO timestamp or YYYY-MM-DD (inclusive for dates)")
+    q.add_argument("--last", type=int, metavar="DAYS", help="Only the trailing N days")
+    q.add_argument("--action-type")
+    q.add_argument("--target")
+    q.add_argument("--actor")
+    q.add_argument("--approval-status")
+    q.add_argument("--result-prefix", help="e.g. 'error' matches 'error: auth failed'")
+    q.add_argument("--contains", help="Substring anywhere in the raw entry")
+    q.add_argument("--limit", type=int)
+    q.add_argument("--newest-first", action="store_true")
+    args = parser.parse_args()
+
+    if args.command == "sync":
+        print(f"Indexed {sync()} new entries into {index_path()}")
+        return
+
+    since = args.since
+    if args.last:
+        since = (datetime.now(LOG_TZ) - timedelta(days=args.last - 1)).strftime("%Y-%m-%d")
+    for entry in query(
+        since=since,
+        until=args.until,
+        action_type=args.action_type,
+        target=args.target,
+        actor=args.actor,
+        approval_status=args.approval_status,
+        result_prefix=args.result_prefix,
+        contains=args.contains,
+        limit=args.limit,
+        newest_first=args.newest_first,
+    ):
+        sys.stdout.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,283 @@
+"""Append-only audit log for Vault/Logs.
+
+Each day is one line-delimited JSON file (``YYYY-MM-DD.jsonl``). Writers append a
+single line per entry, so logging cost no longer grows with the size of the day.
+Legacy ``YYYY-MM-DD.json`` array files are still read transparently and can be
+converted with ``python -m src.core.audit_logger migrate``.
+
+Closed days can be compacted (``python -m src.core.audit_logger compact``) into
+``YYYY-MM-DD.jsonl.gz``: a sequence of independent gzip members of up to
+``BLOCK_LINES`` lines each (so plain ``zcat`` still works), with a small block
+index in ``Logs/.blocks/`` that lets readers skip blocks by timestamp.
+
+Set ``AUDIT_LOG_ASYNC=true`` (or call ``enable_background_writer()``) to move the
+disk writes off the caller's thread: entries go into a bounded queue and a
+background thread writes them in batches with one fsync per file per batch.
+"""
+from __future__ import annotations
+
+import atexit
 import json
+import logging
+import os
+import queue
+import re
+import signal
+import threading
+import time
+from collections import deque
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
+from collections.abc import Iterator
 from zoneinfo import ZoneInfo
 
-from src.core.config import get_vault_path
+from src.core.config import get_bool, get_vault_path
+from src.core.lazy import lazy_import
+
+
+logger = logging.getLogger(__name__)
 
+# Hooks append one entry and exit; only compaction and the CLI need these.
+argparse = lazy_import("argparse")
+gzip = lazy_import("gzip")
 
-def _log_path() -> Path:
-    vault = get_vault_path()
-    logs_dir = vault / "Logs"
+LOG_TZ = ZoneInfo("Asia/Karachi")
+LOG_SUFFIX = ".jsonl"
+LEGACY_SUFFIX = ".json"
+COMPACT_SUFFIX = ".jsonl.gz"
+ASIDE_SUFFIX = ".compacting"  # a day's files while compact_day reads them
+BLOCKS_DIR = ".blocks"
+BLOCK_LINES = 1000
+_DAY_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _logs_dir(logs_dir: Path | None = None) -> Path:
+    logs_dir = logs_dir or get_vault_path() / "Logs"
     logs_dir.mkdir(parents=True, exist_ok=True)
-    filename = datetime.now(ZoneInfo("Asia/Karachi")).strftime("%Y-%m-%d.json")
-    return logs_dir / filename
+    return logs_dir
+
+
+def _today() -> str:
+    return datetime.now(LOG_TZ).strftime("%Y-%m-%d")
+
+
+def _log_path(logs_dir: Path | None = None, day: str | None = None) -> Path:
+    return _logs_dir(logs_dir) / f"{day or _today()}{LOG_SUFFIX}"
+
+
+def _append_bytes(path: Path, data: bytes, fsync: bool = False) -> int | None:
+    """Append ``data`` with O_APPEND so concurrent writers never overwrite each other.
+
+    Every process opens the file in append mode and hands the kernel one buffer
+    per entry (or per batch), so no lock is needed: the kernel places each write
+    at the current end of file. Returns the offset where ``data`` starts, or
+    None if the write had to be split (disk full or interrupted).
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        view = memoryview(data)
+        written = os.write(fd, view)
+        start: int | None = os.lseek(fd, 0, os.SEEK_CUR) - written
+        while written < len(view):
+            logger.warning("Short audit write to %s (%s of %s bytes)", path.name, written, len(view))
+            view = view[written:]
+            written = os.write(fd, view)
+            start = None
+        if fsync:
+            os.fsync(fd)
+        return start
+    finally:
+        os.close(fd)
+
+
+def _write_line(path: Path, line: bytes) -> None:
+    _after_append(path, _append_bytes(path, line), line)
+
+
+def _after_append(path: Path, start: int | None, data: bytes, index: bool = False) -> None:
+    """Fold freshly appended lines into the day's rollup and, if ``index``, the index.
+
+    Only the background writer's batches sync the index: on an inline write
+    that would put a SQLite transaction on the caller's path, and
+    ``audit_index.query()`` catches up before it runs anyway.
+    """
+    from src.core.audit_rollup import fold_appended
+
+    # Both are derived data and catch up on the next refresh, so a failure in
+    # one is logged and does not stop the other.
+    try:
+        fold_appended(path.stem, path.parent, start, data)
+    except Exception as exc:
+        logger.warning("Audit rollup update for %s failed: %s", path.stem, exc)
+    if not index:
+        return
+    try:
+        from src.core.audit_index import sync_if_enabled
+
+        sync_if_enabled(path.parent, path.stem)
+    except Exception as exc:
+        logger.warning("Audit index update for %s failed: %s", path.stem, exc)
+
+
+# ─── Background writer ───────────────────────────────────────────────────
+
+class BackgroundWriter:
+    """Bounded queue drained by a daemon thread in size/time-bounded batches."""
+
+    def __init__(self, max_queue: int = 10000, batch_size: int = 256, flush_interval: float = 1.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: Path, line: bytes) -> None:
+        if self._closed:
+            _write_line(path, line)
+            return
+        try:
+            self._queue.put_nowait((path, line))
+        except queue.Full:
+            # Backpressure: never drop an audit entry, pay the write inline instead.
+            _write_line(path, line)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until everything queued so far is on disk."""
+        if self._closed:
+            # Nothing reads the queue any more; close() drains it on the way out.
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch: list[tuple[Path, bytes]] = []
+            waiters: list[threading.Event] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if stop or waiters or len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if stop:
+                batch.extend(self._drain())
+            self._write_batch(batch)
+            for event in waiters:
+                event.set()
+
+    def _drain(self) -> list[tuple[Path, bytes]]:
+        rest = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return rest
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is not None:
+                rest.append(item)
+
+    def _write_batch(self, batch: list[tuple[Path, bytes]]) -> None:
+        by_path: dict[Path, list[bytes]] = {}
+        for path, line in batch:
+            by_path.setdefault(path, []).append(line)
+        for path, lines in by_path.items():
+            data = b"".join(lines)
+            try:
+                start = _append_bytes(path, data, fsync=True)
+            except OSError as exc:
+                logger.error("Audit batch write to %s failed: %s", path, exc)
+                continue
+            _after_append(path, start, data, index=True)
+
+
+_writer: BackgroundWriter | None = None
+_writer_lock = threading.Lock()
+_async_checked = False
+
+
+def enable_background_writer(
+    max_queue: int = 10000,
+    batch_size: int = 256,
+    flush_interval: float = 1.0,
+) -> BackgroundWriter:
+    """Route audit writes through a background thread for this process.
+
+    The queue is flushed at interpreter exit and on SIGTERM.
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = BackgroundWriter(max_queue, batch_size, flush_interval)
+            atexit.register(_writer.close)
+            _install_signal_flush()
+        return _writer
+
+
+def flush(timeout: float | None = 5.0) -> None:
+    """Wait until queued audit entries are written (no-op in synchronous mode)."""
+    if _writer is not None:
+        _writer.flush(timeout)
+
+
+def _install_signal_flush() -> None:
+    if threading.current_thread() is not threading.main_thread():
+        return
+    previous = signal.getsignal(signal.SIGTERM)
+
+    def _handler(signum, frame):
+        if _writer is not None:
+            _writer.close()
+        if callable(previous):
+            previous(signum, frame)
+        elif previous != signal.SIG_IGN:
+            raise SystemExit(128 + signum)
+
+    signal.signal(signal.SIGTERM, _handler)
+
+
+def _active_writer() -> BackgroundWriter | None:
+    global _async_checked
+    if not _async_checked:
+        _async_checked = True
+        if get_bool("AUDIT_LOG_ASYNC", False):
+            enable_background_writer()
+    return _writer
+
+
+def append_entry(entry: dict, logs_dir: Path | None = None) -> None:
+    """Append one entry to today's log as a single JSON line."""
+    line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+    path = _log_path(logs_dir)
+    writer = _active_writer()
+    if writer is not None:
+        writer.submit(path, line)
+    else:
+        _write_line(path, line)
 
 
 def log_action(
@@ -24,7 +290,7 @@ def log_action(
     actor: str = "qwen_code",
 ) -> None:
     entry = {
-        "timestamp": datetime.now(ZoneInfo("Asia/Karachi")).isoformat(),
+        "timestamp": datetime.now(LOG_TZ).isoformat(),
         "action_type": action_type,
         "actor": actor,
         "target": target,
@@ -33,10 +299,317 @@ def log_action(
         "approved_by": approved_by,
         "result": result,
     }
-    path = _log_path()
-    if path.exists():
-        content = json.loads(path.read_text())
+    append_entry(entry)
+
+
+# ─── Readers ─────────────────────────────────────────────────────────────
+
+def _day_of(name: str) -> str | None:
+    if name.endswith(ASIDE_SUFFIX):
+        name = name[: -len(ASIDE_SUFFIX)]
+    for suffix in (COMPACT_SUFFIX, LOG_SUFFIX, LEGACY_SUFFIX):
+        if name.endswith(suffix):
+            day = name[: -len(suffix)]
+            return day if _DAY_RE.match(day) else None
+    return None
+
+
+def log_days(logs_dir: Path | None = None) -> list[str]:
+    """Sorted list of days (YYYY-MM-DD) that have a log in any format."""
+    logs_dir = logs_dir or get_vault_path() / "Logs"
+    if not logs_dir.exists():
+        return []
+    days = set()
+    for path in logs_dir.iterdir():
+        if path.name.startswith("."):
+            continue
+        day = _day_of(path.name)
+        if day:
+            days.add(day)
+    return sorted(days)
+
+
+def _iter_legacy(path: Path) -> Iterator[dict]:
+    try:
+        content = json.loads(path.read_text(encoding="utf-8", errors="ignore"))
+    except (OSError, ValueError):
+        return
+    if isinstance(content, dict):
+        content = [content]
+    if isinstance(content, list):
+        yield from (e for e in content if isinstance(e, dict))
+
+
+def _iter_lines(path: Path) -> Iterator[dict]:
+    try:
+        f = path.open("r", encoding="utf-8", errors="ignore")
+    except OSError:
+        return
+    with f:
+        # Torn or hand-edited lines are skipped rather than aborting the day.
+        yield from _parse_lines(f)
+
+
+def read_appended(path: Path, offset: int) -> tuple[list[dict], int]:
+    """Entries in complete lines after byte ``offset``, and the new offset.
+
+    A trailing partial line (a writer mid-append) is left for the next call.
+    """
+    try:
+        with path.open("rb") as f:
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        return [], offset
+    end = data.rfind(b"\n") + 1
+    entries = []
+    for raw in data[:end].splitlines():
+        if not raw.strip():
+            continue
+        try:
+            entry = json.loads(raw)
+        except ValueError:
+            continue
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries, offset + end
+
+
+def _blocks_path(logs_dir: Path, day: str) -> Path:
+    return logs_dir / BLOCKS_DIR / f"{day}.json"
+
+
+def _iter_compressed(path: Path, since: str | None = None) -> Iterator[dict]:
+    """Yield entries from a compacted day, skipping blocks that end before ``since``."""
+    blocks = None
+    if since:
+        try:
+            blocks = json.loads(_blocks_path(path.parent, path.name[: -len(COMPACT_SUFFIX)]).read_text())["blocks"]
+        except (OSError, ValueError, KeyError):
+            blocks = None
+    try:
+        if blocks is None:
+            with gzip.open(path, "rt", encoding="utf-8", errors="ignore") as f:
+                yield from _parse_lines(f)
+            return
+        with path.open("rb") as f:
+            for offset, length, _count, _first_ts, last_ts in blocks:
+                if last_ts and last_ts < since:
+                    continue
+                f.seek(offset)
+                text = gzip.decompress(f.read(length)).decode("utf-8", errors="ignore")
+                yield from _parse_lines(text.splitlines())
+    except (OSError, EOFError) as exc:
+        logger.warning("Could not read compacted log %s: %s", path.name, exc)
+
+
+def _parse_lines(lines) -> Iterator[dict]:
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(entry, dict):
+            yield entry
+
+
+def _aside_files(logs_dir: Path, day: str) -> list[Path]:
+    names = (f"{day}{LEGACY_SUFFIX}{ASIDE_SUFFIX}", f"{day}{LOG_SUFFIX}{ASIDE_SUFFIX}")
+    return [logs_dir / name for name in names if (logs_dir / name).exists()]
+
+
+def _iter_source(path: Path) -> Iterator[dict]:
+    """Entries of a day file, possibly renamed aside, in its own format."""
+    name = path.name.removesuffix(ASIDE_SUFFIX)
+    return _iter_legacy(path) if name.endswith(LEGACY_SUFFIX) else _iter_lines(path)
+
+
+def iter_day(day: str, logs_dir: Path | None = None, since: str | None = None) -> Iterator[dict]:
+    """Yield one day's entries lazily.
+
+    Compacted days are read from their ``.jsonl.gz`` (blocks before ``since``, an
+    ISO timestamp, are skipped), followed by lines appended after compaction;
+    otherwise the legacy array comes first, then the appended lines.
+    """
+    logs_dir = logs_dir or get_vault_path() / "Logs"
+    compacted = logs_dir / f"{day}{COMPACT_SUFFIX}"
+    if compacted.exists():
+        # Aside files next to an archive are being folded into it.
+        yield from _iter_compressed(compacted, since)
     else:
-        content = []
-    content.append(entry)
-    path.write_text(json.dumps(content, indent=2))
+        yield from _iter_legacy(logs_dir / f"{day}{LEGACY_SUFFIX}")
+        for aside in _aside_files(logs_dir, day):
+            yield from _iter_source(aside)
+    yield from _iter_lines(logs_dir / f"{day}{LOG_SUFFIX}")
+
+
+def iter_entries(
+    logs_dir: Path | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> Iterator[dict]:
+    """Yield entries from all days in [since, until] (inclusive, YYYY-MM-DD)."""
+    logs_dir = logs_dir or get_vault_path() / "Logs"
+    for day in log_days(logs_dir):
+        if since and day < since:
+            continue
+        if until and day > until:
+            break
+        yield from iter_day(day, logs_dir)
+
+
+# ─── Migration ───────────────────────────────────────────────────────────
+
+def migrate_legacy_logs(logs_dir: Path | None = None, grace_seconds: int = 3600) -> int:
+    """Convert closed legacy ``.json`` days to ``.jsonl``. Returns days migrated.
+
+    Today, and any day whose ``.jsonl`` was written within ``grace_seconds``, is
+    left alone because other processes may still be appending to it; the
+    readers merge both formats anyway.
+    """
+    logs_dir = _logs_dir(logs_dir)
+    today = _today()
+    cutoff = time.time() - grace_seconds
+    migrated = 0
+    for legacy in sorted(logs_dir.glob(f"*{LEGACY_SUFFIX}")):
+        day = legacy.stem
+        if legacy.name.startswith(".") or not _DAY_RE.match(day) or day == today:
+            continue
+        target = logs_dir / f"{day}{LOG_SUFFIX}"
+        existed = target.exists()
+        if existed and target.stat().st_mtime > cutoff:
+            continue
+        tmp = logs_dir / f".{day}{LOG_SUFFIX}.{os.getpid()}.tmp"
+        with tmp.open("w", encoding="utf-8") as out:
+            for entry in _iter_legacy(legacy):
+                out.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            if existed:
+                with target.open("r", encoding="utf-8", errors="ignore") as existing:
+                    for line in existing:
+                        out.write(line)
+        if existed:
+            os.replace(tmp, target)
+        else:
+            # link() refuses to clobber, so a writer that created the day in
+            # the meantime wins and we retry on the next run.
+            try:
+                os.link(tmp, target)
+            except FileExistsError:
+                continue
+            finally:
+                tmp.unlink()
+        legacy.unlink()
+        migrated += 1
+    return migrated
+
+
+# ─── Compaction ──────────────────────────────────────────────────────────
+
+def compact_day(day: str, logs_dir: Path | None = None, block_lines: int = BLOCK_LINES) -> int:
+    """Rewrite one day as blocked gzip plus block index. Returns entries written.
+
+    The day's files are renamed aside (``ASIDE_SUFFIX``) before they are read,
+    so a late append goes to a fresh ``.jsonl`` instead of into a file about to
+    be deleted. ``iter_day`` reads that file after the archive, and the next
+    run folds it into the archive.
+    """
+    logs_dir = _logs_dir(logs_dir)
+    target = logs_dir / f"{day}{COMPACT_SUFFIX}"
+    leftovers = _aside_files(logs_dir, day)
+    if leftovers and target.exists() and _archived(target, leftovers):
+        # An interrupted run replaced the archive but did not delete these.
+        for src in leftovers:
+            src.unlink()
+    for suffix in (LEGACY_SUFFIX, LOG_SUFFIX):
+        src = logs_dir / f"{day}{suffix}"
+        aside = src.with_name(src.name + ASIDE_SUFFIX)
+        # A leftover aside file is compacted first; the newer file waits for
+        # the next run.
+        if src.exists() and not aside.exists():
+            os.replace(src, aside)
+    sources = _aside_files(logs_dir, day)
+    if not sources:
+        return 0
+
+    blocks: list[list] = []
+    tmp = logs_dir / f".{day}{COMPACT_SUFFIX}.tmp"
+    written = 0
+    with tmp.open("wb") as out:
+        chunk: list[dict] = []
+
+        def _flush_block() -> None:
+            data = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in chunk).encode("utf-8")
+            member = gzip.compress(data, compresslevel=6, mtime=0)
+            blocks.append([out.tell(), len(member), len(chunk),
+                           chunk[0].get("timestamp", ""), chunk[-1].get("timestamp", "")])
+            out.write(member)
+
+        entries = _iter_compressed(target) if target.exists() else iter(())
+        for entry in chain(entries, *(_iter_source(src) for src in sources)):
+            chunk.append(entry)
+            written += 1
+            if len(chunk) >= block_lines:
+                _flush_block()
+                chunk = []
+        if chunk:
+            _flush_block()
+        out.flush()
+        os.fsync(out.fileno())
+
+    blocks_path = _blocks_path(logs_dir, day)
+    blocks_path.parent.mkdir(parents=True, exist_ok=True)
+    blocks_path.write_text(json.dumps({"day": day, "block_lines": block_lines, "blocks": blocks}))
+    os.replace(tmp, target)
+    for src in sources:
+        src.unlink()
+    return written
+
+
+def _archived(archive: Path, sources: list[Path]) -> bool:
+    """True if the entries of ``sources`` are the tail of ``archive``."""
+    tail = list(chain.from_iterable(_iter_source(src) for src in sources))
+    return not tail or list(deque(_iter_compressed(archive), maxlen=len(tail))) == tail
+
+
+def compact_closed_days(logs_dir: Path | None = None, grace_seconds: int = 3600) -> list[str]:
+    """Compact every day before today whose files have been quiet for ``grace_seconds``."""
+    logs_dir = _logs_dir(logs_dir)
+    today = _today()
+    cutoff = time.time() - grace_seconds
+    compacted = []
+    for day in log_days(logs_dir):
+        if day >= today:
+            continue
+        sources = [
+            logs_dir / f"{day}{suffix}{aside}"
+            for suffix in (LEGACY_SUFFIX, LOG_SUFFIX)
+            for aside in ("", ASIDE_SUFFIX)
+        ]
+        if any(p.exists() and p.stat().st_mtime > cutoff for p in sources):
+            continue
+        if any(p.exists() for p in sources):
+            compact_day(day, logs_dir)
+            compacted.append(day)
+    return compacted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Vault audit log maintenance")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("migrate", help="Convert closed legacy .json days to .jsonl")
+    compact = sub.add_parser("compact", help=f"Compress closed days to {COMPACT_SUFFIX}")
+    compact.add_argument("--grace-seconds", type=int, default=3600,
+                         help="Skip days written to more recently than this")
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        print(f"Migrated {migrate_legacy_logs()} day(s) to {LOG_SUFFIX}")
+    elif args.command == "compact":
+        days = compact_closed_days(grace_seconds=args.grace_seconds)
+        print(f"Compacted {len(days)} day(s) to {COMPACT_SUFFIX}")
+
+
+if __name__ == "__main__":
+    main()
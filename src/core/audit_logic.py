@@ -1,3 +1,15 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
 SUBSCRIPTION_PATTERNS = {
     "netflix.com": "Netflix",
     "spotify.com": "Spotify",
@@ -6,15 +18,174 @@ SUBSCRIPTION_PATTERNS = {
     "slack.com": "Slack",
 }
 
+# Extra merchant patterns, one per line: ``- pattern: Merchant Name``.
+PATTERNS_FILE = Path("Accounting") / "Merchant_Patterns.md"
+RELOAD_CHECK_SECONDS = 2.0
+
+
+# ─── Multi-pattern matcher ───────────────────────────────────────────────
+
+class MerchantMatcher:
+    """Aho-Corasick automaton over lower-cased merchant patterns.
+
+    Built once; each scan walks the text a single time no matter how many
+    patterns there are. When several patterns occur, the one listed first
+    wins, matching the old loop over ``SUBSCRIPTION_PATTERNS``.
+    """
+
+    def __init__(self, patterns: Mapping[str, str]):
+        self.patterns = [(p.lower(), name) for p, name in patterns.items() if p]
+        self._goto: list[dict[str, int]] = [{}]
+        # Lowest pattern index ending at each state (following fail links), or -1.
+        self._best: list[int] = [-1]
+        # Every pattern index ending at each state (following fail links).
+        self._out: list[tuple[int, ...]] = [()]
+        self._build()
+
+    def _build(self) -> None:
+        goto, best, out = self._goto, self._best, self._out
+        for index, (pattern, _) in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    best.append(-1)
+                    out.append(())
+                state = nxt
+            if index not in out[state]:  # duplicate keys after lower-casing keep the first
+                out[state] += (index,)
+                if best[state] < 0:
+                    best[state] = index
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                inherited = fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] += out[inherited]
+                if best[inherited] >= 0 and (best[nxt] < 0 or best[inherited] < best[nxt]):
+                    best[nxt] = best[inherited]
+        self._fail = fail
+
+    def _scan(self, text: str):
+        goto, fail = self._goto, self._fail
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            yield state
+
+    def first(self, text: str) -> str | None:
+        """Name of the highest-priority pattern found in ``text``, if any."""
+        best = self._best
+        found = -1
+        for state in self._scan(text.lower()):
+            index = best[state]
+            if index >= 0 and (found < 0 or index < found):
+                found = index
+                if found == 0:
+                    break
+        return None if found < 0 else self.patterns[found][1]
+
+    def names_in(self, text: str) -> set[str]:
+        """Names of every pattern that occurs in ``text``."""
+        out = self._out
+        hits: set[int] = set()
+        for state in self._scan(text.lower()):
+            if out[state]:
+                hits.update(out[state])
+        return {self.patterns[i][1] for i in hits}
+
+
+def load_patterns(path: Path) -> dict[str, str]:
+    """Parse ``- pattern: Name`` lines; anything else in the file is ignored."""
+    patterns: dict[str, str] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line.startswith(("- ", "* ")) or ":" not in line:
+            continue
+        pattern, _, name = line[2:].partition(":")
+        pattern, name = pattern.strip().strip("`").lower(), name.strip()
+        if pattern and name:
+            patterns.setdefault(pattern, name)
+    return patterns
+
+
+_matcher: MerchantMatcher | None = None
+_source: tuple[Path | None, int | None] = (None, None)
+_next_check = 0.0
+_matcher_lock = threading.Lock()
+
+
+def _patterns_path() -> Path | None:
+    from src.core.config import get_vault_path
+
+    try:
+        return get_vault_path() / PATTERNS_FILE
+    except RuntimeError:
+        return None
+
+
+def get_matcher() -> MerchantMatcher:
+    """Matcher for the built-in patterns plus the vault's pattern file.
+
+    The file is re-checked at most every RELOAD_CHECK_SECONDS and the
+    automaton is rebuilt only when its mtime changes; built-in patterns come
+    first, so they win over a file entry for the same text.
+    """
+    global _matcher, _source, _next_check
+    current = _matcher
+    if current is not None and time.monotonic() < _next_check:
+        return current
+    with _matcher_lock:
+        path = _patterns_path()
+        try:
+            mtime = path.stat().st_mtime_ns if path else None
+        except OSError:
+            mtime = None
+        if _matcher is None or (path, mtime) != _source:
+            patterns = dict(SUBSCRIPTION_PATTERNS)
+            if mtime is not None:
+                try:
+                    for pattern, name in load_patterns(path).items():
+                        patterns.setdefault(pattern, name)
+                except (OSError, UnicodeDecodeError) as exc:
+                    logger.error("Ignoring merchant patterns in %s: %s", path, exc)
+            _matcher = MerchantMatcher(patterns)
+            _source = (path, mtime)
+        _next_check = time.monotonic() + RELOAD_CHECK_SECONDS
+        return _matcher
+
+
+# ─── Transaction analysis ────────────────────────────────────────────────
+
+def _subscription(transaction: dict, name: str | None):
+    if name is None:
+        return None
+    return {
+        "type": "subscription",
+        "name": name,
+        "amount": transaction.get("amount"),
+        "date": transaction.get("date"),
+    }
+
+
+def analyze_transaction(transaction: dict, matcher: MerchantMatcher | None = None):
+    matcher = matcher or get_matcher()
+    return _subscription(transaction, matcher.first(str(transaction.get("description", ""))))
+
 
-def analyze_transaction(transaction: dict):
-    description = str(transaction.get("description", "")).lower()
-    for pattern, name in SUBSCRIPTION_PATTERNS.items():
-        if pattern in description:
-            return {
-                "type": "subscription",
-                "name": name,
-                "amount": transaction.get("amount"),
-                "date": transaction.get("date"),
-            }
-    return None
+def analyze_transactions(transactions: Iterable[dict], matcher: MerchantMatcher | None = None) -> list:
+    """``analyze_transaction`` for each transaction, sharing one matcher."""
+    matcher = matcher or get_matcher()
+    first = matcher.first
+    return [_subscription(t, first(str(t.get("description", "")))) for t in transactions]
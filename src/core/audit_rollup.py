@@ -0,0 +1,210 @@
+"""Per-day rollup counters for the audit log.
+
+Each day's ``Logs/.rollup/YYYY-MM-DD.json`` holds entry counts by action_type,
+approval_status, result and actor, plus the byte offset of the day's ``.jsonl``
+that has already been folded in. Writers fold their own lines in as they
+append; readers refresh by reading only the bytes appended since that offset,
+so dashboard/briefing queries cost O(days) instead of O(entries). Because the
+offset and the counts are saved together, two processes updating the same day
+at once never double-count; the slower one just re-reads a few lines next time.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.core.audit_logger import (
+    COMPACT_SUFFIX,
+    LEGACY_SUFFIX,
+    LOG_SUFFIX,
+    LOG_TZ,
+    _iter_compressed,
+    _iter_legacy,
+    log_days,
+    read_appended,
+)
+from src.core.config import get_vault_path
+
+
+ROLLUP_DIR = ".rollup"
+ROLLUP_FIELDS = ("action_type", "approval_status", "result", "actor")
+
+
+def _empty(day: str) -> dict:
+    return {
+        "day": day,
+        "offset": 0,
+        "legacy": None,
+        "compacted": False,
+        "entries": 0,
+        "counts": {field: {} for field in ROLLUP_FIELDS},
+    }
+
+
+def _rollup_path(logs_dir: Path, day: str) -> Path:
+    return logs_dir / ROLLUP_DIR / f"{day}.json"
+
+
+def _fold(rollup: dict, entry: dict) -> None:
+    rollup["entries"] += 1
+    counts = rollup["counts"]
+    for field in ROLLUP_FIELDS:
+        value = entry.get(field)
+        if value is None:
+            continue
+        bucket = counts[field]
+        key = str(value)
+        bucket[key] = bucket.get(key, 0) + 1
+
+
+def _load(path: Path, day: str) -> dict:
+    try:
+        rollup = json.loads(path.read_text())
+        if rollup.get("day") == day and "counts" in rollup:
+            return rollup
+    except (OSError, ValueError):
+        pass
+    return _empty(day)
+
+
+def _save(path: Path, rollup: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per thread too: the background writer and the main loop both save.
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(rollup, separators=(",", ":")))
+    os.replace(tmp, path)
+
+
+def _legacy_signature(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _fold_base(rollup: dict, logs_dir: Path, day: str) -> None:
+    """Fold the part of the day before its ``.jsonl``: the archive or the legacy array."""
+    if rollup.get("compacted"):
+        entries = _iter_compressed(logs_dir / f"{day}{COMPACT_SUFFIX}")
+    else:
+        entries = _iter_legacy(logs_dir / f"{day}{LEGACY_SUFFIX}")
+    for entry in entries:
+        _fold(rollup, entry)
+
+
+def refresh_rollup(day: str, logs_dir: Path | None = None) -> dict:
+    """Bring one day's rollup up to date with its log files and return it."""
+    logs_dir = logs_dir or get_vault_path() / "Logs"
+    path = _rollup_path(logs_dir, day)
+    rollup = _load(path, day)
+    dirty = False
+
+    archive_sig = _legacy_signature(logs_dir / f"{day}{COMPACT_SUFFIX}")
+    if archive_sig is not None:
+        if archive_sig != rollup.get("compacted"):
+            # Closed day, or late lines were folded into its archive: count it
+            # again. Lines appended after compaction follow via the offset.
+            rollup = _empty(day)
+            rollup["compacted"] = archive_sig
+            _fold_base(rollup, logs_dir, day)
+            dirty = True
+    else:
+        legacy_sig = _legacy_signature(logs_dir / f"{day}{LEGACY_SUFFIX}")
+        if legacy_sig != rollup["legacy"] or rollup.get("compacted"):
+            # A legacy array file can be rewritten in place, so start the day over.
+            rollup = _empty(day)
+            rollup["legacy"] = legacy_sig
+            if legacy_sig is not None:
+                _fold_base(rollup, logs_dir, day)
+            dirty = True
+
+    log_file = logs_dir / f"{day}{LOG_SUFFIX}"
+    try:
+        size = log_file.stat().st_size
+    except FileNotFoundError:
+        size = None
+    if size is not None and size != rollup["offset"]:
+        if size < rollup["offset"]:
+            # File was truncated or replaced (e.g. migrate, compact); rebuild it.
+            legacy, compacted = rollup["legacy"], rollup.get("compacted", False)
+            rollup = _empty(day)
+            rollup["legacy"], rollup["compacted"] = legacy, compacted
+            _fold_base(rollup, logs_dir, day)
+        entries, offset = read_appended(log_file, rollup["offset"])
+        if offset != rollup["offset"]:
+            for entry in entries:
+                _fold(rollup, entry)
+            rollup["offset"] = offset
+            dirty = True
+
+    if dirty:
+        _save(path, rollup)
+    return rollup
+
+
+def fold_appended(day: str, logs_dir: Path, start: int | None, data: bytes) -> None:
+    """Writer-side update: fold ``data`` that was just appended at ``start``.
+
+    If the rollup is exactly caught up to ``start`` the new lines are folded
+    from memory without touching the log. Otherwise another process wrote in
+    between, and the update is left to the next reader-side refresh: one
+    writer never re-reads everyone else's lines.
+    """
+    path = _rollup_path(logs_dir, day)
+    rollup = _load(path, day)
+    if start is None or rollup["offset"] != start or rollup.get("compacted"):
+        if rollup["offset"] == 0 and not path.exists():
+            refresh_rollup(day, logs_dir)
+        return
+    for raw in data.splitlines():
+        try:
+            entry = json.loads(raw)
+        except ValueError:
+            continue
+        if isinstance(entry, dict):
+            _fold(rollup, entry)
+    rollup["offset"] = start + len(data)
+    _save(path, rollup)
+
+
+def rollup_totals(
+    logs_dir: Path | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> dict:
+    """Merge day rollups in [since, until] into one ``{"entries", "counts"}`` dict."""
+    logs_dir = logs_dir or get_vault_path() / "Logs"
+    totals = {"entries": 0, "counts": {field: {} for field in ROLLUP_FIELDS}}
+    for day in log_days(logs_dir):
+        if since and day < since:
+            continue
+        if until and day > until:
+            break
+        rollup = refresh_rollup(day, logs_dir)
+        totals["entries"] += rollup["entries"]
+        for field in ROLLUP_FIELDS:
+            bucket = totals["counts"][field]
+            for key, n in rollup["counts"][field].items():
+                bucket[key] = bucket.get(key, 0) + n
+    return totals
+
+
+def rollup_count(
+    field: str,
+    value: str,
+    logs_dir: Path | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> int:
+    """Number of entries where ``field == value`` in the given day range."""
+    totals = rollup_totals(logs_dir, since=since, until=until)
+    return totals["counts"].get(field, {}).get(value, 0)
+
+
+def last_days_since(days: int) -> str:
+    """YYYY-MM-DD of the first day in a trailing window of ``days`` days."""
+    return (datetime.now(LOG_TZ) - timedelta(days=days - 1)).strftime("%Y-%m-%d")
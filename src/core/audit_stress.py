@@ -0,0 +1,96 @@
+"""Multi-process stress check for the audit log.
+
+Spawns N writer processes that all call ``log_action`` against the same day
+file (half of them through the background writer), then checks that every
+entry landed exactly once, that no line is torn, and that the rollup agrees.
+
+    python -m src.core.audit_stress --writers 16 --entries 2000
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+
+def _writer(vault: str, writer_id: int, entries: int, payload_bytes: int, background: bool) -> None:
+    os.environ["VAULT_PATH"] = vault
+    from src.core import audit_logger
+
+    if background:
+        audit_logger.enable_background_writer(batch_size=64, flush_interval=0.05)
+    payload = "x" * payload_bytes
+    for seq in range(entries):
+        audit_logger.log_action(
+            action_type="stress_write",
+            target=f"{writer_id}:{seq}",
+            parameters={"payload": payload},
+            result="success",
+            actor=f"writer-{writer_id}",
+        )
+    audit_logger.flush()
+
+
+def run(writers: int, entries: int, payload_bytes: int, vault: Path) -> bool:
+    os.environ["VAULT_PATH"] = str(vault)
+    from src.core.audit_logger import LOG_SUFFIX, iter_entries
+    from src.core.audit_rollup import rollup_totals
+
+    ctx = multiprocessing.get_context("spawn")
+    procs = [
+        ctx.Process(target=_writer, args=(str(vault), i, entries, payload_bytes, i % 2 == 1))
+        for i in range(writers)
+    ]
+    started = time.perf_counter()
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    elapsed = time.perf_counter() - started
+
+    logs_dir = vault / "Logs"
+    raw_lines = sum(
+        sum(1 for line in f.open("rb") if line.strip()) for f in logs_dir.glob(f"*{LOG_SUFFIX}")
+    )
+    seen = Counter(e["target"] for e in iter_entries(logs_dir) if e.get("action_type") == "stress_write")
+    expected = {f"{w}:{s}" for w in range(writers) for s in range(entries)}
+    missing = expected - set(seen)
+    duplicated = [t for t, n in seen.items() if n > 1]
+    torn = raw_lines - sum(seen.values())
+    rolled = rollup_totals(logs_dir)["counts"]["action_type"].get("stress_write", 0)
+
+    total = writers * entries
+    print(f"writers={writers} entries/writer={entries} payload={payload_bytes}B "
+          f"elapsed={elapsed:.2f}s ({total / elapsed:,.0f} entries/s)")
+    print(f"expected={total} found={sum(seen.values())} missing={len(missing)} "
+          f"duplicated={len(duplicated)} torn_lines={torn} rollup={rolled}")
+    exit_codes = [p.exitcode for p in procs]
+    ok = not missing and not duplicated and torn == 0 and rolled == total and not any(exit_codes)
+    print("PASS: zero lost or torn entries" if ok else f"FAIL (writer exit codes: {exit_codes})")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent audit log writer stress test")
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--payload-bytes", type=int, default=8192,
+                        help="Per-entry payload; the default exceeds PIPE_BUF on purpose")
+    parser.add_argument("--vault", help="Scratch vault directory (default: a fresh temp dir)")
+    args = parser.parse_args()
+
+    if args.vault:
+        ok = run(args.writers, args.entries, args.payload_bytes, Path(args.vault))
+    else:
+        with tempfile.TemporaryDirectory(prefix="audit-stress-") as tmp:
+            ok = run(args.writers, args.entries, args.payload_bytes, Path(tmp))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
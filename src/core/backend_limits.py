@@ -0,0 +1,35 @@
+"""Per-backend concurrency caps for work that runs on several threads.
+
+The orchestrator executes approved files on a worker pool, so several of them
+can talk to Odoo, SMTP or Google Calendar at once. ``backend_slot(name)``
+bounds how many do, using the ``*_MAX_CONCURRENCY`` settings
+(``settings().executor``). A changed limit takes effect for new callers; calls
+already holding a slot finish under the old one.
+"""
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+
+from src.core.config import settings
+
+
+_slots: dict[str, tuple[int, threading.BoundedSemaphore]] = {}
+_lock = threading.Lock()
+
+
+def _semaphore(name: str) -> threading.BoundedSemaphore:
+    limit = max(1, int(getattr(settings().executor, name)))
+    with _lock:
+        current = _slots.get(name)
+        if current is None or current[0] != limit:
+            current = _slots[name] = (limit, threading.BoundedSemaphore(limit))
+        return current[1]
+
+
+@contextmanager
+def backend_slot(name: str):
+    """Hold one of the ``name`` backend's slots (``odoo``, ``smtp``, ``calendar``)."""
+    semaphore = _semaphore(name)
+    with semaphore:
+        yield
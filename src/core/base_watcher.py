@@ -1,15 +1,112 @@
+from __future__ import annotations
+
+import asyncio
 import json
 import logging
 import os
-import time
+import random
+import signal
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
 
 from src.core.config import get_vault_path
+from src.core.processed_store import ProcessedIdStore
+
+
+WAKE_SIGNAL = signal.SIGUSR1
+
+
+class AdaptiveInterval:
+    """Next-poll delay that tracks activity.
+
+    Activity halves the interval (down to ``min_interval``), an idle poll grows
+    it by ``idle_factor`` (up to ``max_interval``), and consecutive errors back
+    off exponentially from ``base`` up to ``max_error_delay``. Every delay gets
+    +/- ``jitter`` so watchers restarted together do not poll in lockstep.
+    """
+
+    def __init__(
+        self,
+        base: float,
+        min_interval: float | None = None,
+        max_interval: float | None = None,
+        idle_factor: float = 1.5,
+        jitter: float = 0.1,
+        max_error_delay: float | None = None,
+    ):
+        self.base = base
+        self.min_interval = min_interval if min_interval is not None else max(base / 4, 1)
+        self.max_interval = max_interval if max_interval is not None else base * 4
+        self.idle_factor = idle_factor
+        self.jitter = jitter
+        self.max_error_delay = max_error_delay if max_error_delay is not None else base * 16
+        self.current = base
+        self.errors = 0
+
+    def _jittered(self, delay: float) -> float:
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def after_poll(self, item_count: int) -> float:
+        self.errors = 0
+        if item_count:
+            self.current = max(self.min_interval, self.current / 2)
+        else:
+            self.current = min(self.max_interval, self.current * self.idle_factor)
+        return self._jittered(self.current)
+
+    def after_error(self) -> float:
+        self.errors += 1
+        return self._jittered(min(self.max_error_delay, self.base * 2 ** (self.errors - 1)))
+
+
+# ─── Wake-up ─────────────────────────────────────────────────────────────
+#
+# WAKE_SIGNAL terminates a process that has no handler for it, so it is only
+# ever sent to the pid in /tmp/<watcher>.wake. That file is written after the
+# process-wide handler is in place and routes the signal to the watcher.
+
+_running: dict[str, _WatcherCore] = {}
+
 
+def _wake_running(signum, frame) -> None:
+    for watcher in list(_running.values()):
+        watcher.wake()
 
-class BaseWatcher(ABC):
-    def __init__(self, watcher_name: str, check_interval: int = 60):
+
+def install_wake_handler() -> None:
+    """Route WAKE_SIGNAL to every watcher running in this process.
+
+    Must be called from the main thread; the skill host calls it for the
+    watchers it runs in threads.
+    """
+    signal.signal(WAKE_SIGNAL, _wake_running)
+
+
+def wake_file(watcher_name: str) -> Path:
+    return Path(f"/tmp/{watcher_name}.wake")
+
+
+def wake_watcher(watcher_name: str) -> bool:
+    """Ask a running watcher to poll now (sends WAKE_SIGNAL to its wake file's pid)."""
+    try:
+        pid = int(wake_file(watcher_name).read_text().strip())
+        os.kill(pid, WAKE_SIGNAL)
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+class _WatcherCore:
+    """Paths, logging, state and processed-ID store shared by sync and async watchers."""
+
+    def __init__(
+        self,
+        watcher_name: str,
+        check_interval: int = 60,
+        processed_ttl_seconds: int | None = None,
+        processed_max_items: int | None = None,
+    ):
         self.watcher_name = watcher_name
         self.vault_path = get_vault_path()
         self.needs_action = self.vault_path / "Needs_Action"
@@ -18,9 +115,18 @@ class BaseWatcher(ABC):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.state_file = self.logs_path / f".{self.watcher_name}_state.json"
         self.pid_file = Path(f"/tmp/{self.watcher_name}.pid")
+        self.wake_file = wake_file(self.watcher_name)
         self._setup_logging()
         self.logs_path.mkdir(parents=True, exist_ok=True)
         self.needs_action.mkdir(parents=True, exist_ok=True)
+        self.interval = AdaptiveInterval(check_interval)
+        self._wake = threading.Event()
+        self.processed = ProcessedIdStore(
+            self.logs_path / f".{self.watcher_name}_processed.bin",
+            ttl_seconds=processed_ttl_seconds,
+            max_items=processed_max_items,
+            legacy_state_file=self.state_file,
+        )
 
     def _setup_logging(self) -> None:
         logging.basicConfig(
@@ -34,8 +140,26 @@ class BaseWatcher(ABC):
         return json.loads(self.state_file.read_text())
 
     def save_state(self, state: dict) -> None:
-        self.state_file.write_text(json.dumps(state, indent=2))
+        tmp = self.state_file.with_name(f"{self.state_file.name}.tmp")
+        tmp.write_text(json.dumps(state, indent=2))
+        os.replace(tmp, self.state_file)
+
+    def wake(self) -> None:
+        """Cut the current sleep short and poll immediately."""
+        self._wake.set()
+
+    def _announce(self) -> None:
+        """Write the pid file, and the wake file once WAKE_SIGNAL reaches us."""
+        self.wake_file.unlink(missing_ok=True)
+        if threading.current_thread() is threading.main_thread():
+            install_wake_handler()
+        _running[self.watcher_name] = self
+        self.pid_file.write_text(str(os.getpid()))
+        if signal.getsignal(WAKE_SIGNAL) is _wake_running:
+            self.wake_file.write_text(str(os.getpid()))
 
+
+class BaseWatcher(_WatcherCore, ABC):
     @abstractmethod
     def check_for_updates(self) -> list:
         pass
@@ -44,15 +168,120 @@ class BaseWatcher(ABC):
     def create_action_file(self, item) -> Path:
         pass
 
+    def _sleep(self, delay: float) -> None:
+        if self._wake.wait(delay):
+            self.logger.info("Woken up early for an immediate check")
+        self._wake.clear()
+
     def run(self):
-        self.pid_file.write_text(str(os.getpid()))
+        self._announce()
         self.logger.info("Starting %s", self.__class__.__name__)
         while True:
             try:
                 items = self.check_for_updates()
                 for item in items:
                     self.create_action_file(item)
+                delay = self.interval.after_poll(len(items))
             except Exception as exc:
-                self.logger.exception("Error in watcher loop: %s", exc)
-            time.sleep(self.check_interval)
+                delay = self.interval.after_error()
+                self.logger.exception(
+                    "Error in watcher loop (retry in %.0fs): %s", delay, exc
+                )
+            self._sleep(delay)
+
+
+class AsyncBaseWatcher(_WatcherCore, ABC):
+    """asyncio counterpart of BaseWatcher.
+
+    ``check_for_updates`` and ``create_action_file`` are coroutines. Action files
+    for one poll are created concurrently, at most ``max_concurrency`` at a
+    time. If ``item_id`` returns an ID, the base class records it in
+    ``self.processed`` only after that item's action file is fully written.
+    The record is a synchronous append with no await in between, so a
+    cancelled poll can never mark an unwritten item as done.
+
+    Porting a sync watcher can be incremental: wrap its blocking calls with
+    ``await self.run_blocking(fn, *args)`` and convert them one at a time.
+    """
+
+    def __init__(self, *args, max_concurrency: int = 4, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_concurrency = max_concurrency
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._async_wake: asyncio.Event | None = None
+
+    @abstractmethod
+    async def check_for_updates(self) -> list:
+        pass
+
+    @abstractmethod
+    async def create_action_file(self, item) -> Path:
+        pass
 
+    def item_id(self, item) -> str | None:
+        """ID to record in ``self.processed`` once ``item`` is handled."""
+        return None
+
+    async def run_blocking(self, func, *args, **kwargs):
+        """Run a blocking call (IMAP, googleapiclient, file I/O) off the loop."""
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def commit_state(self, state: dict) -> None:
+        """Persist ``state`` even if the calling task is cancelled mid-save."""
+        await asyncio.shield(asyncio.to_thread(self.save_state, state))
+
+    def wake(self) -> None:
+        super().wake()
+        if self._loop is not None and self._async_wake is not None:
+            self._loop.call_soon_threadsafe(self._async_wake.set)
+
+    async def _handle(self, item, limit: asyncio.Semaphore) -> None:
+        async with limit:
+            await self.create_action_file(item)
+        item_id = self.item_id(item)
+        if item_id is not None:
+            self.processed.add(item_id)
+
+    async def poll_once(self) -> int:
+        items = await self.check_for_updates()
+        limit = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *(self._handle(item, limit) for item in items), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                self.logger.error("Failed to create action file: %s", result)
+        return len(items)
+
+    async def _sleep_async(self, delay: float) -> None:
+        try:
+            await asyncio.wait_for(self._async_wake.wait(), timeout=delay)
+            self.logger.info("Woken up early for an immediate check")
+        except asyncio.TimeoutError:
+            pass
+        self._async_wake.clear()
+
+    async def run_async(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._async_wake = asyncio.Event()
+        self.logger.info("Starting %s (async)", self.__class__.__name__)
+        while True:
+            try:
+                delay = self.interval.after_poll(await self.poll_once())
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                delay = self.interval.after_error()
+                self.logger.exception(
+                    "Error in watcher loop (retry in %.0fs): %s", delay, exc
+                )
+            await self._sleep_async(delay)
+
+    def run(self):
+        self._announce()  # wake() before the loop exists only sets self._wake
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            self.logger.info("Stopping %s", self.__class__.__name__)
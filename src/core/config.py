@@ -1,16 +1,51 @@
+import logging
 import os
+import threading
+import time
 from pathlib import Path
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, find_dotenv
 
+from src.core.lazy import lazy_import
 
-load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Typed snapshot classes; imported on the first settings() call so scripts
+# that only need get_env()/get_vault_path() skip dataclasses.
+_typed = lazy_import("src.core.settings")
+
+ROOT = Path(__file__).resolve().parents[2]
+ENV_FILE = Path(find_dotenv() or ROOT / ".env")
+RELOAD_CHECK_SECONDS = 2.0
+
+# Variables set by the parent process always win over .env, as with load_dotenv().
+_process_env = frozenset(os.environ)
+_dotenv_keys: set[str] = set()
 
 
 class ZoneViolationError(RuntimeError):
     pass
 
 
+def _apply_env_file() -> None:
+    """Copy .env into os.environ, dropping keys that were removed from it."""
+    global _dotenv_keys
+    values = dotenv_values(ENV_FILE) if ENV_FILE.exists() else {}
+    for key in _dotenv_keys - values.keys():
+        os.environ.pop(key, None)
+    applied = set()
+    for key, value in values.items():
+        if key in _process_env or value is None:
+            continue
+        os.environ[key] = value
+        applied.add(key)
+    _dotenv_keys = applied
+
+
+_apply_env_file()
+
+
 def get_vault_path() -> Path:
     raw = os.getenv("VAULT_PATH")
     if not raw:
@@ -32,11 +67,57 @@ def get_env(name: str, required: bool = True, default: str | None = None) -> str
     return value or ""
 
 
+# ─── Typed settings snapshot ─────────────────────────────────────────────
+
+_settings = None
+_env_mtime: int | None = None
+_next_check = 0.0
+_reload_lock = threading.Lock()
+
+
+def _env_file_mtime() -> int | None:
+    try:
+        return ENV_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def reload_settings(force: bool = False):
+    """Re-read .env if it changed (or ``force``) and swap in a new snapshot.
+
+    A broken .env keeps the previous snapshot, so a typo does not take down
+    running loops; the error is logged and retried on the next change.
+    """
+    global _settings, _env_mtime, _next_check
+    with _reload_lock:
+        mtime = _env_file_mtime()
+        if force or _settings is None or mtime != _env_mtime:
+            _apply_env_file()
+            try:
+                fresh = _typed.Settings.from_env()
+            except (RuntimeError, ValueError) as exc:
+                if _settings is None:
+                    raise
+                logger.error("Ignoring invalid settings in %s: %s", ENV_FILE, exc)
+            else:
+                if _settings is not None and fresh != _settings:
+                    logger.info("Reloaded settings from %s", ENV_FILE)
+                _settings = fresh
+            _env_mtime = mtime
+        _next_check = time.monotonic() + RELOAD_CHECK_SECONDS
+        return _settings
+
+
+def settings():
+    """Current settings; .env is re-checked at most every RELOAD_CHECK_SECONDS."""
+    current = _settings
+    if current is not None and time.monotonic() < _next_check:
+        return current
+    return reload_settings()
+
+
 def get_agent_zone() -> str:
-    zone = os.getenv("AGENT_ZONE", "local").strip().lower()
-    if zone not in {"local", "cloud"}:
-        raise RuntimeError("AGENT_ZONE must be either 'local' or 'cloud'")
-    return zone
+    return settings().agent_zone
 
 
 def is_local() -> bool:
@@ -54,4 +135,10 @@ def require_local_execution(action_name: str) -> None:
         )
 
 
-DRY_RUN = get_bool("DRY_RUN", True)
+def __getattr__(name: str):
+    # ``config.DRY_RUN`` stays live; prefer ``settings().dry_run`` in new code.
+    if name == "DRY_RUN":
+        return settings().dry_run
+    if name in {"Settings", "OdooSettings", "SmtpSettings"}:
+        return getattr(_typed, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
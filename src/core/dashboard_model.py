@@ -0,0 +1,525 @@
+"""In-memory model behind ``Vault/Dashboard.md``.
+
+The orchestrator used to rebuild the dashboard from scratch on every loop:
+``rglob`` of six folders, full sorts, invoice and log parsing, and a rewrite
+of the file even when nothing had changed. The model keeps the listings in
+memory instead and updates them from two sources:
+
+* file events, through ``apply_event()`` (created / deleted / moved paths);
+* ``sync()``, which stats each tracked directory and re-lists only those
+  whose mtime changed, stat-ing only the names it has not seen before.
+
+Actions feed the rest: ``add_activity()`` and ``note_rejected()``. When idle,
+a sync costs one ``stat`` per directory, however many files the vault holds.
+``render()`` writes Dashboard.md only when the content (ignoring the
+timestamp) differs from what was last written.
+
+Renders are coalesced: actions call ``request_render()`` and the owner calls
+``flush()`` once per tick, so a tick that logs many activity lines still
+writes the file once. A request that is not flushed within
+DEBOUNCE_SECONDS (a slow API call mid-tick) is rendered by a timer.
+"""
+from __future__ import annotations
+
+import hashlib
+import heapq
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from src.core.audit_logger import log_days
+from src.core.audit_rollup import rollup_count
+
+
+ACTIVITY_LIMIT = 50
+RECENT_LIMIT = 5
+DEBOUNCE_SECONDS = 2.0  # longest a requested render waits for the tick to end
+STAMP = "\x00now\x00"  # stands in for the timestamp while hashing
+# A directory modified this recently may still change within the same mtime
+# tick, so its mtime is not cached and it is listed again on the next sync.
+SETTLE_NS = 2_000_000_000
+
+
+def _settled(mtime_ns: int) -> int:
+    """``mtime_ns`` if it is old enough to trust, else 0 (never matches)."""
+    return mtime_ns if time.time_ns() - mtime_ns > SETTLE_NS else 0
+
+
+def _is_md(name: str) -> bool:
+    return name.endswith(".md")
+
+
+def _is_invoice(name: str) -> bool:
+    return name.startswith("INVOICE_") and name.endswith(".md")
+
+
+class FolderIndex:
+    """``.md`` files under one vault folder, kept per directory."""
+
+    def __init__(
+        self,
+        root: Path,
+        recursive: bool,
+        accept: Callable[[str], bool] = _is_md,
+        tag: str | None = None,
+        track_mtime: bool = False,
+    ):
+        self.root = root
+        self.recursive = recursive
+        self.accept = accept
+        self.tag = tag
+        self.track_mtime = track_mtime
+        # dir -> (mtime_ns, file names, subdirectories)
+        self.dirs: dict[str, tuple[int, set[str], set[str]]] = {}
+        self.mtimes: dict[str, int] = {}  # flat folders only: name -> mtime_ns
+        self._recent: list[tuple[int, str]] | None = []  # newest RECENT_LIMIT by mtime; None = recompute
+        self.count = 0
+        self.tagged = 0
+        self.version = 0
+
+    # ── bookkeeping ──
+
+    def _added(self, directory: str, name: str) -> None:
+        self.count += 1
+        if self.tag and name.startswith(self.tag):
+            self.tagged += 1
+        if self.track_mtime:
+            try:
+                self.mtimes[name] = os.stat(os.path.join(directory, name)).st_mtime_ns
+            except OSError:
+                self.mtimes[name] = 0
+            recent = self._recent
+            if recent is not None and (len(recent) < RECENT_LIMIT or self.mtimes[name] >= recent[-1][0]):
+                recent.append((self.mtimes[name], name))
+                recent.sort(reverse=True)
+                del recent[RECENT_LIMIT:]
+        self.version += 1
+
+    def _removed(self, name: str) -> None:
+        self.count -= 1
+        if self.tag and name.startswith(self.tag):
+            self.tagged -= 1
+        mtime = self.mtimes.pop(name, None)
+        if self._recent is not None and (mtime, name) in self._recent:
+            self._recent = None
+        self.version += 1
+
+    def _drop_dir(self, directory: str) -> None:
+        entry = self.dirs.pop(directory, None)
+        if entry is None:
+            return
+        for name in entry[1]:
+            self._removed(name)
+        for sub in entry[2]:
+            self._drop_dir(sub)
+
+    def _scan(self, directory: str, mtime_ns: int) -> None:
+        files, subdirs = set(), set()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if self.recursive:
+                            subdirs.add(entry.path)
+                    elif self.accept(entry.name):
+                        files.add(entry.name)
+        except FileNotFoundError:
+            self._drop_dir(directory)
+            return
+        old = self.dirs.get(directory)
+        old_files, old_subdirs = (old[1], old[2]) if old else (set(), set())
+        for name in files - old_files:
+            self._added(directory, name)
+        for name in old_files - files:
+            self._removed(name)
+        for sub in old_subdirs - subdirs:
+            self._drop_dir(sub)
+        self.dirs[directory] = (_settled(mtime_ns), files, subdirs)
+
+    # ── public ──
+
+    def sync(self) -> None:
+        """Re-list directories whose mtime changed; new subdirectories are walked."""
+        stack = [str(self.root)]
+        while stack:
+            directory = stack.pop()
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except FileNotFoundError:
+                self._drop_dir(directory)
+                continue
+            cached = self.dirs.get(directory)
+            if cached is None or cached[0] != mtime_ns:
+                self._scan(directory, mtime_ns)
+            if directory in self.dirs:
+                stack.extend(self.dirs[directory][2])
+
+    def contains(self, path: Path) -> bool:
+        try:
+            relative = path.relative_to(self.root)
+        except ValueError:
+            return False
+        return self.recursive or len(relative.parts) == 1
+
+    def file_created(self, path: Path) -> None:
+        directory = str(path.parent)
+        entry = self.dirs.get(directory)
+        if entry is None or path.is_dir():
+            self.sync()  # new directory: list it properly
+            return
+        if self.accept(path.name) and path.name not in entry[1] and path.is_file():
+            entry[1].add(path.name)
+            self._added(directory, path.name)
+        self._refresh_mtime(directory)
+
+    def file_deleted(self, path: Path) -> None:
+        directory = str(path.parent)
+        if str(path) in self.dirs:  # a whole subdirectory went away
+            self._drop_dir(str(path))
+        entry = self.dirs.get(directory)
+        if entry is None:
+            return
+        entry[2].discard(str(path))
+        if path.name in entry[1]:
+            entry[1].discard(path.name)
+            self._removed(path.name)
+        self._refresh_mtime(directory)
+
+    def _refresh_mtime(self, directory: str) -> None:
+        # The event accounted for this change, so the next sync() need not re-list.
+        entry = self.dirs.get(directory)
+        if entry is None:
+            return
+        try:
+            self.dirs[directory] = (_settled(os.stat(directory).st_mtime_ns), entry[1], entry[2])
+        except FileNotFoundError:
+            self._drop_dir(directory)
+
+    def recent(self) -> list[str]:
+        """Names of the newest files by mtime (``track_mtime`` folders)."""
+        if self._recent is None:
+            self._recent = heapq.nlargest(RECENT_LIMIT, ((m, n) for n, m in self.mtimes.items()))
+        return [name for _, name in self._recent]
+
+    def paths(self) -> list[Path]:
+        return [Path(d) / name for d, (_, files, _) in self.dirs.items() for name in files]
+
+    def names(self) -> list[str]:
+        return [name for _, files, _ in self.dirs.values() for name in files]
+
+
+def read_activity_lines(dashboard: Path, n: int = ACTIVITY_LIMIT) -> list[str]:
+    """Last ``n`` lines of the "Recent Activity" section of an existing dashboard."""
+    if not dashboard.exists():
+        return []
+    lines = []
+    in_activity = False
+    for line in dashboard.read_text(encoding="utf-8", errors="ignore").splitlines():
+        if line.startswith("## ") and "Recent Activity" in line:  # heading may carry an emoji
+            in_activity = True
+            continue
+        if in_activity:
+            if line.startswith("## ") or line.startswith("# "):
+                break
+            if line.strip():
+                lines.append(line)
+    return lines[-n:]
+
+
+class DashboardModel:
+    def __init__(self, vault: Path):
+        self.vault = vault
+        self.dashboard = vault / "Dashboard.md"
+        self.folders = {
+            "inbox": FolderIndex(vault / "Inbox", recursive=False),
+            "needs": FolderIndex(vault / "Needs_Action", recursive=True),
+            "pending": FolderIndex(vault / "Pending_Approval", recursive=True),
+            "approved": FolderIndex(vault / "Approved", recursive=False),
+            "done": FolderIndex(vault / "Done", recursive=False, tag="MEETING_", track_mtime=True),
+            "plans": FolderIndex(vault / "Plans", recursive=True),
+            "invoices": FolderIndex(vault / "Invoices", recursive=False, accept=_is_invoice),
+        }
+        self.activity: deque[str] = deque(read_activity_lines(self.dashboard), maxlen=ACTIVITY_LIMIT)
+        self._unwritten: list[str] = []  # activity added since the last write
+        logs_dir = vault / "Logs"
+        self.rejected = rollup_count("approval_status", "rejected", logs_dir) if logs_dir.exists() else 0
+        self._logs_mtime: int | None = None
+        self._log_day_count = 0
+        self._latest_invoice: tuple[str, str] = ("", "—")  # (file name, invoice_id)
+        self._derived: dict[str, tuple[int, object]] = {}
+        self._written_hash = ""
+        self._written_stamp: tuple[int, int] | None = None
+        self._timer: threading.Timer | None = None
+        self.render_requests = 0
+        self.renders = 0
+        self.lock = threading.RLock()
+        self.sync()
+
+    # ── inputs ──
+
+    def sync(self) -> None:
+        """Poll for changes made without an event (one stat per directory when idle)."""
+        with self.lock:
+            for folder in self.folders.values():
+                folder.sync()
+            self._sync_logs()
+            self._sync_dashboard_file()
+
+    def apply_event(self, kind: str, src_path: str | Path, dest_path: str | Path | None = None) -> None:
+        """Apply a file-system event: ``created``, ``deleted``, ``modified`` or ``moved``."""
+        src = Path(src_path)
+        with self.lock:
+            if kind == "moved" and dest_path is not None:
+                self._deleted(src)
+                self._created(Path(dest_path))
+            elif kind == "created":
+                self._created(src)
+            elif kind == "deleted":
+                self._deleted(src)
+            elif kind == "modified" and src == self.dashboard:
+                self._sync_dashboard_file()
+
+    def _created(self, path: Path) -> None:
+        for folder in self.folders.values():
+            if folder.contains(path):
+                folder.file_created(path)
+
+    def _deleted(self, path: Path) -> None:
+        for folder in self.folders.values():
+            if folder.contains(path):
+                folder.file_deleted(path)
+
+    def add_activity(self, message: str) -> None:
+        stamp = datetime.now(ZoneInfo("Asia/Karachi")).strftime("%Y-%m-%d %H:%M")
+        with self.lock:
+            line = f"- [{stamp}] {message}"
+            self.activity.append(line)
+            self._unwritten.append(line)
+
+    def note_rejected(self, count: int = 1) -> None:
+        with self.lock:
+            self.rejected += count
+
+    def _sync_logs(self) -> None:
+        logs_dir = self.vault / "Logs"
+        try:
+            mtime = logs_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._logs_mtime, self._log_day_count = None, 0
+            return
+        if mtime != self._logs_mtime:  # a day file was added, compacted or removed
+            self._log_day_count = len(log_days(logs_dir))
+            self._logs_mtime = mtime
+
+    def _sync_dashboard_file(self) -> None:
+        # The Qwen vault-sync hook appends activity lines to Dashboard.md; adopt them.
+        try:
+            st = self.dashboard.stat()
+        except FileNotFoundError:
+            return
+        if self._written_stamp is not None and (st.st_mtime_ns, st.st_size) != self._written_stamp:
+            lines = read_activity_lines(self.dashboard) + self._unwritten
+            self.activity = deque(lines, maxlen=ACTIVITY_LIMIT)
+            self._written_stamp = (st.st_mtime_ns, st.st_size)
+            self._written_hash = ""
+
+    # ── derived values, recomputed only when their folder changes ──
+
+    def _cached(self, key: str, folder: FolderIndex, compute: Callable[[], object]):
+        cached = self._derived.get(key)
+        if cached is None or cached[0] != folder.version:
+            cached = self._derived[key] = (folder.version, compute())
+        return cached[1]
+
+    def _pending_top(self) -> list[Path]:
+        pending = self.folders["pending"]
+        return self._cached("pending", pending, lambda: heapq.nsmallest(10, pending.paths()))
+
+    def _invoices_top(self) -> list[str]:
+        invoices = self.folders["invoices"]
+        return self._cached("invoices", invoices, lambda: heapq.nlargest(5, invoices.names()))
+
+    def _latest_invoice_id(self, latest: str) -> str:
+        if self._latest_invoice[0] != latest:
+            inv_id = "—"
+            try:
+                text = (self.vault / "Invoices" / latest).read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                text = ""
+            for line in text.splitlines():
+                if line.startswith("invoice_id:"):
+                    inv_id = line.split(":", 1)[1].strip()
+                    break
+            self._latest_invoice = (latest, inv_id)
+        return self._latest_invoice[1]
+
+    # ── output ──
+
+    def content(self) -> str:
+        """Dashboard markdown with ``STAMP`` in place of the timestamp."""
+        with self.lock:
+            f = self.folders
+            invoices = self._invoices_top()
+            latest = (
+                f"#{self._latest_invoice_id(invoices[0])} ({Path(invoices[0]).stem})" if invoices else "—"
+            )
+            return render(
+                counts={
+                    "inbox": f["inbox"].count,
+                    "needs": f["needs"].count,
+                    "pending": f["pending"].count,
+                    "approved": f["approved"].count,
+                    "rejected": self.rejected,
+                    "done": f["done"].count,
+                    "plans": f["plans"].count,
+                    "invoices": f["invoices"].count,
+                    "meetings": f["done"].tagged,
+                    "log_days": self._log_day_count,
+                },
+                pending=self._pending_top(),
+                invoices=invoices,
+                latest_invoice=latest,
+                done=f["done"].recent(),
+                activity=list(self.activity),
+                now=STAMP,
+            )
+
+    def render(self) -> bool:
+        """Write Dashboard.md if its content changed; returns whether it wrote."""
+        with self.lock:
+            self._sync_dashboard_file()
+            content = self.content()
+            digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+            if digest == self._written_hash and self.dashboard.exists():
+                return False
+            now = datetime.now(ZoneInfo("Asia/Karachi")).strftime("%Y-%m-%d %H:%M:%S")
+            self.dashboard.write_text(content.replace(STAMP, now), encoding="utf-8")
+            st = self.dashboard.stat()
+            self._written_stamp = (st.st_mtime_ns, st.st_size)
+            self._written_hash = digest
+            self._unwritten.clear()
+            self.renders += 1
+            return True
+
+    def request_render(self, debounce: float = DEBOUNCE_SECONDS) -> None:
+        """Render at the next flush(), or after ``debounce`` seconds at the latest."""
+        with self.lock:
+            self.render_requests += 1
+            if self._timer is None:
+                self._timer = threading.Timer(debounce, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> bool:
+        """Sync and render now, absorbing any pending render request."""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self.sync()
+            return self.render()
+
+
+def render(
+    counts: dict,
+    pending: list[Path],
+    invoices: list[str],
+    latest_invoice: str,
+    done: list[str],
+    activity: list[str],
+    now: str,
+) -> str:
+    pending_count = counts["pending"]
+    pend_wiki = [f"  - [[Pending_Approval/{p.parent.name}/{p.stem}|{p.stem}]]" for p in pending]
+    pend_wiki_block = "\n".join(pend_wiki) if pend_wiki else "  _None pending_"
+    inv_wiki = [f"  - [[Invoices/{Path(n).stem}|{Path(n).stem}]]" for n in invoices]
+    inv_wiki_block = "\n".join(inv_wiki) if inv_wiki else "  _None_"
+    done_wiki = [f"  - [[Done/{Path(n).stem}|{Path(n).stem}]]" for n in done]
+    done_wiki_block = "\n".join(done_wiki) if done_wiki else "  _None_"
+    activity_block = "\n".join(activity) if activity else "_No activity yet._"
+
+    # ── Callout type based on pending count ──
+    if pending_count > 5:
+        alert_type = "warning"
+        alert_icon = "🔴"
+    elif pending_count > 0:
+        alert_type = "info"
+        alert_icon = "🟡"
+    else:
+        alert_type = "success"
+        alert_icon = "🟢"
+
+    return f"""---
+tags: [dashboard, home, status]
+updated: {now}
+---
+
+# 🤖 AI Employee — Command Center
+
+> [!{alert_type}] System Status — Last updated: `{now}`
+> Refreshed by the orchestrator whenever the vault changes.
+
+---
+
+## 📊 Live Counts
+
+| 📁 Category | # |
+|:---|---:|
+| 📥 Inbox (new files) | {counts["inbox"]} |
+| ⚡ Needs Action | {counts["needs"]} |
+| ⏳ Pending Approval | {pending_count} |
+| ✅ Approved | {counts["approved"]} |
+| ❌ Rejected | {counts["rejected"]} |
+| 🏁 Done | {counts["done"]} |
+| 📋 Plans Generated | {counts["plans"]} |
+| 🧾 Invoices Created | {counts["invoices"]} |
+| 📅 Meetings Scheduled | {counts["meetings"]} |
+| 📅 Log Days | {counts["log_days"]} |
+
+---
+
+## ⏳ Pending Approval ({pending_count}) {alert_icon}
+
+{pend_wiki_block}
+
+> [!tip] To approve, move file to `Vault/Approved/`
+
+---
+
+## 🧾 Recent Invoices ({counts["invoices"]} total)
+
+**Latest:** `{latest_invoice}`
+
+{inv_wiki_block}
+
+---
+
+## 🏁 Recently Completed ({counts["done"]} total)
+
+{done_wiki_block}
+
+---
+
+## 🗂️ Quick Navigation
+
+| Section | Link |
+|:--------|:-----|
+| Business Goals | [[Business_Goals]] |
+| Company Handbook | [[Company_Handbook]] |
+| Inbox | [[Inbox/]] |
+| Plans | [[Plans/]] |
+| Pending Approval | [[Pending_Approval/]] |
+| Invoices | [[Invoices/]] |
+| Schedules | [[Schedules/linkedin_post]] · [[Schedules/facebook_post]] · [[Schedules/twitter_post]] |
+
+---
+
+## 🕐 Recent Activity (last 50 events)
+
+{activity_block}
+"""
@@ -0,0 +1,207 @@
+"""Frontmatter (``---`` header) parsing shared by the skills.
+
+Vault files start with a block of ``key: value`` lines between two ``---``
+lines. ``parse()`` splits text that is already in memory. ``read()`` reads a
+file: without ``body=True`` it reads only up to the closing ``---``, so a
+large email body is never loaded. Results are cached per path, checked
+against (mtime, size), and the least recently used entries are evicted past
+CACHE_SIZE. Callers get their own dict and may modify it.
+
+    python -m src.core.frontmatter bench --files 10000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+HEADER_CHUNK = 4096
+CACHE_SIZE = 16384
+MAX_CACHED_BODY = 64 * 1024  # larger bodies are re-read when asked for
+
+_CLOSE = re.compile(r"\r?\n---[ \t]*(?:\r?\n|$)")
+_CLOSE_BYTES = re.compile(rb"\r?\n---[ \t]*(?:\r?\n|$)")
+_NO_HEADER = object()
+
+
+def _is_open(first_line: str) -> bool:
+    return first_line.rstrip() == "---"
+
+
+def _parse_header(header: str) -> dict[str, str]:
+    meta: dict[str, str] = {}
+    for line in header.splitlines():
+        if ":" in line:
+            key, _, val = line.partition(":")
+            meta[key.strip()] = val.strip().strip('"').strip("'")
+    return meta
+
+
+def parse(text: str) -> tuple[dict[str, str], str] | None:
+    """``(meta, body)`` for ``text``, or None if it has no closed header."""
+    first_end = text.find("\n")
+    if first_end == -1 or not _is_open(text[:first_end]):
+        return None
+    close = _CLOSE.search(text, first_end)
+    if close is None:
+        return None
+    return _parse_header(text[first_end + 1:close.start()]), text[close.end():].strip()
+
+
+def _read_header(path: str) -> str | object:
+    """Header text of ``path`` read chunk by chunk, or _NO_HEADER."""
+    # Unbuffered: a buffered file would read a whole buffer past the header.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, HEADER_CHUNK)
+        first_end = data.find(b"\n")
+        if first_end == -1 or not _is_open(data[:first_end].decode("utf-8", "ignore")):
+            return _NO_HEADER
+        searched = first_end
+        while True:
+            close = _CLOSE_BYTES.search(data, searched)
+            if close is not None and close.group().endswith(b"\n"):
+                return data[first_end + 1:close.start()].decode("utf-8", "ignore")
+            chunk = os.read(fd, HEADER_CHUNK)
+            if not chunk:
+                if close is not None:
+                    return data[first_end + 1:close.start()].decode("utf-8", "ignore")
+                return _NO_HEADER
+            searched = max(first_end, len(data) - 8)  # "\r\n---" may straddle chunks
+            data += chunk
+    finally:
+        os.close(fd)
+
+
+# ─── Cache ───────────────────────────────────────────────────────────────
+
+# path -> ((mtime_ns, size), meta or None, body or None if not kept)
+_cache: OrderedDict[str, tuple[tuple[int, int], dict[str, str] | None, str | None]] = OrderedDict()
+_lock = threading.Lock()
+hits = misses = 0
+
+
+def read(path: str | Path, body: bool = False) -> dict[str, str] | None:
+    """Frontmatter of ``path``, with the text after it under ``"body"`` if asked.
+
+    None if the file has no closed header. Raises OSError like ``open``.
+    """
+    global hits, misses
+    key = os.fspath(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] == stamp and (not body or entry[1] is None or entry[2] is not None):
+            _cache.move_to_end(key)
+            hits += 1
+            return _result(entry[1], entry[2], body)
+        misses += 1
+
+    if body:
+        parsed = parse(Path(key).read_text(encoding="utf-8", errors="ignore"))
+        meta, text = parsed if parsed else (None, None)
+        kept = text if text is not None and len(text) <= MAX_CACHED_BODY else None
+    else:
+        header = _read_header(key)
+        meta = None if header is _NO_HEADER else _parse_header(header)
+        text = kept = None
+
+    with _lock:
+        _cache[key] = (stamp, meta, kept)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return _result(meta, text, body)
+
+
+def _result(meta: dict[str, str] | None, text: str | None, body: bool) -> dict[str, str] | None:
+    if meta is None:
+        return None
+    result = dict(meta)
+    if body:
+        result["body"] = text or ""
+    return result
+
+
+def cache_clear() -> None:
+    global hits, misses
+    with _lock:
+        _cache.clear()
+        hits = misses = 0
+
+
+# ─── Benchmark ───────────────────────────────────────────────────────────
+
+def _legacy_read(path: Path) -> dict[str, str]:
+    # The per-skill parsers this module replaced: whole file, split on "---".
+    content = path.read_text(encoding="utf-8", errors="ignore")
+    if not content.startswith("---"):
+        return {}
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        return {}
+    meta: dict[str, str] = {}
+    for line in parts[1].strip().split("\n"):
+        if ":" in line:
+            key, val = line.split(":", 1)
+            meta[key.strip()] = val.strip().strip('"').strip("'")
+    meta["body"] = parts[2].strip()
+    return meta
+
+
+def _bench(files: int, body_bytes: int, rounds: int) -> None:
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = Path(tmp)
+        body = ("Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n" * (body_bytes // 57 + 1))[:body_bytes]
+        paths = []
+        for i in range(files):
+            path = vault / f"EMAIL_{i:05d}.md"
+            path.write_text(
+                f"---\ntype: email\nfrom: Customer {i}\nfrom_email: c{i}@example.com\n"
+                f"subject: \"Order {i}\"\nreceived: 2026-03-09T19:13:03\nstatus: pending\n---\n\n{body}"
+            )
+            paths.append(path)
+
+        def timed(label: str, fn) -> float:
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for path in paths:
+                    fn(path)
+            elapsed = (time.perf_counter() - start) / rounds
+            print(f"{label:34} {elapsed * 1000:9.1f} ms/scan  {elapsed / files * 1e6:7.2f} us/file")
+            return elapsed
+
+        print(f"{files} files, {body_bytes} B body, {rounds} scans")
+        legacy = timed("legacy (read all + split)", _legacy_read)
+        global CACHE_SIZE
+        saved, CACHE_SIZE = CACHE_SIZE, 0
+        cold = timed("shared, header only, uncached", read)
+        CACHE_SIZE = saved
+        cache_clear()
+        read_all = [read(path) for path in paths]  # fill the cache
+        assert all(meta and meta["type"] == "email" for meta in read_all)
+        warm = timed("shared, cached (stat only)", read)
+        print(f"speedup: {legacy / cold:.1f}x uncached, {legacy / warm:.1f}x cached")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Shared frontmatter parser")
+    sub = parser.add_subparsers(dest="command", required=True)
+    bench_cmd = sub.add_parser("bench", help="Compare with the old per-skill parsers")
+    bench_cmd.add_argument("--files", type=int, default=10_000)
+    bench_cmd.add_argument("--body-bytes", type=int, default=8192)
+    bench_cmd.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    _bench(args.files, args.body_bytes, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
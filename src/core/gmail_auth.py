@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google.oauth2.service_account import Credentials as ServiceAccountCredentials
-from googleapiclient.discovery import build
-
 from src.core.config import get_env
+from src.core import token_cache
+from src.core.http_pool import shared_session
+from src.core.lazy import lazy_import
+
+# The Google SDKs take longer to import than the rest of a short run.
+google_requests = lazy_import("google.auth.transport.requests")
+oauth2_credentials = lazy_import("google.oauth2.credentials")
+service_account = lazy_import("google.oauth2.service_account")
+discovery = lazy_import("googleapiclient.discovery")
+
+logger = logging.getLogger(__name__)
 
 
 DEFAULT_GMAIL_SCOPES = [
@@ -18,8 +27,11 @@ DEFAULT_GMAIL_SCOPES = [
     "https://www.googleapis.com/auth/gmail.send",
 ]
 
+REFRESH_MARGIN_SECONDS = 300  # refresh this long before the access token expires
+REFRESH_RETRY_SECONDS = 30
+
 
-def _get_service_account_credentials(scopes: list[str]) -> ServiceAccountCredentials | None:
+def _get_service_account_credentials(scopes: list[str]) -> service_account.Credentials | None:
     # Support both naming conventions in .env
     service_account_json = (
         get_env("GOOGLE_SERVICE_ACCOUNT_INFO", required=False, default="")
@@ -39,11 +51,11 @@ def _get_service_account_credentials(scopes: list[str]) -> ServiceAccountCredent
         return None
 
     if service_account_json:
-        creds = ServiceAccountCredentials.from_service_account_info(
+        creds = service_account.Credentials.from_service_account_info(
             json.loads(service_account_json), scopes=scopes
         )
     else:
-        creds = ServiceAccountCredentials.from_service_account_file(
+        creds = service_account.Credentials.from_service_account_file(
             service_account_path, scopes=scopes
         )
 
@@ -53,39 +65,31 @@ def _get_service_account_credentials(scopes: list[str]) -> ServiceAccountCredent
     return creds
 
 
-def _get_oauth_user_credentials(scopes: list[str]) -> Credentials | None:
+def _get_oauth_user_credentials(scopes: list[str]) -> oauth2_credentials.Credentials | None:
     """
     OAuth2 user credentials with automatic token refresh.
     Priority:
       1. GMAIL_TOKEN_JSON   (inline JSON in .env)
       2. GMAIL_TOKEN_PATH   (path to token file, default: token.json)
-    Refreshes automatically when expired using GMAIL_CLIENT_ID / GMAIL_CLIENT_SECRET.
+    Refreshes automatically when expired. A token file goes through the shared
+    token cache, so only one process refreshes it; an inline token is
+    refreshed in memory.
     """
     token_json_str = get_env("GMAIL_TOKEN_JSON", required=False, default="")
-    token_path_str = get_env("GMAIL_TOKEN_PATH", required=False, default="token.json")
-    token_path = Path(token_path_str) if token_path_str else Path("token.json")
-
-    creds: Credentials | None = None
-
     if token_json_str:
-        creds = Credentials.from_authorized_user_info(json.loads(token_json_str), scopes)
-    elif token_path.exists():
-        creds = Credentials.from_authorized_user_file(str(token_path), scopes)
+        creds = oauth2_credentials.Credentials.from_authorized_user_info(json.loads(token_json_str), scopes)
+        if creds.expired and creds.refresh_token:
+            creds.refresh(google_requests.Request(session=shared_session()))
+        return creds
 
-    if creds is None:
-        return None
+    return token_cache.google_credentials(_token_path(), scopes, margin=0)
 
-    # Auto-refresh if expired
-    if creds.expired and creds.refresh_token:
-        creds.refresh(Request())
-        # Persist refreshed token back to file
-        if token_path:
-            token_path.write_text(creds.to_json())
 
-    return creds
+def _token_path() -> Path:
+    return Path(get_env("GMAIL_TOKEN_PATH", required=False, default="token.json") or "token.json")
 
 
-def _run_oauth_flow(scopes: list[str]) -> Credentials:
+def _run_oauth_flow(scopes: list[str]) -> oauth2_credentials.Credentials:
     """Run interactive OAuth flow using credentials from .env or credentials.json."""
     from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
 
@@ -106,9 +110,8 @@ def _run_oauth_flow(scopes: list[str]) -> Credentials:
     # Fixed port — register http://localhost:8080 in Google Cloud Console
     creds = flow.run_local_server(port=8080)
 
-    token_path_str = get_env("GMAIL_TOKEN_PATH", required=False, default="token.json")
-    token_path = Path(token_path_str or "token.json")
-    token_path.write_text(creds.to_json())
+    token_path = _token_path()
+    token_cache.token_file(token_path).save(json.loads(creds.to_json()))
     print(f"✅ OAuth token saved to {token_path}")
     return creds
 
@@ -120,8 +123,7 @@ def get_gmail_user_id() -> str:
 
     # For OAuth user auth, 'me' is always correct
     token_json_str = get_env("GMAIL_TOKEN_JSON", required=False, default="")
-    token_path = Path(get_env("GMAIL_TOKEN_PATH", required=False, default="token.json") or "token.json")
-    if token_json_str or token_path.exists():
+    if token_json_str or _token_path().exists():
         return "me"
 
     # Service account needs explicit delegation target
@@ -136,33 +138,132 @@ def get_gmail_user_id() -> str:
     return "me"
 
 
-def build_gmail_service(scopes: list[str] | None = None, interactive: bool = False):
+def _load_credentials(scopes: list[str], interactive: bool = False):
     """
-    Build Gmail API service.
     Auth priority:
       1. OAuth user token  (GMAIL_TOKEN_JSON / GMAIL_TOKEN_PATH / token.json)
       2. Service account   (GOOGLE_SERVICE_ACCOUNT_INFO / GOOGLE_SERVICE_ACCOUNT_FILE)
       3. Interactive OAuth flow (only if interactive=True)
     """
-    effective_scopes = scopes or DEFAULT_GMAIL_SCOPES
-
     # 1. OAuth user credentials (preferred — works with personal Gmail)
-    creds = _get_oauth_user_credentials(effective_scopes)
+    creds = _get_oauth_user_credentials(scopes)
 
     # 2. Service account fallback
     if creds is None:
-        creds = _get_service_account_credentials(effective_scopes)
+        creds = _get_service_account_credentials(scopes)
 
     # 3. Interactive OAuth flow (setup mode only)
     if creds is None:
         if interactive:
-            creds = _run_oauth_flow(effective_scopes)
+            creds = _run_oauth_flow(scopes)
         else:
             raise RuntimeError(
                 "No Gmail credentials found.\n"
                 "Run the OAuth setup first:\n"
                 "  python .agents/skills/gmail-watcher/scripts/gmail_oauth_setup.py"
             )
+    return creds
+
+
+def _build(creds):
+    # The Gmail discovery document ships with google-api-python-client, so
+    # static discovery builds the client without an HTTP round-trip.
+    return discovery.build("gmail", "v1", credentials=creds, static_discovery=True, cache_discovery=False)
+
+
+def build_gmail_service(scopes: list[str] | None = None, interactive: bool = False):
+    """
+    Build a new Gmail API service (see _load_credentials for auth priority).
+    Long-running code should use get_gmail_service(), which caches the client.
+    """
+    creds = _load_credentials(scopes or DEFAULT_GMAIL_SCOPES, interactive)
+    return _build(creds), get_gmail_user_id()
+
+
+# ─── Cached service with proactive refresh ───────────────────────────────
+
+class _GmailClient:
+    """Credentials shared by one service per thread, refreshed before expiry.
+
+    googleapiclient services wrap a non-thread-safe httplib2 connection, so
+    each thread gets its own service; all of them use the same credentials
+    object, which a daemon thread refreshes REFRESH_MARGIN_SECONDS before
+    ``expiry`` (through src.core.token_cache for a token file, so other
+    processes reuse the result). Callers never hit a blocking token refresh.
+    """
+
+    def __init__(self, scopes: list[str]):
+        self.creds = _load_credentials(scopes)
+        self.user_id = get_gmail_user_id()
+        self._local = threading.local()
+        self._stopped = threading.Event()
+        self._refresher = threading.Thread(target=self._refresh_loop, name="gmail-token-refresh", daemon=True)
+        self._refresher.start()
+
+    def service(self):
+        service = getattr(self._local, "service", None)
+        if service is None:
+            service = self._local.service = _build(self.creds)
+        return service
+
+    def _seconds_until_refresh(self) -> float:
+        expiry = self.creds.expiry  # naive UTC, as google-auth stores it
+        if not self.creds.token:
+            return 0.0
+        if expiry is None:
+            return 3600.0  # token without a known lifetime; look again later
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return (expiry - now).total_seconds() - REFRESH_MARGIN_SECONDS
+
+    def _refresh_loop(self) -> None:
+        while not self._stopped.is_set():
+            delay = self._seconds_until_refresh()
+            if delay > 0:
+                self._stopped.wait(delay)
+                continue
+            try:
+                if self._shares_token_file():
+                    token_cache.refresh_google_credentials(_token_path(), self.creds, REFRESH_MARGIN_SECONDS)
+                else:
+                    self.creds.refresh(google_requests.Request(session=shared_session()))
+                logger.info("Refreshed Gmail token; next expiry %s UTC", self.creds.expiry)
+                if self._seconds_until_refresh() <= 0:
+                    self._stopped.wait(REFRESH_RETRY_SECONDS)  # token without a usable expiry
+            except Exception as exc:
+                # The service still refreshes on demand; keep trying in the background.
+                logger.warning("Proactive Gmail token refresh failed: %s", exc)
+                self._stopped.wait(REFRESH_RETRY_SECONDS)
+
+    def _shares_token_file(self) -> bool:
+        # Service-account and inline (.env) tokens are private to this process.
+        return bool(
+            getattr(self.creds, "refresh_token", None)
+            and not get_env("GMAIL_TOKEN_JSON", required=False, default="")
+        )
+
+    def close(self) -> None:
+        self._stopped.set()
+
+
+_clients: dict[tuple[str, ...], _GmailClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_gmail_service(scopes: list[str] | None = None):
+    """Cached ``(service, user_id)``; the first call per scope set loads credentials."""
+    key = tuple(scopes or DEFAULT_GMAIL_SCOPES)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = _GmailClient(list(key))
+    return client.service(), client.user_id
+
 
-    service = build("gmail", "v1", credentials=creds)
-    return service, get_gmail_user_id()
\ No newline at end of file
+def reset_gmail_service() -> None:
+    """Drop cached clients, e.g. after re-running the OAuth setup."""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
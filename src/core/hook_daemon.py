@@ -0,0 +1,233 @@
+"""Resident service behind the Qwen Code hooks.
+
+Qwen runs the Stop hook after every response and the PostToolCall hook after
+every file write. Started fresh each time, the hooks pay for an interpreter,
+imports and a full ``rglob`` of ``Needs_Action``. This daemon keeps that state
+in memory and answers over a Unix socket; ``.qwen/hooks/hook_client.py`` is the
+thin client the hook commands call (and falls back to the original scripts
+when the daemon is not running).
+
+Directory listings are cached per directory and re-read only when that
+directory's mtime changes, so a request costs one ``stat`` per directory
+regardless of how many files the vault holds.
+
+Protocol: one JSON object per line in each direction::
+
+    {"hook": "stop", "vault": "/path/to/Vault"}      -> {"exit": 2, "stdout": "RALPH LOOP: ..."}
+    {"hook": "vault_sync", "vault": ..., "data": {}} -> {"exit": 0, "stdout": ""}
+    {"hook": "ping"}                                  -> {"exit": 0, "stdout": "pong"}
+
+    python -m src.core.hook_daemon             # serve (the client starts it on demand)
+    python -m src.core.hook_daemon ping
+"""
+from __future__ import annotations
+
+import argparse
+import fcntl
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from src.core.audit_logger import append_entry, enable_background_writer
+from src.core.skill_modules import load_skill_module
+
+
+logger = logging.getLogger("hook_daemon")
+
+SOCKET_PATH = Path(os.getenv("QWEN_HOOK_SOCKET", "/tmp/qwen-hook-daemon.sock"))
+LOCK_FILE = Path("/tmp/qwen-hook-daemon.lock")
+PID_FILE = Path("/tmp/qwen-hook-daemon.pid")
+IDLE_TIMEOUT = 3600  # started on demand, so exit when Qwen is no longer in use
+RACY_SECONDS = 2.0  # a directory changed this recently may change again within one mtime tick
+
+PENDING_SUFFIXES = {".md", ".txt", ".json"}
+
+
+class DirIndex:
+    """Files under ``root`` matching ``accept``, refreshed per directory by mtime."""
+
+    def __init__(self, root: Path, accept: Callable[[str], bool], recursive: bool = True):
+        self.root = root
+        self.accept = accept
+        self.recursive = recursive
+        # dir -> (mtime_ns, scanned_at, matching file names, subdirectories)
+        self._dirs: dict[str, tuple[int, float, list[str], list[str]]] = {}
+
+    def _scan(self, path: str, mtime_ns: int) -> tuple[int, float, list[str], list[str]]:
+        files, subdirs = [], []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if self.recursive:
+                        subdirs.append(entry.path)
+                elif self.accept(entry.name) and entry.is_file():
+                    files.append(entry.name)
+        return mtime_ns, time.time(), sorted(files), subdirs
+
+    def files(self) -> list[str]:
+        """Matching file names, in directory-then-name order."""
+        names: list[str] = []
+        seen: set[str] = set()
+        stack = [str(self.root)]
+        while stack:
+            path = stack.pop()
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            cached = self._dirs.get(path)
+            if (
+                cached is None
+                or cached[0] != mtime_ns
+                or cached[1] - mtime_ns / 1e9 < RACY_SECONDS
+            ):
+                cached = self._dirs[path] = self._scan(path, mtime_ns)
+            seen.add(path)
+            names.extend(cached[2])
+            stack.extend(reversed(cached[3]))
+        for stale in self._dirs.keys() - seen:
+            del self._dirs[stale]
+        return names
+
+
+def _is_pending(name: str) -> bool:
+    return not name.startswith(".") and os.path.splitext(name)[1] in PENDING_SUFFIXES
+
+
+class VaultState:
+    def __init__(self, vault: Path, stop_hook, sync_hook):
+        self.vault = vault
+        self.stop_hook = stop_hook
+        self.sync_hook = sync_hook
+        self.pending = DirIndex(vault / "Needs_Action", _is_pending)
+        prefix = stop_hook.RALPH_MARKER_PREFIX
+        self.markers = DirIndex(
+            vault / "Done",
+            lambda name: name.startswith(prefix) and name.endswith(".md"),
+            recursive=False,
+        )
+        self.lock = threading.Lock()
+
+    def stop(self) -> dict:
+        with self.lock:
+            pending = self.pending.files()
+            has_marker = bool(self.markers.files())
+        code, message, status, logged = self.stop_hook.evaluate(pending, has_marker)
+        append_entry(self.stop_hook.hook_record(status, logged), logs_dir=self.vault / "Logs")
+        return {"exit": code, "stdout": message}
+
+    def vault_sync(self, data: dict) -> dict:
+        line = self.sync_hook.dashboard_line(data, self.vault)
+        dashboard = self.vault / "Dashboard.md"
+        if line and dashboard.exists():
+            with self.lock, dashboard.open("a") as f:
+                f.write(line)
+        return {"exit": 0, "stdout": ""}
+
+
+class HookServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path):
+        super().__init__(str(path), _Handler)
+        self.stop_hook = load_skill_module(".qwen/hooks/ralph_stop_hook.py")
+        self.sync_hook = load_skill_module(".qwen/hooks/vault_sync_hook.py")
+        self.vaults: dict[str, VaultState] = {}
+        self.vaults_lock = threading.Lock()
+        self.last_request = time.monotonic()
+
+    def vault_state(self, vault: str) -> VaultState:
+        with self.vaults_lock:
+            state = self.vaults.get(vault)
+            if state is None:
+                state = self.vaults[vault] = VaultState(Path(vault), self.stop_hook, self.sync_hook)
+            return state
+
+    def dispatch(self, request: dict) -> dict:
+        hook = request.get("hook")
+        if hook == "ping":
+            return {"exit": 0, "stdout": "pong"}
+        state = self.vault_state(str(request["vault"]))
+        if hook == "stop":
+            return state.stop()
+        if hook == "vault_sync":
+            return state.vault_sync(request.get("data") or {})
+        raise ValueError(f"unknown hook {hook!r}")
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        self.server.last_request = time.monotonic()
+        for raw in self.rfile:
+            try:
+                response = self.server.dispatch(json.loads(raw))
+            except Exception as exc:
+                # The client runs the original hook script on any error reply.
+                logger.exception("Hook request failed")
+                response = {"error": str(exc)}
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+
+
+def serve(idle_timeout: float = IDLE_TIMEOUT) -> None:
+    lock = LOCK_FILE.open("w")
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        logger.info("hook daemon already running")
+        return
+    SOCKET_PATH.unlink(missing_ok=True)  # stale: we hold the lock, so nobody is serving it
+    server = HookServer(SOCKET_PATH)
+    PID_FILE.write_text(str(os.getpid()))
+    enable_background_writer()
+
+    def _idle_watch() -> None:
+        while time.monotonic() - server.last_request < idle_timeout:
+            time.sleep(min(60, idle_timeout))
+        server.shutdown()
+
+    threading.Thread(target=_idle_watch, daemon=True).start()
+    logger.info("hook daemon listening on %s", SOCKET_PATH)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        SOCKET_PATH.unlink(missing_ok=True)
+        PID_FILE.unlink(missing_ok=True)
+
+
+def ping() -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1)
+            sock.connect(str(SOCKET_PATH))
+            sock.sendall(b'{"hook": "ping"}\n')
+            return sock.makefile().readline().strip() != ""
+    except OSError:
+        return False
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Resident service for .qwen/hooks")
+    sub = parser.add_subparsers(dest="command")
+    run = sub.add_parser("serve", help="Run the daemon (default)")
+    run.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT)
+    sub.add_parser("ping", help="Exit 0 if the daemon answers")
+    args = parser.parse_args()
+
+    if args.command == "ping":
+        alive = ping()
+        print("hook daemon: running" if alive else "hook daemon: stopped")
+        sys.exit(0 if alive else 1)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    serve(getattr(args, "idle_timeout", IDLE_TIMEOUT))
+
+
+if __name__ == "__main__":
+    main()
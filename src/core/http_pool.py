@@ -0,0 +1,30 @@
+"""Process-wide HTTP connection pool.
+
+Every skill that talks HTTP goes through one ``requests.Session`` so keep-alive
+connections and TLS sessions are reused across calls, and across skills when
+they share a process (see ``src.core.skill_host``).
+"""
+from __future__ import annotations
+
+import threading
+
+
+_session = None
+_lock = threading.Lock()
+
+
+def shared_session():
+    """Return the pooled ``requests.Session`` for this process."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
@@ -0,0 +1,114 @@
+"""Cold-start report for the repo's entry points.
+
+Short-lived scripts (Qwen hooks, verify.py, cron runs) start often, so their
+import cost matters more than their work. For every entry point this runs a
+fresh interpreter, reports the best-of-N wall time, and uses
+``python -X importtime`` to attribute import time to top-level packages::
+
+    python -m src.core.import_profile
+    python -m src.core.import_profile --filter hooks --top 8
+
+Hooks and verify scripts are executed as-is (hooks get ``{}`` on stdin); skill
+daemons are only imported, since running them would start their loops.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from src.core.skill_modules import ROOT
+
+
+TIMEOUT = 30
+
+
+def entry_points() -> list[tuple[str, str, list[str]]]:
+    """``(label, kind, argv)`` for every script worth profiling."""
+    entries = []
+    for path in sorted((ROOT / ".qwen" / "hooks").glob("*.py")):
+        entries.append((f"hooks/{path.name}", "run", [str(path)]))
+    for path in sorted((ROOT / ".agents" / "skills").glob("*/scripts/verify.py")):
+        entries.append((f"{path.parent.parent.name}/verify.py", "run", [str(path)]))
+    for path in sorted((ROOT / ".agents" / "skills").glob("*/scripts/*.py")):
+        if path.name == "verify.py" or "oauth_setup" in path.name:
+            continue
+        rel = path.relative_to(ROOT)
+        code = f"from src.core.skill_modules import load_skill_module; load_skill_module({str(rel)!r})"
+        entries.append((f"{path.parent.parent.name}/{path.name}", "import", ["-c", code]))
+    return entries
+
+
+def _run(argv: list[str], importtime: bool = False) -> subprocess.CompletedProcess:
+    flags = ["-X", "importtime"] if importtime else []
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.getenv("PYTHONPATH")]))}
+    return subprocess.run(
+        [sys.executable, *flags, *argv],
+        cwd=ROOT, env=env, input="{}", capture_output=True, text=True, timeout=TIMEOUT,
+    )
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Cumulative microseconds per top-level package from ``-X importtime``."""
+    totals: dict[str, int] = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2][1:].rstrip()  # one space of padding, then two per nesting level
+        if name.startswith(" "):
+            continue  # nested import, already inside its parent's cumulative time
+        totals[name.split(".")[0]] += int(parts[1])
+    return dict(totals)
+
+
+def profile(label: str, argv: list[str], repeat: int) -> dict:
+    wall = []
+    status = "ok"
+    for _ in range(repeat):
+        started = time.perf_counter()
+        try:
+            proc = _run(argv)
+        except subprocess.TimeoutExpired:
+            return {"label": label, "wall_ms": None, "imports": {}, "status": "timeout"}
+        wall.append((time.perf_counter() - started) * 1000)
+        if proc.returncode != 0:
+            status = f"exit {proc.returncode}"
+    traced = _run(argv, importtime=True)
+    return {"label": label, "wall_ms": min(wall), "imports": parse_importtime(traced.stderr), "status": status}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Startup time per entry point")
+    parser.add_argument("--filter", help="Only entry points whose label contains this")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per entry point; best is reported")
+    parser.add_argument("--top", type=int, default=4, help="Top-level packages to list per entry point")
+    args = parser.parse_args()
+
+    baseline = profile("python -c pass", ["-c", "pass"], args.repeat)
+    print(f"interpreter baseline: {baseline['wall_ms']:.0f} ms\n")
+    print(f"{'entry point':<42} {'kind':<6} {'wall ms':>8} {'imports ms':>10}  heaviest imports (ms, traced)")
+    for label, kind, argv in entry_points():
+        if args.filter and args.filter not in label:
+            continue
+        result = profile(label, argv, args.repeat)
+        imports = result["imports"]
+        own = {k: v for k, v in imports.items() if k not in baseline["imports"]}
+        heaviest = sorted(own.items(), key=lambda kv: kv[1], reverse=True)[: args.top]
+        wall = "-" if result["wall_ms"] is None else f"{result['wall_ms']:.0f}"
+        note = "" if result["status"] == "ok" else f"  [{result['status']}]"
+        print(
+            f"{label:<42} {kind:<6} {wall:>8} {sum(own.values()) / 1000:>10.1f}  "
+            + ", ".join(f"{name} {us / 1000:.0f}" for name, us in heaviest)
+            + note
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Deferred imports for heavy optional SDKs.
+
+Short-lived entry points (hooks, verify scripts, cron runs) should not pay for
+google-api-python-client, mcp or schedule unless the code path that needs them
+actually runs::
+
+    discovery = lazy_import("googleapiclient.discovery")
+    ...
+    service = discovery.build("gmail", "v1", credentials=creds)  # imported here
+
+The real import happens on first attribute access, so a missing dependency
+surfaces as the usual ImportError at that point. After that, the proxy holds
+the module's attributes directly and lookups cost the same as on the module.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+
+
+_load_lock = threading.RLock()
+
+
+class LazyModule(ModuleType):
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_loaded"] = False
+
+    def _lazy_load(self) -> ModuleType:
+        with _load_lock:
+            module = importlib.import_module(self.__name__)
+            if not self.__dict__["_lazy_loaded"]:
+                self.__dict__.update(module.__dict__)
+                self.__dict__["_lazy_loaded"] = True
+            return module
+
+    def __getattr__(self, attr: str):
+        # Only reached for names not yet copied in, i.e. before the first load.
+        return getattr(self._lazy_load(), attr)
+
+    def __dir__(self):
+        return dir(self._lazy_load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_loaded"] else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return ``name`` if already imported, else a proxy that imports on first use."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
@@ -0,0 +1,122 @@
+"""Persistent set of already-processed item IDs for watchers.
+
+IDs are stored as 64-bit BLAKE2b hashes with a 32-bit "seen at" timestamp,
+12 bytes per record, in an append-only file. Membership is a dict lookup and
+``add`` appends a single record, so the cost per item no longer grows with the
+history. The file is rewritten (compacted) only when eviction or dead records
+make it worth it.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import time
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+_RECORD = struct.Struct("<QI")
+
+
+def _hash_id(item_id: str) -> int:
+    return int.from_bytes(hashlib.blake2b(item_id.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class ProcessedIdStore:
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: int | None = None,
+        max_items: int | None = None,
+        legacy_state_file: Path | None = None,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_items = max_items
+        self._seen: dict[int, int] = {}
+        self._records_on_disk = 0
+        self._compacted_at = time.time()
+        self._load(legacy_state_file)
+
+    def __contains__(self, item_id: str) -> bool:
+        key = _hash_id(str(item_id))
+        seen_at = self._seen.get(key)
+        if seen_at is None:
+            return False
+        if self.ttl_seconds and seen_at < time.time() - self.ttl_seconds:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def add(self, item_id: str) -> None:
+        key = _hash_id(str(item_id))
+        now = int(time.time())
+        seen_at = self._seen.get(key)
+        if seen_at is not None and not (self.ttl_seconds and seen_at < now - self.ttl_seconds):
+            return
+        # New, or expired and seen again: (re)start its TTL from now.
+        self._seen[key] = now
+        with self.path.open("ab") as f:
+            f.write(_RECORD.pack(key, now))
+        self._records_on_disk += 1
+        if (
+            (self.max_items and len(self._seen) > self.max_items * 1.1)
+            # Once per TTL, so a store without max_items still sheds old IDs.
+            or (self.ttl_seconds and now - self._compacted_at > self.ttl_seconds)
+            or self._records_on_disk > 2 * max(len(self._seen), 1024)
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop expired/overflow IDs and rewrite the file with live records only."""
+        if self.ttl_seconds:
+            cutoff = time.time() - self.ttl_seconds
+            self._seen = {k: t for k, t in self._seen.items() if t >= cutoff}
+        if self.max_items and len(self._seen) > self.max_items:
+            newest = sorted(self._seen.items(), key=lambda kv: kv[1])[-self.max_items:]
+            self._seen = dict(newest)
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        tmp.write_bytes(b"".join(_RECORD.pack(k, t) for k, t in self._seen.items()))
+        os.replace(tmp, self.path)
+        self._records_on_disk = len(self._seen)
+        self._compacted_at = time.time()
+
+    def _load(self, legacy_state_file: Path | None) -> None:
+        if not self.path.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._import_legacy(legacy_state_file)
+            return
+        data = self.path.read_bytes()
+        usable = len(data) - len(data) % _RECORD.size  # ignore a torn trailing record
+        for key, seen_at in _RECORD.iter_unpack(data[:usable]):
+            self._seen[key] = seen_at
+        self._records_on_disk = usable // _RECORD.size
+        expired = self.ttl_seconds and any(
+            t < time.time() - self.ttl_seconds for t in self._seen.values()
+        )
+        if (
+            expired
+            or (self.max_items and len(self._seen) > self.max_items)
+            or self._records_on_disk > 2 * max(len(self._seen), 1024)
+        ):
+            self.compact()
+
+    def _import_legacy(self, legacy_state_file: Path | None) -> None:
+        """Seed from the old ``{"processed_ids": [...]}`` JSON state, if any."""
+        if legacy_state_file is None or not legacy_state_file.exists():
+            return
+        try:
+            ids = json.loads(legacy_state_file.read_text()).get("processed_ids", [])
+        except (OSError, ValueError, AttributeError):
+            return
+        now = int(time.time())
+        for item_id in ids:
+            self._seen[_hash_id(str(item_id))] = now
+        self.compact()
+        logger.info("Imported %d processed IDs from %s", len(ids), legacy_state_file.name)
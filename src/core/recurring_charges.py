@@ -0,0 +1,297 @@
+"""Recurring-charge detection over the whole statement history.
+
+Every CSV in ``Vault/Accounting`` (including ``Drops/``) and the processed
+drops in ``Vault/Done`` is loaded into columnar ``array`` buffers: day
+ordinals, amounts and interned merchant ids. One sort by (merchant, day) and
+a single linear pass then give, per merchant:
+
+* the inter-arrival period (median gap, and the share of gaps close to it),
+* amount stability (coefficient of variation),
+* price changes (latest charge vs. the median of the earlier ones).
+
+Merchants are normalised with the shared ``audit_logic`` matcher first and a
+description clean-up otherwise, so "NETFLIX.COM 8452" and "Netflix.com
+ref 9911" group together.
+
+    python -m src.core.recurring_charges
+    python -m src.core.recurring_charges --json
+    python -m src.core.recurring_charges bench --rows 300000
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import random
+import re
+import time
+from array import array
+from collections import Counter
+from datetime import date, timedelta
+from itertools import repeat
+from operator import add, lshift, sub
+from pathlib import Path
+
+from src.core.audit_logic import get_matcher
+from src.core.config import get_vault_path
+
+
+MIN_OCCURRENCES = 3
+REGULAR_SHARE = 0.75  # share of gaps that must sit within the period's tolerance
+STABLE_CV = 0.25  # max coefficient of variation for a "stable" amount
+PRICE_CHANGE_MIN = 0.01  # ignore changes below 1%
+DAYS_PER_MONTH = 30.44
+
+# name, nominal days, tolerance in days
+PERIODS = (
+    ("weekly", 7, 2),
+    ("biweekly", 14, 3),
+    ("monthly", 30, 5),
+    ("quarterly", 91, 10),
+    ("yearly", 365, 20),
+)
+
+_TOKEN = re.compile(r"[a-z0-9&]+")
+_PREFIXES = {"pos", "purchase", "card", "debit", "ach", "payment", "recurring", "ref", "online", "www"}
+
+
+class Ledger:
+    """Charges as parallel columns; merchant names are interned to ids."""
+
+    def __init__(self):
+        self.days = array("l")
+        self.amounts = array("d")
+        self.merchants = array("l")
+        self.names: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._normalized: dict[str, str] = {}
+        self._seen: set[tuple[int, int, float]] = set()
+        self._first = get_matcher().first
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def merchant_id(self, description: str) -> int:
+        name = self._normalized.get(description)
+        if name is None:
+            name = self._normalized[description] = normalize_merchant(description, self._first)
+        mid = self._ids.get(name)
+        if mid is None:
+            mid = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return mid
+
+    def add(self, day: int, description: str, amount: float) -> None:
+        mid = self.merchant_id(description)
+        key = (mid, day, amount)
+        if key in self._seen:
+            return  # the same statement dropped twice
+        self._seen.add(key)
+        self.days.append(day)
+        self.amounts.append(amount)
+        self.merchants.append(mid)
+
+
+def normalize_merchant(description: str, first=None) -> str:
+    """Known merchant name, else the leading words of the cleaned description."""
+    known = (first or get_matcher().first)(description)
+    if known:
+        return known
+    words = [
+        w for w in _TOKEN.findall(description.lower())
+        if len(w) > 1 and w not in _PREFIXES and sum(c.isdigit() for c in w) * 2 <= len(w)
+    ]  # drops reference/card numbers but keeps names such as "office365"
+    return " ".join(words[:3]).title() or description.strip()
+
+
+def _charge(row: dict) -> float | None:
+    """Positive charge amount, or None for credits and unparseable rows."""
+    try:
+        amount = float(str(row.get("amount", "")).replace(",", "").strip())
+    except ValueError:
+        return None
+    kind = str(row.get("type") or "").strip().lower()
+    if kind:
+        return abs(amount) if kind == "debit" and amount else None
+    return -amount if amount < 0 else None
+
+
+def load_csv(path: Path, ledger: Ledger) -> None:
+    with path.open("r", encoding="utf-8", errors="ignore", newline="") as f:
+        reader = csv.DictReader(f)
+        if not reader.fieldnames:
+            return
+        reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+        for row in reader:
+            amount = _charge(row)
+            if amount is None:
+                continue
+            try:
+                day = date.fromisoformat(str(row.get("date", "")).strip()[:10]).toordinal()
+            except ValueError:
+                continue
+            ledger.add(day, str(row.get("description", "")), amount)
+
+
+def statement_files(vault: Path) -> list[Path]:
+    files = sorted((vault / "Accounting").rglob("*.csv")) if (vault / "Accounting").exists() else []
+    if (vault / "Done").exists():
+        files += sorted((vault / "Done").glob("*.csv"))
+    return files
+
+
+def load_vault(vault: Path) -> Ledger:
+    ledger = Ledger()
+    for path in statement_files(vault):
+        load_csv(path, ledger)
+    return ledger
+
+
+# ─── Detection ───────────────────────────────────────────────────────────
+
+def _median(values) -> float:
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    return ordered[mid] if len(ordered) % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+
+
+def _period(gap: float) -> tuple[str, int, int] | None:
+    for name, days, tolerance in PERIODS:
+        if abs(gap - days) <= tolerance:
+            return name, days, tolerance
+    return None
+
+
+def detect(ledger: Ledger, min_occurrences: int = MIN_OCCURRENCES) -> list[dict]:
+    """Recurring charges, most expensive per month first."""
+    n = len(ledger)
+    if not n:
+        return []
+    merchants, days, amounts = ledger.merchants, ledger.days, ledger.amounts
+    # One integer sort key per row (day ordinals stay below 2**22), built column-wise.
+    keys = list(map(add, map(lshift, merchants, repeat(22)), days))
+    order = sorted(range(n), key=keys.__getitem__)
+    d = array("l", map(days.__getitem__, order))
+    a = array("d", map(amounts.__getitem__, order))
+    gaps = array("l", map(sub, d[1:], d[:-1]))  # gaps[i] = d[i+1] - d[i]
+    latest = max(d)
+    # Rows are now grouped by merchant id in ascending order, so each group's
+    # bounds follow from the per-merchant counts.
+    counts = Counter(merchants)
+
+    found = []
+    start = 0
+    for mid in sorted(counts):
+        end = start + counts[mid]
+        if end - start >= min_occurrences:
+            charge = _analyze(ledger.names[mid], d, a, gaps, start, end, latest)
+            if charge is not None:
+                found.append(charge)
+        start = end
+    found.sort(key=lambda c: c["monthly_cost"], reverse=True)
+    return found
+
+
+def _analyze(name: str, d, a, gaps, start: int, end: int, latest: int) -> dict | None:
+    run_gaps = [g for g in gaps[start:end - 1] if g > 0]  # same-day splits are one charge
+    if len(run_gaps) < MIN_OCCURRENCES - 1:
+        return None
+    median_gap = _median(run_gaps)
+    period = _period(median_gap)
+    if period is None:
+        return None
+    label, nominal, tolerance = period
+    regular = sum(1 for g in run_gaps if abs(g - median_gap) <= tolerance) / len(run_gaps)
+    if regular < REGULAR_SHARE:
+        return None
+
+    run_amounts = a[start:end]
+    count = len(run_amounts)
+    mean = sum(run_amounts) / count
+    variance = sum((x - mean) ** 2 for x in run_amounts) / count
+    cv = (variance ** 0.5) / mean if mean else 0.0
+    last = run_amounts[-1]
+    previous = _median(run_amounts[:-1])
+    change = (last - previous) / previous if previous else 0.0
+
+    return {
+        "merchant": name,
+        "period": label,
+        "period_days": round(median_gap, 1),
+        "regularity": round(regular, 2),
+        "occurrences": count,
+        "first_date": date.fromordinal(d[start]).isoformat(),
+        "last_date": date.fromordinal(d[end - 1]).isoformat(),
+        "next_expected": (date.fromordinal(d[end - 1]) + timedelta(days=round(median_gap))).isoformat(),
+        "active": latest - d[end - 1] <= median_gap * 1.5,
+        "last_amount": round(last, 2),
+        "mean_amount": round(mean, 2),
+        "amount_cv": round(cv, 3),
+        "stable_amount": cv <= STABLE_CV,
+        "price_change_pct": round(change * 100, 1) if abs(change) >= PRICE_CHANGE_MIN else 0.0,
+        "monthly_cost": round(last * DAYS_PER_MONTH / nominal, 2),
+    }
+
+
+def briefing_lines(charges: list[dict], limit: int = 10) -> list[str]:
+    """Markdown bullets for the CEO briefing's Cost Optimization section."""
+    active = [c for c in charges if c["active"]]
+    if not active:
+        return []
+    total = sum(c["monthly_cost"] for c in active)
+    lines = [f"- Recurring charges: {len(active)} active, ~{total:,.2f}/month"]
+    for c in active[:limit]:
+        line = f"- {c['merchant']}: {c['last_amount']:,.2f} {c['period']} (~{c['monthly_cost']:,.2f}/month, {c['occurrences']} charges)"
+        if c["price_change_pct"] > 0:
+            line += f" — price up {c['price_change_pct']}%, review plan"
+        elif not c["stable_amount"]:
+            line += " — amount varies, check usage"
+        lines.append(line)
+    return lines
+
+
+# ─── CLI ─────────────────────────────────────────────────────────────────
+
+def _synthetic(rows: int, seed: int = 7) -> Ledger:
+    """Statement-like history: a few hundred subscriptions buried in one-off noise."""
+    rng = random.Random(seed)
+    ledger = Ledger()
+    start = date(2022, 1, 1).toordinal()
+    for i in range(300):
+        period, amount = rng.choice((7, 30, 30, 30, 91, 365)), rng.uniform(5, 200)
+        offset = rng.randrange(period)
+        for k in range(0, 1000 - offset, period):
+            price = round(amount * (1.1 if k > 600 and i % 4 == 0 else 1), 2)
+            ledger.add(start + offset + k, f"POS Vendor{i} Cloud #{rng.randrange(10**6)}", price)
+    while len(ledger) < rows:
+        ledger.add(start + rng.randrange(1000), f"Store{rng.randrange(20000)} purchase", round(rng.uniform(1, 500), 2))
+    return ledger
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Detect recurring charges in the statement history")
+    sub_parsers = parser.add_subparsers(dest="command")
+    bench = sub_parsers.add_parser("bench", help="Time detection on synthetic history")
+    bench.add_argument("--rows", type=int, default=300000)
+    parser.add_argument("--json", action="store_true", help="Print the full result as JSON")
+    args = parser.parse_args()
+
+    if args.command == "bench":
+        started = time.perf_counter()
+        ledger = _synthetic(args.rows)
+        built = time.perf_counter()
+        charges = detect(ledger)
+        done = time.perf_counter()
+        print(f"rows={len(ledger)} merchants={len(ledger.names)} recurring={len(charges)}")
+        print(f"load {built - started:.2f}s  detect {done - built:.2f}s")
+        return
+
+    charges = detect(load_vault(get_vault_path()))
+    if args.json:
+        print(json.dumps(charges, indent=2))
+    else:
+        print("\n".join(briefing_lines(charges, limit=len(charges))) or "No recurring charges detected")
+
+
+if __name__ == "__main__":
+    main()
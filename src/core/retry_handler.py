@@ -1,5 +1,13 @@
+import asyncio
+import contextvars
+import inspect
 import logging
+import random
+import threading
 import time
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
 
 
@@ -7,22 +15,325 @@ logger = logging.getLogger(__name__)
 
 
 class TransientError(Exception):
-    pass
+    def __init__(self, *args, retry_after: float | None = None):
+        super().__init__(*args)
+        # Server hint (e.g. HTTP Retry-After) in seconds; overrides backoff.
+        self.retry_after = retry_after
 
 
-def with_retry(max_attempts: int = 3, base_delay: int = 1, max_delay: int = 60):
+class CircuitOpenError(TransientError):
+    """Raised without calling the endpoint while its circuit is open."""
+
+
+# ─── Counters ────────────────────────────────────────────────────────────
+
+_stats: Counter = Counter()
+_stats_lock = threading.Lock()
+
+
+def _count(name: str, event: str) -> None:
+    with _stats_lock:
+        _stats[(name, event)] += 1
+
+
+def retry_stats() -> dict[str, dict[str, int]]:
+    """Snapshot of counters as ``{endpoint: {event: n}}``.
+
+    Events: calls, successes, failures, retries, short_circuits,
+    budget_exhausted, deadline_exceeded, opened.
+    """
+    with _stats_lock:
+        out: dict[str, dict[str, int]] = {}
+        for (name, event), n in _stats.items():
+            out.setdefault(name, {})[event] = n
+        return out
+
+
+# ─── Circuit breaker ─────────────────────────────────────────────────────
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Per-endpoint breaker: closed -> open after N straight failures ->
+    half-open after ``reset_timeout`` (one probe call) -> closed on success."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = HALF_OPEN
+                self._probing = False
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info("Circuit %s closed", self.name)
+            self.state = CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    logger.warning("Circuit %s opened after %d failures", self.name, self._failures)
+                    _count(self.name, "opened")
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+
+    def call(self, func, *args, **kwargs):
+        """Run ``func`` through the breaker. Only TransientError counts as a failure."""
+        if not self.allow():
+            _count(self.name, "short_circuits")
+            raise CircuitOpenError(f"{self.name} is unavailable (circuit open)")
+        _count(self.name, "calls")
+        try:
+            result = func(*args, **kwargs)
+        except TransientError:
+            _count(self.name, "failures")
+            self.record_failure()
+            raise
+        except Exception:
+            # The endpoint answered (e.g. a validation error); it is healthy.
+            self.record_success()
+            raise
+        except BaseException:
+            with self._lock:
+                self._probing = False
+            raise
+        _count(self.name, "successes")
+        self.record_success()
+        return result
+
+    async def call_async(self, func, *args, **kwargs):
+        """``call`` for coroutine functions."""
+        if not self.allow():
+            _count(self.name, "short_circuits")
+            raise CircuitOpenError(f"{self.name} is unavailable (circuit open)")
+        _count(self.name, "calls")
+        try:
+            result = await func(*args, **kwargs)
+        except TransientError:
+            _count(self.name, "failures")
+            self.record_failure()
+            raise
+        except Exception:
+            self.record_success()
+            raise
+        except BaseException:
+            with self._lock:
+                self._probing = False
+            raise
+        _count(self.name, "successes")
+        self.record_success()
+        return result
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> CircuitBreaker:
+    """Process-wide breaker for ``name``; the first caller's settings win."""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name, failure_threshold, reset_timeout)
+        return breaker
+
+
+# ─── Retry budget ────────────────────────────────────────────────────────
+
+class RetryBudget:
+    """Token bucket that caps retries at ``ratio`` of calls, plus a small
+    time-based floor, so an outage cannot multiply load by ``max_attempts``."""
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 0.1, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, amount: float) -> None:
+        now = time.monotonic()
+        amount += (now - self._updated) * self.min_per_second
+        self._updated = now
+        self._tokens = min(self.max_tokens, self._tokens + amount)
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._refill(self.ratio)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            self._refill(0.0)
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+
+DEFAULT_BUDGET = RetryBudget()
+
+
+# ─── Deadlines and server hints ──────────────────────────────────────────
+
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar("retry_deadline", default=None)
+
+
+def time_left(default: float | None = None) -> float | None:
+    """Seconds until the innermost ``with_retry`` deadline, else ``default``.
+
+    Use it to bound request timeouts, e.g. ``timeout=time_left(20)``.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return default
+    left = max(0.01, deadline - time.monotonic())  # still usable as a timeout
+    return left if default is None else min(default, left)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse an HTTP Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+# ─── Decorator ───────────────────────────────────────────────────────────
+
+def full_jitter(attempt: int, base_delay: float, max_delay: float) -> float:
+    return random.uniform(0, min(max_delay, base_delay * (2**attempt)))
+
+
+def with_retry(
+    max_attempts: int = 3,
+    base_delay: float = 1,
+    max_delay: float = 60,
+    breaker=None,
+    budget: RetryBudget | None = DEFAULT_BUDGET,
+    deadline: float | None = None,
+):
+    """Retry on TransientError with full-jitter backoff.
+
+    Works on plain functions and coroutine functions; the async form sleeps
+    with ``asyncio.sleep`` so it never blocks the event loop.
+
+    ``breaker`` is a breaker name, or a callable taking the wrapped call's
+    arguments and returning one (e.g. to key by instance URL). Retries draw
+    from ``budget`` (shared by default); an open circuit or an empty budget
+    raises at once instead of sleeping.
+
+    A ``retry_after`` on the error replaces the computed delay. ``deadline``
+    caps the whole call, retries included, in seconds; it is inherited by
+    nested retrying calls (the tighter one wins) and exposed to the wrapped
+    code through ``time_left()``. A retry that could not start before the
+    deadline is not attempted.
+    """
+
     def decorator(func):
+        def _begin(args, kwargs):
+            name = breaker(*args, **kwargs) if callable(breaker) else breaker
+            cb = get_breaker(name) if name else None
+            if budget is not None:
+                budget.deposit()
+            deadline_at = _deadline.get()
+            if deadline is not None:
+                mine = time.monotonic() + deadline
+                deadline_at = mine if deadline_at is None else min(deadline_at, mine)
+            return cb, name or func.__qualname__, _deadline.set(deadline_at)
+
+        def _delay(exc: TransientError, attempt: int, cb, label: str) -> float | None:
+            """Seconds to wait before the next attempt, or None to give up."""
+            if isinstance(exc, CircuitOpenError) or attempt == max_attempts - 1:
+                return None
+            if cb is not None and cb.state == OPEN:
+                return None
+            delay = exc.retry_after
+            if delay is None:
+                delay = full_jitter(attempt, base_delay, max_delay)
+            left = time_left()
+            if left is not None and delay >= left:
+                _count(label, "deadline_exceeded")
+                logger.warning("Not retrying %s: next attempt would miss the deadline", label)
+                return None
+            if budget is not None and not budget.try_withdraw():
+                _count(label, "budget_exhausted")
+                logger.warning("Retry budget exhausted for %s; not retrying", label)
+                return None
+            _count(label, "retries")
+            logger.warning("Attempt %s failed, retrying in %.1fs", attempt + 1, delay)
+            return delay
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cb, label, token = _begin(args, kwargs)
+                try:
+                    for attempt in range(max_attempts):
+                        try:
+                            if cb is not None:
+                                return await cb.call_async(func, *args, **kwargs)
+                            return await func(*args, **kwargs)
+                        except TransientError as exc:
+                            delay = _delay(exc, attempt, cb, label)
+                            if delay is None:
+                                raise
+                        await asyncio.sleep(delay)
+                finally:
+                    _deadline.reset(token)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            for attempt in range(max_attempts):
-                try:
-                    return func(*args, **kwargs)
-                except TransientError:
-                    if attempt == max_attempts - 1:
-                        raise
-                    delay = min(base_delay * (2**attempt), max_delay)
-                    logger.warning("Attempt %s failed, retrying in %ss", attempt + 1, delay)
+            cb, label, token = _begin(args, kwargs)
+            try:
+                for attempt in range(max_attempts):
+                    try:
+                        if cb is not None:
+                            return cb.call(func, *args, **kwargs)
+                        return func(*args, **kwargs)
+                    except TransientError as exc:
+                        delay = _delay(exc, attempt, cb, label)
+                        if delay is None:
+                            raise
                     time.sleep(delay)
+            finally:
+                _deadline.reset(token)
 
         return wrapper
 
@@ -0,0 +1,84 @@
+"""Typed settings snapshot built from the environment.
+
+Use ``src.core.config.settings()`` to get the current instance; it parses once,
+shares the result, and swaps in a new snapshot when ``.env`` changes.
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+from src.core.config import get_bool
+
+
+@dataclass(frozen=True)
+class OdooSettings:
+    url: str
+    db: str
+    user: str
+    password: str
+
+
+@dataclass(frozen=True)
+class SmtpSettings:
+    server: str
+    port: int
+    sender_email: str
+    sender_password: str
+
+
+@dataclass(frozen=True)
+class ExecutorSettings:
+    workers: int
+    odoo: int
+    smtp: int
+    calendar: int
+
+
+@dataclass(frozen=True)
+class Settings:
+    dry_run: bool
+    agent_zone: str
+    audit_log_async: bool
+    orchestrator_interval: float
+    orchestrator_events: bool
+    orchestrator_reconcile: float
+    odoo: OdooSettings
+    smtp: SmtpSettings
+    executor: ExecutorSettings
+
+    @classmethod
+    def from_env(cls) -> Settings:
+        zone = os.getenv("AGENT_ZONE", "local").strip().lower()
+        if zone not in {"local", "cloud"}:
+            raise RuntimeError("AGENT_ZONE must be either 'local' or 'cloud'")
+        return cls(
+            dry_run=get_bool("DRY_RUN", True),
+            agent_zone=zone,
+            audit_log_async=get_bool("AUDIT_LOG_ASYNC"),
+            orchestrator_interval=float(os.getenv("ORCHESTRATOR_INTERVAL_SECONDS", "5")),
+            orchestrator_events=get_bool("ORCHESTRATOR_EVENTS", True),
+            orchestrator_reconcile=float(os.getenv("ORCHESTRATOR_RECONCILE_SECONDS", "60")),
+            odoo=OdooSettings(
+                url=os.getenv("ODOO_URL", "http://localhost:8069"),
+                db=os.getenv("ODOO_DB", "odoo_db"),
+                user=os.getenv("ODOO_USER", "admin"),
+                password=os.getenv("ODOO_PASSWORD", "admin"),
+            ),
+            smtp=SmtpSettings(
+                server=os.getenv("SMTP_SERVER", "smtp.gmail.com"),
+                port=int(os.getenv("SMTP_PORT", "587")),
+                sender_email=(
+                    os.getenv("SENDER_EMAIL", "")
+                    or os.getenv("GMAIL_SENDER", "")
+                    or os.getenv("GMAIL_DELEGATE_EMAIL", "")
+                ),
+                sender_password=os.getenv("SENDER_PASSWORD", ""),
+            ),
+            executor=ExecutorSettings(
+                workers=int(os.getenv("APPROVED_WORKERS", "8")),
+                odoo=int(os.getenv("ODOO_MAX_CONCURRENCY", "4")),
+                smtp=int(os.getenv("SMTP_MAX_CONCURRENCY", "2")),
+                calendar=int(os.getenv("CALENDAR_MAX_CONCURRENCY", "4")),
+            ),
+        )
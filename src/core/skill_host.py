@@ -0,0 +1,251 @@
+"""Run every background skill in one process.
+
+``watchdog.PROCESSES`` starts one interpreter per skill, and each one pays for
+its own imports (google, requests, mcp) and its own 40-80 MB of RSS. The host
+instead loads each skill script once (``src.core.skill_modules``) and runs its
+main loop in a supervised thread:
+
+* a skill that raises or returns is logged, reported to ``Needs_Action`` and
+  restarted with exponential backoff, without touching the other skills;
+* HTTP goes through one pooled session (``src.core.http_pool``) and skill
+  modules are shared with the orchestrator, so nothing is imported twice;
+* ``/tmp/<skill>.pid`` points at the host, so the watchdog sees the skills as
+  running and does not start duplicates.
+
+The stdio MCP servers (gmail-send-mcp, odoo-mcp) are only useful with a client
+on the other end of the pipe, so they are loaded as libraries here; MCP clients
+keep launching their own server processes.
+
+    python -m src.core.skill_host                 # run all skills
+    python -m src.core.skill_host --only orchestrator finance-watcher
+    python -m src.core.skill_host report          # startup/RSS vs multi-process
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+from src.core.audit_logger import enable_background_writer, log_action
+from src.core.base_watcher import install_wake_handler, wake_file
+from src.core.config import get_vault_path
+from src.core.skill_modules import ROOT, load_skill_module
+
+
+logger = logging.getLogger("skill_host")
+
+PID_FILE = Path("/tmp/skill-host.pid")
+MIN_BACKOFF = 2.0
+MAX_BACKOFF = 300.0
+HEALTHY_AFTER = 120.0  # a run this long resets the backoff
+
+
+@dataclass(frozen=True)
+class HostedSkill:
+    script: str
+    entry: Callable[[ModuleType], None] | None  # None: load as a library only
+
+
+SKILLS: dict[str, HostedSkill] = {
+    "orchestrator": HostedSkill(".agents/skills/orchestrator/scripts/orchestrator.py", lambda m: m.main()),
+    "filesystem-watcher": HostedSkill(".agents/skills/filesystem-watcher/scripts/filesystem_watcher.py", lambda m: m.main()),
+    "finance-watcher": HostedSkill(".agents/skills/finance-watcher/scripts/finance_watcher.py", lambda m: m.main()),
+    "gmail-watcher": HostedSkill(".agents/skills/gmail-watcher/scripts/gmail_watcher.py", lambda m: m.GmailWatcher().run()),
+    "gmail-send-mcp": HostedSkill(".agents/skills/gmail-send-mcp/scripts/gmail_send_mcp.py", None),
+    "linkedin-poster": HostedSkill(".agents/skills/linkedin-poster/scripts/linkedin_poster.py", lambda m: m.main()),
+    "social-poster": HostedSkill(".agents/skills/social-poster/scripts/social_poster.py", lambda m: m.main()),
+    "ceo-briefing": HostedSkill(".agents/skills/ceo-briefing/scripts/ceo_briefing.py", lambda m: m.main()),
+    "odoo-mcp": HostedSkill(".agents/skills/odoo-integration/scripts/odoo_mcp_server.py", None),
+}
+
+
+def rss_kb() -> int:
+    """Resident set size of this process in kB (Linux), 0 if unknown."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _notify_human(vault: Path, message: str) -> None:
+    alerts = vault / "Needs_Action"
+    alerts.mkdir(parents=True, exist_ok=True)
+    (alerts / f"ALERT_{int(time.time())}.md").write_text(
+        f"""---
+type: system_alert
+status: pending
+---
+
+{message}
+"""
+    )
+
+
+# ─── Supervision ─────────────────────────────────────────────────────────
+
+def _supervise(name: str, skill: HostedSkill, vault: Path, stop: threading.Event) -> None:
+    backoff = MIN_BACKOFF
+    while not stop.is_set():
+        started = time.monotonic()
+        try:
+            module = load_skill_module(skill.script)
+            skill.entry(module)
+            error = "main loop returned"
+        except (Exception, SystemExit) as exc:
+            logger.exception("%s crashed", name)
+            error = f"{type(exc).__name__}: {exc}"
+        if stop.is_set():
+            return
+
+        if time.monotonic() - started >= HEALTHY_AFTER:
+            backoff = MIN_BACKOFF
+        log_action(
+            action_type="skill_restart",
+            target=name,
+            parameters={"backoff_seconds": backoff},
+            result=f"error: {error}",
+            actor="skill_host",
+        )
+        try:
+            _notify_human(vault, f"{name} stopped in the skill host ({error}); restarting in {backoff:.0f}s")
+        except OSError:
+            logger.warning("Could not write alert for %s", name)
+        stop.wait(backoff)
+        backoff = min(backoff * 2, MAX_BACKOFF)
+
+
+def run_host(names: list[str]) -> None:
+    started = time.perf_counter()
+    vault = get_vault_path()
+    PID_FILE.write_text(str(os.getpid()))
+    enable_background_writer()  # from the main thread, so SIGTERM flushes it
+    stop = threading.Event()
+
+    def _shutdown(signum, frame):
+        stop.set()
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+    # Before the skill pid files point here: wake_watcher() sends SIGUSR1,
+    # which would otherwise kill the host. Hosted watchers write their wake
+    # files once they register with this handler.
+    install_wake_handler()
+
+    for name in names:
+        skill = SKILLS[name]
+        Path(f"/tmp/{name}.pid").write_text(str(os.getpid()))
+        if skill.entry is None:
+            try:
+                load_skill_module(skill.script)
+            except Exception as exc:
+                logger.warning("%s unavailable: %s", name, exc)
+            continue
+        threading.Thread(
+            target=_supervise,
+            args=(name, skill, vault, stop),
+            name=f"skill:{name}",
+            daemon=True,
+        ).start()
+
+    logger.info(
+        "Hosting %d skills in pid %d (startup %.2fs, RSS %.1f MB)",
+        len(names), os.getpid(), time.perf_counter() - started, rss_kb() / 1024,
+    )
+    stop.wait()
+    # Skill loops block in their own sleeps, so they are daemon threads and
+    # end with the process; atexit flushes the audit writer.
+    logger.info("Skill host stopping")
+    for name in names:
+        Path(f"/tmp/{name}.pid").unlink(missing_ok=True)
+        wake_file(name).unlink(missing_ok=True)
+    PID_FILE.unlink(missing_ok=True)
+
+
+# ─── Startup / memory report ─────────────────────────────────────────────
+
+def _probe(names: list[str]) -> None:
+    """Load the named skills and print import time and RSS as JSON."""
+    started = time.perf_counter()
+    failed = {}
+    for name in names:
+        try:
+            load_skill_module(SKILLS[name].script)
+        except Exception as exc:
+            failed[name] = f"{type(exc).__name__}: {exc}"
+    print(json.dumps({"seconds": time.perf_counter() - started, "rss_kb": rss_kb(), "failed": failed}))
+
+
+def _run_probe(names: list[str]) -> dict:
+    started = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-m", "src.core.skill_host", "probe", *names],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+    result["wall"] = time.perf_counter() - started
+    return result
+
+
+def report(names: list[str]) -> None:
+    """Compare one interpreter per skill with all skills in one interpreter.
+
+    Each probe starts a fresh interpreter and loads the skill modules, which is
+    the startup work both layouts share; the main loops themselves are not run.
+    """
+    print(f"{'skill':<20} {'startup s':>10} {'RSS MB':>8}")
+    total_wall = 0.0
+    total_rss = 0
+    for name in names:
+        r = _run_probe([name])
+        total_wall += r["wall"]
+        total_rss += r["rss_kb"]
+        note = f"  (load failed: {r['failed'][name]})" if r["failed"] else ""
+        print(f"{name:<20} {r['wall']:>10.2f} {r['rss_kb'] / 1024:>8.1f}{note}")
+    hosted = _run_probe(names)
+    print("-" * 40)
+    print(f"{'multi-process total':<20} {total_wall:>10.2f} {total_rss / 1024:>8.1f}")
+    print(f"{'single host':<20} {hosted['wall']:>10.2f} {hosted['rss_kb'] / 1024:>8.1f}")
+    if total_rss:
+        print(f"RSS saved: {(total_rss - hosted['rss_kb']) / 1024:.1f} MB "
+              f"({1 - hosted['rss_kb'] / total_rss:.0%}); "
+              f"CPU startup saved: {total_wall - hosted['wall']:.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run all background skills in one process")
+    sub = parser.add_subparsers(dest="command")
+    sub.add_parser("run", help="Host the skills (default)")
+    sub.add_parser("report", help="Compare startup time and RSS with one process per skill")
+    probe = sub.add_parser("probe", help=argparse.SUPPRESS)
+    probe.add_argument("names", nargs="+", choices=sorted(SKILLS))
+    parser.add_argument("--only", nargs="+", choices=sorted(SKILLS), help="Host a subset of skills")
+    args = parser.parse_args()
+
+    names = args.only or list(SKILLS)
+    if args.command == "probe":
+        _probe(args.names)
+    elif args.command == "report":
+        report(names)
+    else:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s %(name)s %(levelname)s %(message)s",
+        )
+        run_host(names)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Load skill scripts as modules once per process.
+
+Skills live under ``.agents/skills/<name>/scripts`` and are not a package, so
+they are loaded by file path. Loading through this cache means the orchestrator
+and the single-process host share one copy of each skill (and whatever
+clients or state it keeps at module level) instead of re-executing the file on
+every call.
+"""
+from __future__ import annotations
+
+import importlib.util
+import re
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+_modules: dict[Path, ModuleType] = {}
+_lock = threading.RLock()
+
+
+def _module_name(path: Path) -> str:
+    return re.sub(r"\W", "_", f"skill_{path.parent.parent.name}_{path.stem}")
+
+
+def load_skill_module(relative_path: str | Path) -> ModuleType:
+    """Import a skill script (path relative to the repo root) and cache it."""
+    path = (ROOT / relative_path).resolve()
+    with _lock:
+        module = _modules.get(path)
+        if module is not None:
+            return module
+        spec = importlib.util.spec_from_file_location(_module_name(path), path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Unable to load skill module {relative_path}")
+        # Appended rather than prepended, so a script such as watchdog.py can
+        # never shadow an installed package of the same name.
+        if str(path.parent) not in sys.path:
+            sys.path.append(str(path.parent))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(spec.name, None)
+            raise
+        _modules[path] = module
+        return module
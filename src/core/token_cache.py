@@ -0,0 +1,186 @@
+"""OAuth token files shared by every process, refreshed by one at a time.
+
+The watchers, the orchestrator and the MCP servers all read the same token
+files (Gmail ``token.json``, ``GOOGLE_CALENDAR_TOKEN_PATH``,
+``LINKEDIN_TOKEN_PATH``). Left alone, each process refreshes an expiring
+token on its own and rewrites the file, so concurrent refreshes race and
+overwrite each other.
+
+Here a refresh is single-flight: it runs under a per-file thread lock plus an
+``flock`` on ``<token file>.lock``, and re-reads the file once the lock is
+held. If another process already wrote a fresh token, that one is adopted and
+no request is made. Writes go to a temporary file that is renamed into place,
+so readers never see a half-written token. Reads are cached per process and
+only re-parse the file when its mtime/size changes.
+"""
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.core.http_pool import shared_session
+from src.core.lazy import lazy_import
+
+google_requests = lazy_import("google.auth.transport.requests")
+oauth2_credentials = lazy_import("google.oauth2.credentials")
+
+
+REFRESH_MARGIN_SECONDS = 300
+LOCK_SUFFIX = ".lock"
+
+
+class TokenFile:
+    def __init__(self, path: Path):
+        self.path = path
+        self._thread_lock = threading.Lock()
+        self._stamp: tuple[int, int, int] | None = None
+        self._data: dict | None = None
+
+    def _current_stamp(self) -> tuple[int, int, int] | None:
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def read(self) -> dict | None:
+        """Parsed token, or None if the file does not exist. Do not mutate it."""
+        stamp = self._current_stamp()
+        if stamp is None:
+            return None
+        if stamp != self._stamp:
+            self._data = json.loads(self.path.read_text())
+            self._stamp = stamp
+        return self._data
+
+    @contextmanager
+    def locked(self):
+        """Exclusive across threads of this process and across processes."""
+        lock_path = self.path.with_name(self.path.name + LOCK_SUFFIX)
+        with self._thread_lock, open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write(self, data: dict) -> None:
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, indent=2))
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, self.path)
+        self._data, self._stamp = data, self._current_stamp()
+
+    def save(self, data: dict) -> None:
+        with self.locked():
+            self._write(data)
+
+    def refresh(
+        self,
+        needs_refresh: Callable[[dict | None], bool],
+        fetch: Callable[[dict | None], dict],
+    ) -> dict | None:
+        """Run ``fetch`` only if the token on disk still ``needs_refresh``.
+
+        Both callbacks see the file as it is once the lock is held, so a token
+        refreshed meanwhile by another process is returned as-is.
+        """
+        with self.locked():
+            current = self.read()
+            if not needs_refresh(current):
+                return current
+            fresh = fetch(current)
+            self._write(fresh)
+            return fresh
+
+
+_files: dict[Path, TokenFile] = {}
+_files_lock = threading.Lock()
+
+
+def token_file(path: str | Path) -> TokenFile:
+    """The process-wide TokenFile for ``path`` (one lock per file)."""
+    resolved = Path(path).expanduser().resolve()
+    with _files_lock:
+        tf = _files.get(resolved)
+        if tf is None:
+            tf = _files[resolved] = TokenFile(resolved)
+        return tf
+
+
+def expires_within(expires_at: float | None, margin: float = REFRESH_MARGIN_SECONDS) -> bool:
+    """True if a Unix-time expiry is known and closer than ``margin``."""
+    return expires_at is not None and expires_at - time.time() <= margin
+
+
+# ─── Google user credentials ─────────────────────────────────────────────
+
+def _google_expiry(info: dict | None) -> datetime | None:
+    """Naive-UTC expiry from an authorized-user JSON, as google-auth stores it."""
+    raw = (info or {}).get("expiry")
+    if not raw:
+        return None
+    return datetime.strptime(raw.rstrip("Z").split(".")[0], "%Y-%m-%dT%H:%M:%S")
+
+
+def _google_expires_at(expiry: datetime | None) -> float | None:
+    return None if expiry is None else expiry.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _adopt(creds, info: dict) -> None:
+    # Update in place so services already built on ``creds`` pick it up.
+    creds.token = info.get("token")
+    creds.expiry = _google_expiry(info)
+
+
+_google_creds: dict[tuple[Path, tuple[str, ...] | None], object] = {}
+_google_lock = threading.Lock()
+
+
+def google_credentials(path: str | Path, scopes: list[str] | None = None, margin: float = REFRESH_MARGIN_SECONDS):
+    """Cached user credentials for a token file, refreshed once across processes.
+
+    Returns the same object for the same ``(path, scopes)`` on every call,
+    or None if the file does not exist. The object is brought up to date
+    with the file (another process may have refreshed it) and refreshed
+    here if it expires within ``margin`` seconds.
+    """
+    tf = token_file(path)
+    info = tf.read()
+    if info is None:
+        return None
+    key = (tf.path, tuple(scopes) if scopes else None)
+    with _google_lock:
+        creds = _google_creds.get(key)
+        if creds is None:
+            creds = _google_creds[key] = oauth2_credentials.Credentials.from_authorized_user_info(info, scopes)
+        elif info.get("token") != creds.token and _google_expiry(info) and (
+            creds.expiry is None or _google_expiry(info) > creds.expiry
+        ):
+            _adopt(creds, info)
+    if creds.refresh_token and expires_within(_google_expires_at(creds.expiry), margin):
+        refresh_google_credentials(path, creds, margin)
+    return creds
+
+
+def refresh_google_credentials(path: str | Path, creds, margin: float = REFRESH_MARGIN_SECONDS) -> None:
+    """Refresh ``creds`` through the shared token file at ``path``."""
+
+    def needs_refresh(info: dict | None) -> bool:
+        return info is None or expires_within(_google_expires_at(_google_expiry(info)), margin)
+
+    def fetch(info: dict | None) -> dict:
+        creds.refresh(google_requests.Request(session=shared_session()))
+        return {**(info or {}), **json.loads(creds.to_json())}
+
+    info = token_file(path).refresh(needs_refresh, fetch)
+    if info is not None and info.get("token") != creds.token:
+        _adopt(creds, info)
+
@@ -0,0 +1,108 @@
+"""File-system events for the vault, as a queue the orchestrator can block on.
+
+A watchdog Observer (inotify on Linux) watches the vault recursively. Every
+event is forwarded to an optional sink (the dashboard model). Events that
+bring a file *into* one of the trigger folders (create, move-in, close after
+write) are queued and wake ``wait()`` immediately. Moves out of those folders
+do not, so the orchestrator archiving items to Done never wakes itself.
+
+If watchdog cannot start (not installed, inotify limit reached), ``start()``
+returns False and the caller keeps polling.
+"""
+from __future__ import annotations
+
+import logging
+import queue
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+TRIGGER_FOLDERS = ("Needs_Action", "Approved", "Rejected")
+SETTLE_SECONDS = 0.25  # let a burst of writes land before the loop reads the files
+WAKE_KINDS = {"created", "moved", "closed"}
+
+
+class VaultEvents:
+    def __init__(
+        self,
+        vault: Path,
+        trigger_folders: Iterable[str] = TRIGGER_FOLDERS,
+        sink: Callable[[str, str, str | None], None] | None = None,
+    ):
+        self.vault = vault
+        self.trigger_folders = tuple(trigger_folders)
+        self.sink = sink
+        self._queue: queue.SimpleQueue[str] = queue.SimpleQueue()
+        self._observer = None
+
+    def _folder_of(self, path: str | None) -> str | None:
+        """Trigger folder containing ``path``, if any."""
+        if not path:
+            return None
+        try:
+            parts = Path(path).relative_to(self.vault).parts
+        except ValueError:
+            return None
+        if len(parts) >= 2 and parts[0] in self.trigger_folders:
+            return parts[0]
+        return None
+
+    def dispatch(self, kind: str, src: str, dest: str | None = None) -> None:
+        if self.sink is not None:
+            try:
+                self.sink(kind, src, dest)
+            except Exception:
+                logger.exception("Vault event sink failed for %s %s", kind, src)
+        if kind in WAKE_KINDS:
+            folder = self._folder_of(dest if kind == "moved" else src)
+            if folder is not None:
+                self._queue.put(folder)
+
+    def start(self) -> bool:
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.warning("watchdog is not installed; orchestrator falls back to polling")
+            return False
+
+        events = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory and event.event_type != "moved":
+                    return
+                events.dispatch(event.event_type, event.src_path, getattr(event, "dest_path", None) or None)
+
+        observer = Observer()
+        try:
+            observer.schedule(_Handler(), str(self.vault), recursive=True)
+            observer.start()
+        except OSError as exc:
+            logger.warning("Cannot watch %s (%s); orchestrator falls back to polling", self.vault, exc)
+            return False
+        self._observer = observer
+        return True
+
+    def stop(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+
+    def wait(self, timeout: float) -> set[str]:
+        """Trigger folders with new files; empty if ``timeout`` passed quietly."""
+        try:
+            first = self._queue.get(timeout=max(0.0, timeout))
+        except queue.Empty:
+            return set()
+        time.sleep(SETTLE_SECONDS)
+        folders = {first}
+        while True:
+            try:
+                folders.add(self._queue.get_nowait())
+            except queue.Empty:
+                return folders
@@ -0,0 +1,471 @@
+"""Durable work queue for vault items (SQLite, WAL mode).
+
+Each file in Needs_Action, Pending_Approval, Approved and Rejected has a row in
+``Logs/.work_queue.sqlite3`` recording its stage (``needs_action`` →
+``pending_approval`` → ``approved`` → ``done``, or ``rejected`` → ``done``).
+Processes take work with ``claim()``: an index range scan on
+``(stage, available_at)``, or ``(stage, suffix, available_at)`` when only some
+file types are wanted, that hands out a lease, so the orchestrator and
+qwen_agent never run the same item twice. A worker then either ``ack()``s the
+item into its next stage or ``fail()``s it; failures come back after an
+exponential backoff and land in ``dead`` after MAX_ATTEMPTS. A lease that runs
+out (the process died) makes the item claimable again and counts as an attempt.
+
+``record_step()`` stores each finished step's result on the row, so a retry
+after a crash between, say, the Odoo create and the move to Done skips the
+steps that already happened.
+
+``sync()`` keeps rows in line with the folders. It stats the directories it
+knows about and lists only those whose mtime changed, so an idle sync is a few
+``stat`` calls, not a scan.
+
+    python -m src.core.work_queue stats
+    python -m src.core.work_queue list --stage dead
+    python -m src.core.work_queue retry Approved/APPROVAL_x.md
+    python -m src.core.work_queue bench --items 100000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.core.config import get_vault_path
+
+
+logger = logging.getLogger(__name__)
+
+QUEUE_NAME = ".work_queue.sqlite3"
+
+STAGES = {
+    "Needs_Action": "needs_action",
+    "Pending_Approval": "pending_approval",
+    "Approved": "approved",
+    "Rejected": "rejected",
+}
+DONE, DEAD = "done", "dead"
+
+MAX_ATTEMPTS = 5
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 3600
+LEASE_SECONDS = 300
+DONE_RETENTION_DAYS = 30
+# A directory modified this recently may still change within the same mtime
+# tick, so it is listed again on the next sync.
+SETTLE_NS = 2_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    dir TEXT NOT NULL,
+    name TEXT NOT NULL,
+    suffix TEXT NOT NULL DEFAULT '',
+    stage TEXT NOT NULL,
+    available_at REAL NOT NULL,
+    lease_token TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    steps TEXT NOT NULL DEFAULT '{}',
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_items_claim ON items (stage, available_at);
+CREATE INDEX IF NOT EXISTS ix_items_dir ON items (dir);
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    stage TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+"""
+
+
+@dataclass
+class WorkItem:
+    id: int
+    path: Path
+    stage: str
+    attempts: int
+    token: str
+    steps: dict = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+
+def queue_path(vault: Path | None = None) -> Path:
+    return (vault or get_vault_path()) / "Logs" / QUEUE_NAME
+
+
+def _suffix(name: str) -> str:
+    return os.path.splitext(name)[1]
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    with _Transaction(conn):
+        # Queues created before items had a suffix column.
+        if "suffix" not in {row[1] for row in conn.execute("PRAGMA table_info(items)")}:
+            conn.execute("ALTER TABLE items ADD COLUMN suffix TEXT NOT NULL DEFAULT ''")
+            conn.executemany(
+                "UPDATE items SET suffix = ? WHERE id = ?",
+                [(_suffix(name), item_id) for item_id, name in conn.execute("SELECT id, name FROM items").fetchall()],
+            )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_items_suffix ON items (stage, suffix, available_at)")
+    return conn
+
+
+def _suffix_filter(suffixes: tuple[str, ...] | None) -> tuple[str, tuple[str, ...]]:
+    if not suffixes:
+        return "", ()
+    return f" AND suffix IN ({', '.join('?' * len(suffixes))})", tuple(suffixes)
+
+
+def backoff_seconds(attempts: int) -> float:
+    return min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** max(0, attempts - 1))
+
+
+class WorkQueue:
+    """One queue database per vault; safe to share between threads."""
+
+    def __init__(self, vault: Path, db_path: Path | None = None):
+        self.vault = vault
+        self.db_path = db_path or queue_path(vault)
+        self._local = threading.local()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = _connect(self.db_path)
+        return conn
+
+    def _rel(self, path: Path) -> str:
+        return path.relative_to(self.vault).as_posix()
+
+    def _transaction(self):
+        return _Transaction(self.conn)
+
+    # ─── Folder sync ─────────────────────────────────────────────────────
+
+    def sync(self) -> int:
+        """Pick up files added, moved or removed since the last sync; returns rows changed."""
+        now = time.time()
+        appeared: list[tuple[str, str, str, str]] = []
+        vanished: dict[str, list[int]] = {}
+        with self._transaction() as conn:
+            known = {row[0]: row[1] for row in conn.execute("SELECT path, mtime_ns FROM dirs")}
+            pending = list(STAGES.items()) + conn.execute("SELECT path, stage FROM dirs").fetchall()
+            seen: set[str] = set()
+            while pending:
+                rel_dir, stage = pending.pop()
+                if rel_dir in seen:
+                    continue
+                seen.add(rel_dir)
+                try:
+                    mtime_ns = os.stat(self.vault / rel_dir).st_mtime_ns
+                except FileNotFoundError:
+                    self._drop_dir(conn, rel_dir, vanished)
+                    continue
+                if known.get(rel_dir) == mtime_ns:
+                    continue
+                files, subdirs = self._list(rel_dir)
+                pending.extend((sub, stage) for sub in subdirs)
+                rows = dict(conn.execute("SELECT name, id FROM items WHERE dir = ?", (rel_dir,)).fetchall())
+                for name in files - rows.keys():
+                    appeared.append((f"{rel_dir}/{name}", rel_dir, name, stage))
+                for name in rows.keys() - files:
+                    vanished.setdefault(name, []).append(rows[name])
+                settled = mtime_ns if time.time_ns() - mtime_ns > SETTLE_NS else 0
+                conn.execute(
+                    "INSERT OR REPLACE INTO dirs (path, stage, mtime_ns) VALUES (?, ?, ?)",
+                    (rel_dir, stage, settled),
+                )
+            return self._apply(conn, appeared, vanished, now)
+
+    def _list(self, rel_dir: str) -> tuple[set[str], list[str]]:
+        files, subdirs = set(), []
+        with os.scandir(self.vault / rel_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    subdirs.append(f"{rel_dir}/{entry.name}")
+                elif entry.is_file():
+                    files.add(entry.name)
+        return files, subdirs
+
+    def _drop_dir(self, conn, rel_dir: str, vanished: dict[str, list[int]]) -> None:
+        for name, item_id in conn.execute("SELECT name, id FROM items WHERE dir = ?", (rel_dir,)):
+            vanished.setdefault(name, []).append(item_id)
+        conn.execute("DELETE FROM dirs WHERE path = ?", (rel_dir,))
+
+    def _apply(self, conn, appeared, vanished, now: float) -> int:
+        changed = 0
+        for path, rel_dir, name, stage in appeared:
+            moved_from = vanished.get(name)
+            if moved_from:
+                # Same file name left one tracked folder and arrived in
+                # another (e.g. Pending_Approval → Approved): same item. A
+                # finished or dead row is a new file, so its steps are not
+                # carried over.
+                conn.execute(
+                    "UPDATE items SET path = ?, dir = ?, stage = ?, available_at = ?, lease_token = NULL,"
+                    " attempts = 0, last_error = NULL,"
+                    " steps = CASE WHEN stage IN (?, ?) THEN '{}' ELSE steps END WHERE id = ?",
+                    (path, rel_dir, stage, now, DONE, DEAD, moved_from.pop()),
+                )
+            else:
+                conn.execute(
+                    "INSERT INTO items (path, dir, name, suffix, stage, available_at, created_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT (path) DO UPDATE SET dir = excluded.dir, stage = excluded.stage,"
+                    " available_at = excluded.available_at, lease_token = NULL, attempts = 0,"
+                    " last_error = NULL, steps = '{}'",
+                    (path, rel_dir, name, _suffix(name), stage, now, now),
+                )
+            changed += 1
+        for ids in vanished.values():
+            for item_id in ids:
+                # Rows still under lease belong to a worker that is moving the
+                # file itself and will ack it.
+                changed += conn.execute(
+                    "DELETE FROM items WHERE id = ? AND NOT (lease_token IS NOT NULL AND available_at > ?)",
+                    (item_id, now),
+                ).rowcount
+        return changed
+
+    # ─── Claim / ack / fail ──────────────────────────────────────────────
+
+    def claim(
+        self,
+        stage: str,
+        limit: int = 1,
+        lease_seconds: float = LEASE_SECONDS,
+        suffixes: tuple[str, ...] | None = None,
+    ) -> list[WorkItem]:
+        """Lease up to ``limit`` items of ``stage`` that are due, oldest first.
+
+        ``suffixes`` (e.g. ``(".md",)``) restricts the claim to those file
+        types; the filter is part of the index lookup, so other files in the
+        stage cost nothing.
+        """
+        now = time.time()
+        token = uuid.uuid4().hex
+        claimed: list[WorkItem] = []
+        dead: list[int] = []
+        suffix_sql, suffix_params = _suffix_filter(suffixes)
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "SELECT id, path, attempts, steps FROM items WHERE stage = ? AND available_at <= ?"
+                + suffix_sql + " ORDER BY available_at, id",
+                (stage, now, *suffix_params),
+            )
+            for item_id, path, attempts, steps in cursor:
+                if attempts >= MAX_ATTEMPTS:
+                    # Its last lease ran out without an ack: the worker died on it.
+                    logger.warning("Work item %s moved to dead letter after %d attempts", path, attempts)
+                    dead.append(item_id)
+                    continue
+                claimed.append(WorkItem(item_id, self.vault / path, stage, attempts + 1, token, json.loads(steps)))
+                if len(claimed) >= limit:
+                    break
+            cursor.close()
+            conn.executemany(
+                "UPDATE items SET stage = ?, lease_token = NULL,"
+                " last_error = COALESCE(last_error, 'lease expired') WHERE id = ?",
+                [(DEAD, item_id) for item_id in dead],
+            )
+            conn.executemany(
+                "UPDATE items SET lease_token = ?, available_at = ?, attempts = attempts + 1 WHERE id = ?",
+                [(token, now + lease_seconds, item.id) for item in claimed],
+            )
+        return claimed
+
+    def ack(self, item: WorkItem, stage: str = DONE, path: Path | None = None) -> bool:
+        """Finish ``item``: move it to ``stage`` (and ``path``). False if the lease was lost."""
+        rel = self._rel(path or item.path)
+        with self._transaction() as conn:
+            if rel != self._rel(item.path):
+                conn.execute("DELETE FROM items WHERE path = ? AND id != ?", (rel, item.id))
+            updated = conn.execute(
+                "UPDATE items SET stage = ?, path = ?, dir = ?, name = ?, suffix = ?, available_at = ?,"
+                " lease_token = NULL, attempts = 0, last_error = NULL WHERE id = ? AND lease_token = ?",
+                (
+                    stage, rel, rel.rpartition("/")[0], rel.rpartition("/")[2], _suffix(rel),
+                    time.time(), item.id, item.token,
+                ),
+            ).rowcount
+        if not updated:
+            logger.warning("Lease on %s was lost before ack", item.name)
+        return bool(updated)
+
+    def fail(self, item: WorkItem, error: str | BaseException) -> str:
+        """Release ``item`` for a retry after backoff, or dead-letter it. Returns the new stage."""
+        message = str(error)[:500]
+        with self._transaction() as conn:
+            if item.attempts >= MAX_ATTEMPTS:
+                stage = DEAD
+                conn.execute(
+                    "UPDATE items SET stage = ?, lease_token = NULL, last_error = ? WHERE id = ? AND lease_token = ?",
+                    (DEAD, message, item.id, item.token),
+                )
+            else:
+                stage = item.stage
+                conn.execute(
+                    "UPDATE items SET available_at = ?, lease_token = NULL, last_error = ?"
+                    " WHERE id = ? AND lease_token = ?",
+                    (time.time() + backoff_seconds(item.attempts), message, item.id, item.token),
+                )
+        return stage
+
+    def record_step(self, item: WorkItem, step: str, result, lease_seconds: float = LEASE_SECONDS) -> None:
+        """Store a finished step's result and extend the lease."""
+        item.steps[step] = result
+        self.conn.execute(
+            "UPDATE items SET steps = ?, available_at = ? WHERE id = ? AND lease_token = ?",
+            (json.dumps(item.steps, default=str), time.time() + lease_seconds, item.id, item.token),
+        )
+
+    def retry(self, rel_path: str) -> bool:
+        """Make a (dead or backed-off) item claimable now with a fresh attempt count."""
+        with self._transaction() as conn:
+            if conn.execute("SELECT 1 FROM items WHERE path = ?", (rel_path,)).fetchone() is None:
+                return False
+            stage = next((s for folder, s in STAGES.items() if rel_path.startswith(folder + "/")), DONE)
+            conn.execute(
+                "UPDATE items SET stage = ?, available_at = ?, lease_token = NULL, attempts = 0 WHERE path = ?",
+                (stage, time.time(), rel_path),
+            )
+        return True
+
+    # ─── Queries ─────────────────────────────────────────────────────────
+
+    def items(self, stage: str, due_only: bool = False) -> list[Path]:
+        query = "SELECT path FROM items WHERE stage = ?"
+        params: tuple = (stage,)
+        if due_only:
+            query += " AND available_at <= ?"
+            params += (time.time(),)
+        return [self.vault / path for (path,) in self.conn.execute(query + " ORDER BY available_at, id", params)]
+
+    def due(self, stage: str, suffixes: tuple[str, ...] | None = None) -> int:
+        suffix_sql, suffix_params = _suffix_filter(suffixes)
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM items WHERE stage = ? AND available_at <= ?" + suffix_sql,
+            (stage, time.time(), *suffix_params),
+        ).fetchone()[0]
+
+    def stats(self) -> dict[str, int]:
+        return dict(self.conn.execute("SELECT stage, COUNT(*) FROM items GROUP BY stage").fetchall())
+
+    def prune(self, days: int = DONE_RETENTION_DAYS) -> int:
+        """Forget ``done`` items finished more than ``days`` ago."""
+        cutoff = time.time() - days * 86400
+        return self.conn.execute(
+            "DELETE FROM items WHERE stage = ? AND available_at < ?", (DONE, cutoff)
+        ).rowcount
+
+
+class _Transaction:
+    """``BEGIN IMMEDIATE`` … ``COMMIT``; takes the write lock up front so
+    concurrent claimers serialize instead of failing to upgrade."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+_queues: dict[Path, WorkQueue] = {}
+_queues_lock = threading.Lock()
+
+
+def work_queue(vault: Path | None = None) -> WorkQueue:
+    """The process-wide queue for ``vault``."""
+    vault = vault or get_vault_path()
+    with _queues_lock:
+        queue = _queues.get(vault)
+        if queue is None:
+            queue = _queues[vault] = WorkQueue(vault)
+        return queue
+
+
+# ─── CLI ─────────────────────────────────────────────────────────────────
+
+def _bench(items: int) -> None:
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = Path(tmp)
+        queue = WorkQueue(vault)
+        now = time.time()
+        with queue._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO items (path, dir, name, suffix, stage, available_at, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        f"Approved/A{i}.md", "Approved", f"A{i}.md", ".md",
+                        "approved" if i % 10 == 0 else DONE, now - i, now,
+                    )
+                    for i in range(items)
+                ),
+            )
+        rounds = 200
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for item in queue.claim("approved"):
+                queue.ack(item)
+        elapsed = time.perf_counter() - start
+        print(f"{items} rows: claim+ack {elapsed / rounds * 1000:.3f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Vault work queue")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Item counts per stage")
+    list_cmd = sub.add_parser("list", help="Items in a stage")
+    list_cmd.add_argument("--stage", default=DEAD)
+    retry_cmd = sub.add_parser("retry", help="Requeue an item (vault-relative path)")
+    retry_cmd.add_argument("path")
+    bench_cmd = sub.add_parser("bench", help="Claim+ack latency on a synthetic queue")
+    bench_cmd.add_argument("--items", type=int, default=100_000)
+    args = parser.parse_args()
+
+    if args.command == "bench":
+        _bench(args.items)
+        return
+    queue = work_queue()
+    queue.sync()
+    if args.command == "stats":
+        for stage, count in sorted(queue.stats().items()):
+            print(f"{stage:18} {count}")
+    elif args.command == "list":
+        rows = queue.conn.execute(
+            "SELECT path, attempts, last_error FROM items WHERE stage = ? ORDER BY available_at", (args.stage,)
+        )
+        for path, attempts, error in rows:
+            print(f"{path}\tattempts={attempts}\t{error or ''}")
+    elif args.command == "retry":
+        print("requeued" if queue.retry(args.path) else "not found")
+
+
+if __name__ == "__main__":
+    main()